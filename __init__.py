@@ -68,9 +68,13 @@ if 'bpy' in locals():
 
 import bpy
 from bpy.props import PointerProperty, IntVectorProperty
+from time import time
 from . properties import MeshSceneProperties, MeshObjectProperties
-from . handlers import stashes_HUD, stashes_VIEW3D, update_stashes, update_msgbus
+from . handlers import stashes_HUD, stashes_VIEW3D, update_stashes, update_msgbus, save_stashes, update_stash_index, update_snap_cache, clear_snap_cache, clear_stash_draw_cache
 from . utils.registration import get_core, get_menus, get_tools, get_prefs, register_classes, unregister_classes, register_keymaps, unregister_keymaps
+from . utils.thumbnail import cancel_thumbnail_renders
+from . utils.snap import invalidate_snap_cache
+from . utils.draw import clear_stash_batches
 from . utils.registration import register_plugs, unregister_plugs, register_lockedlib, unregister_lockedlib, register_icons, unregister_icons
 from . utils.registration import register_msgbus, unregister_msgbus
 from . ui.menus import context_menu
@@ -107,7 +111,9 @@ def register():
 
     bpy.types.WindowManager.plug_mousepos = IntVectorProperty(name="Mouse Position for Plug Insertion", size=2)
 
+    start = time()
     plugs = register_plugs()
+    plugtime = time() - start
     register_lockedlib()
 
     menu_classlists, menu_keylists = get_menus()
@@ -126,12 +132,24 @@ def register():
 
     bpy.app.handlers.load_post.append(update_msgbus)
     bpy.app.handlers.load_post.append(update_stashes)
+    bpy.app.handlers.save_pre.append(save_stashes)
+    bpy.app.handlers.undo_post.append(update_stash_index)
+    bpy.app.handlers.redo_post.append(update_stash_index)
+
+    bpy.app.handlers.load_post.append(clear_snap_cache)
+    bpy.app.handlers.undo_post.append(clear_snap_cache)
+    bpy.app.handlers.redo_post.append(clear_snap_cache)
+    bpy.app.handlers.depsgraph_update_post.append(update_snap_cache)
+
+    bpy.app.handlers.load_post.append(clear_stash_draw_cache)
+    bpy.app.handlers.undo_post.append(clear_stash_draw_cache)
+    bpy.app.handlers.redo_post.append(clear_stash_draw_cache)
 
     bpy.app.handlers.depsgraph_update_post.append(stashes_HUD)
     bpy.app.handlers.depsgraph_update_post.append(stashes_VIEW3D)
 
     if get_prefs().registration_debug:
-        print(f"Registered {bl_info['name']} {'.'.join([str(i) for i in bl_info['version']])} with {len(plugs)} plug libraries")
+        print(f"Registered {bl_info['name']} {'.'.join([str(i) for i in bl_info['version']])} with {len(plugs)} plug libraries in {plugtime:.3f}s")
 
         for lib in plugs:
             print(" • plug library: %s" % (lib))
@@ -145,6 +163,21 @@ def unregister():
 
     bpy.app.handlers.load_post.remove(update_msgbus)
     bpy.app.handlers.load_post.remove(update_stashes)
+    bpy.app.handlers.save_pre.remove(save_stashes)
+    bpy.app.handlers.undo_post.remove(update_stash_index)
+    bpy.app.handlers.redo_post.remove(update_stash_index)
+
+    bpy.app.handlers.load_post.remove(clear_snap_cache)
+    bpy.app.handlers.undo_post.remove(clear_snap_cache)
+    bpy.app.handlers.redo_post.remove(clear_snap_cache)
+    bpy.app.handlers.depsgraph_update_post.remove(update_snap_cache)
+
+    bpy.app.handlers.load_post.remove(clear_stash_draw_cache)
+    bpy.app.handlers.undo_post.remove(clear_stash_draw_cache)
+    bpy.app.handlers.redo_post.remove(clear_stash_draw_cache)
+
+    invalidate_snap_cache()
+    clear_stash_batches()
 
     from . handlers import stashesHUD, stashesVIEW3D
 
@@ -160,6 +193,7 @@ def unregister():
 
     unregister_msgbus(owner)
 
+    cancel_thumbnail_renders()
     unregister_plugs()
     unregister_lockedlib()
 
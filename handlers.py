@@ -2,21 +2,67 @@ import bpy
 from bpy.app.handlers import persistent
 from mathutils import Matrix
 from uuid import uuid4
-from . utils.draw import draw_stashes_HUD, draw_stashes_VIEW3D
+from time import perf_counter
+from . utils.draw import draw_stashes_HUD, draw_stashes_VIEW3D, get_stash_batch, clear_stash_batches
 from . utils.math import flatten_matrix
-from . utils.mesh import get_coords
-from . utils.stash import get_version_as_tuple
-from . utils.registration import reload_msgbus
+from . utils.stash import get_version_as_tuple, archive_stashes, rehydrate_stashes, get_stash_index, invalidate_stash_index
+from . utils.registration import reload_msgbus, get_prefs
+from . utils.snap import snap_cache, invalidate_snap_cache
 from . import bl_info
 
+handler_timings = {}
+
+def record_handler_time(name, start):
+    timing = handler_timings.setdefault(name, {'count': 0, 'total': 0, 'max': 0})
+    elapsed = perf_counter() - start
+
+    timing['count'] += 1
+    timing['total'] += elapsed
+    timing['max'] = max(timing['max'], elapsed)
+
+@persistent
+def update_stash_index(none):
+    invalidate_stash_index()
+
+@persistent
+def update_snap_cache(scene, depsgraph):
+    if snap_cache:
+        start = perf_counter()
+
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+                invalidate_snap_cache(update.id.name)
+
+        record_handler_time('update_snap_cache', start)
+
+@persistent
+def clear_snap_cache(none):
+    invalidate_snap_cache()
+
+@persistent
+def clear_stash_draw_cache(none):
+    global oldstashuuid
+
+    clear_stash_batches()
+    oldstashuuid = None
+
 @persistent
 def update_msgbus(none):
     reload_msgbus()
 
+@persistent
+def save_stashes(filepath):
+    if get_prefs().stash_archive:
+        archive_stashes(filepath)
+
+    else:
+        rehydrate_stashes()
+
 @persistent
 def update_stashes(none):
+    invalidate_stash_index()
+
     scene = bpy.context.scene
-    objects = [obj for obj in bpy.data.objects if obj.MM.stashes]
     version = '.'.join([str(v) for v in bl_info['version']])
 
     revision = bl_info.get("revision")
@@ -24,7 +70,7 @@ def update_stashes(none):
     if revision and not scene.MM.revision:
         scene.MM.revision = revision
 
-    for obj in objects:
+    for obj in bpy.data.objects:
         updatable = [stash for stash in obj.MM.stashes if get_version_as_tuple(stash.version) < (0, 7)]
 
         if updatable:
@@ -48,6 +94,8 @@ def update_stashes(none):
                     stash.obj.MM.stashmx.identity()
                     stash.obj.MM.stashtargetmx.identity()
 
+        get_stash_index(obj)
+
 stashesHUD = None
 oldactive = None
 oldstasheslen = 0
@@ -57,14 +105,17 @@ oldinvalidstasheslen = 0
 def stashes_HUD(none):
     global stashesHUD, oldactive, oldstasheslen, oldinvalidstasheslen
 
+    start = perf_counter()
+
     if stashesHUD and "RNA_HANDLE_REMOVED" in str(stashesHUD):
         stashesHUD = None
 
     active = getattr(bpy.context, 'active_object', None)
 
     if active:
-        stasheslen = len(active.MM.stashes)
-        invalidstasheslen = len([stash for stash in active.MM.stashes if not stash.obj])
+        index = get_stash_index(active)
+        stasheslen = index['count']
+        invalidstasheslen = index['invalid']
 
         if not stashesHUD:
             oldactive = active
@@ -85,6 +136,8 @@ def stashes_HUD(none):
         bpy.types.SpaceView3D.draw_handler_remove(stashesHUD, 'WINDOW')
         stashesHUD = None
 
+    record_handler_time('stashes_HUD', start)
+
 stashesVIEW3D = None
 oldstashuuid = None
 
@@ -92,28 +145,28 @@ oldstashuuid = None
 def stashes_VIEW3D(scene):
     global stashesVIEW3D, oldstashuuid
 
+    start = perf_counter()
+
     if stashesVIEW3D and "RNA_HANDLE_REMOVED" in str(stashesVIEW3D):
         stashesVIEW3D = None
 
-    C = bpy.context
-
-    active = C.active_object if getattr(C, 'active_object', None) and C.active_object.MM.stashes else None
-    stash = active.MM.stashes[active.MM.active_stash_idx] if active and active.MM.stashes[active.MM.active_stash_idx].obj else None
+    active = getattr(bpy.context, 'active_object', None) if scene.MM.draw_active_stash else None
+    uuid = get_stash_index(active)['active'] if active else None
 
-    if scene.MM.draw_active_stash and stash:
-        if not stashesVIEW3D:
-            oldstashuuid = stash.uuid
+    if uuid:
+        if oldstashuuid != uuid or not stashesVIEW3D:
+            oldstashuuid = uuid
 
-            batch = get_coords(stash.obj.data, mx=active.matrix_world, offset=0.002, indices=True)
-            stashesVIEW3D = bpy.types.SpaceView3D.draw_handler_add(draw_stashes_VIEW3D, (scene, batch, ), 'WINDOW', 'POST_VIEW')
+            stash = active.MM.stashes[active.MM.active_stash_idx]
+            batch = get_stash_batch(stash, offset=0.002)
 
-        if oldstashuuid != stash.uuid:
-            oldstashuuid = stash.uuid
+            if stashesVIEW3D:
+                bpy.types.SpaceView3D.draw_handler_remove(stashesVIEW3D, 'WINDOW')
 
-            batch = get_coords(stash.obj.data, mx=active.matrix_world, offset=0.002, indices=True)
-            bpy.types.SpaceView3D.draw_handler_remove(stashesVIEW3D, 'WINDOW')
-            stashesVIEW3D = bpy.types.SpaceView3D.draw_handler_add(draw_stashes_VIEW3D, (scene, batch, ), 'WINDOW', 'POST_VIEW')
+            stashesVIEW3D = bpy.types.SpaceView3D.draw_handler_add(draw_stashes_VIEW3D, (scene, batch, active.matrix_world.copy()), 'WINDOW', 'POST_VIEW')
 
     elif stashesVIEW3D:
         bpy.types.SpaceView3D.draw_handler_remove(stashesVIEW3D, 'WINDOW')
         stashesVIEW3D = None
+
+    record_handler_time('stashes_VIEW3D', start)
@@ -89,6 +89,9 @@ axis_mapping_dict = {"X": Vector((1, 0, 0)),
 fillet_or_edge_items = [("FILLET", "Fillet", ""),
                         ("EDGE", "Edge", "")]
 
+plug_engine_items = [("OPS", "Operators", ""),
+                     ("BMESH", "BMesh", "")]
+
 add_plug_to_library_mode_items = [("NEW", "New", ""),
                                   ("REPLACE", "Replace", "")]
 
@@ -3,10 +3,10 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 from math import radians
 from uuid import uuid4
 from .. utils.object import parent
-from .. utils.mesh import get_coords, unhide_deselect, smooth
+from .. utils.mesh import unhide_deselect, smooth
 from .. utils.modifier import add_boolean, add_displace
 from .. utils.ui import draw_title, draw_prop, draw_init, draw_text, init_cursor, init_status, finish_status, update_HUD_location, init_timer_modal, set_countdown, get_timer_progress
-from .. utils.draw import draw_mesh_wire
+from .. utils.draw import draw_mesh_wire, get_wire_batch
 from .. utils.property import step_enum
 from .. items import boolean_method_items, boolean_solver_items
 from .. colors import yellow, blue, red, normal, green
@@ -79,9 +79,9 @@ class Boolean(bpy.types.Operator):
 
             color = red if self.method == 'DIFFERENCE' else blue if self.method == 'UNION' else normal if self.method == 'INTERSECT' else green
 
-            for batch in self.batches:
+            for batch, mx in self.batches:
                 if not self.passthrough:
-                    draw_mesh_wire(batch, color=color, alpha=alpha)
+                    draw_mesh_wire(batch, mx=mx, color=color, alpha=alpha)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -292,8 +292,7 @@ class Boolean(bpy.types.Operator):
                 obj.data.use_auto_smooth = True
                 smooth(obj.data, smooth=True)
 
-            coords, indices = get_coords(obj.data, mx=obj.matrix_world, indices=True)
-            self.batches.append((coords, indices))
+            self.batches.append((get_wire_batch(obj.data), obj.matrix_world.copy()))
 
         if self.auto_smooth:
             self.active.data.use_auto_smooth = True
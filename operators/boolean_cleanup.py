@@ -4,16 +4,17 @@ from bpy.props import BoolProperty, EnumProperty, FloatProperty
 from .. items import side_selection_items
 from .. colors import red, green
 from .. utils.selection import get_sides
-from .. utils.graph import build_edge_graph
-from .. utils.math import get_distance_between_verts, average_locations
+from .. utils.graph import build_collapse_sequence, get_collapsed_verts
+from .. utils.math import average_locations
 from .. utils.developer import output_traceback
+from .. utils.bmesh import get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, popup_message, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.registration import get_prefs
 from .. utils.property import step_enum
 from .. utils.draw import draw_points
 
-class BooleanCleanup(bpy.types.Operator):
+class BooleanCleanup(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.boolean_cleanup"
     bl_label = "MACHIN3: Boolean Cleanup"
     bl_description = "Merge verts on cyclic selections resulting from Boolean operations"
@@ -84,7 +85,7 @@ class BooleanCleanup(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'T', 'F']
+        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'T', 'F', 'TIMER']
 
         if self.allowmodalthreashold:
             events.append('MOUSEMOVE')
@@ -124,7 +125,7 @@ class BooleanCleanup(bpy.types.Operator):
                 self.sideselection = step_enum(self.sideselection, side_selection_items, -1)
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if ret is False:
                     self.finish()
@@ -133,6 +134,9 @@ class BooleanCleanup(bpy.types.Operator):
             except Exception as e:
                 self.finish()
 
+                self.snapshot.restore()
+                update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
                 output_traceback(self, e)
                 return {'FINISHED'}
 
@@ -141,15 +145,16 @@ class BooleanCleanup(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in ['LEFTMOUSE', 'SPACE']:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             self.finish()
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(self.active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
             return {'CANCELLED'}
 
         self.last_mouse_x = event.mouse_x
@@ -162,20 +167,20 @@ class BooleanCleanup(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.threshold = 0
         self.sharp = False
         self.flip = False
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.sequences = {}
+
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -185,37 +190,40 @@ class BooleanCleanup(bpy.types.Operator):
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
         self.VIEW3D = bpy.types.SpaceView3D.draw_handler_add(self.draw_VIEW3D, (context, ), 'WINDOW', 'POST_VIEW')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = False
 
-        mesh = active.data
-
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         verts = [v for v in bm.verts if v.select]
         edges = [e for e in bm.edges if e.select]
 
+        # the edit mesh may carry over tags from other tools, fixed verts are tagged below
+        for v in verts:
+            v.tag = False
+
         if any([not e.smooth for e in edges]):
             self.sharp = True
 
@@ -233,9 +241,18 @@ class BooleanCleanup(bpy.types.Operator):
                     v = el['vert']
                     v.tag = not v.tag
 
-            mg = build_edge_graph(verts, edges, debug=debug)
+            key = (self.sideselection, self.flip)
+
+            if modal and key in self.sequences:
+                sequence = self.get_sequence(key)
+
+            else:
+                sequence = build_collapse_sequence(verts, edges, debug=debug)
+
+                if modal:
+                    self.store_sequence(key, sequence)
 
-            self.fixed_verts, self.unmoved_verts = self.move_merts(bm, mg, cyclic, debug=debug)
+            self.fixed_verts, self.unmoved_verts = self.move_merts(bm, verts, sequence, debug=debug)
 
             if self.triangulate:
                 self.triangulate_side(bm, sideA, sideB)
@@ -247,17 +264,23 @@ class BooleanCleanup(bpy.types.Operator):
                     if e.select:
                         e.smooth = False
 
-            bm.to_mesh(mesh)
-            bpy.ops.object.mode_set(mode='EDIT')
+            update_edit_bmesh(active.data)
 
             return True
 
         else:
             popup_message(err[0], title=err[1])
-            bpy.ops.object.mode_set(mode='EDIT')
 
             return False
 
+    def store_sequence(self, key, sequence):
+        positions = {v.index: idx for idx, v in enumerate(self.snapshot.verts)}
+        self.sequences[key] = [(reach, positions[vidx], positions[cidx]) for reach, vidx, cidx in sequence]
+
+    def get_sequence(self, key):
+        verts = self.snapshot.verts
+        return [(reach, verts[vpos].index, verts[cpos].index) for reach, vpos, cpos in self.sequences[key]]
+
     def triangulate_side(self, bm, sideA, sideB):
         faces = []
         if self.sideselection == "A":
@@ -273,83 +296,17 @@ class BooleanCleanup(bpy.types.Operator):
 
         bmesh.ops.triangulate(bm, faces=faces)
 
-    def move_merts(self, bm, mg, cyclic, debug=False):
-        fixed_vert_coords = []
-        unmoved_vert_coords = []
+    def move_merts(self, bm, verts, sequence, debug=False):
+        collapsed = get_collapsed_verts(sequence, self.threshold)
 
-        if debug:
-            print("cylclic selection:", cyclic)
-
-        for eidx, vidx in enumerate(mg):
-            if debug:
-                print("vert:", vidx)
+        for vidx, rootidx in collapsed.items():
+            bm.verts[vidx].co = bm.verts[rootidx].co
 
-            fixed = mg[vidx]["fixed"]
             if debug:
-                print(" • fixed:", fixed)
+                print(" • moved vert %d to vert %d" % (vidx, rootidx))
 
-            if fixed:
-                fixed_vert_coords.append(bm.verts[vidx].co.copy())
-                continue
-
-            else:
-                A = mg[vidx]["connected"][0]
-                B = mg[vidx]["connected"][1]
-
-                Aidx, Afixed, Adist = A
-                Bidx, Bfixed, Bdist = B
-
-                lsort = [A, B]
-                lsort = sorted(lsort, key=lambda l: l[2])
-                closest = lsort[0]
-                furthest = lsort[1]
-
-                if closest[2] <= self.threshold:
-                    closestidx = closest[0]
-                    closestdist = closest[2]
-
-                    furthestidx = furthest[0]
-
-                    bm.verts[vidx].co = bm.verts[closestidx].co
-                    if debug:
-                        print(" • moved to vert %d - distance: %f" % (closestidx, closestdist))
-
-                    for childidx in mg[vidx]["children"]:
-                        bm.verts[childidx].co = bm.verts[closestidx].co
-                        if debug:
-                            print("  • moved the child vert %d as well" % (childidx))
-
-                    mg[closestidx]["children"].append(vidx)
-                    if debug:
-                        print(" • updated %d's mg 'children' entry with vert %d" % (closestidx, vidx))
-
-                    for childidx in mg[vidx]["children"]:
-                        mg[closestidx]["children"].append(childidx)
-
-                        if debug:
-                            print("  • updated %d's mg 'children' entry with vert %d" % (closestidx, childidx))
-
-                    closest_conected = mg[closestidx]["connected"]
-                    furthest_connected = mg[furthestidx]["connected"]
-
-                    newdist = get_distance_between_verts(bm.verts[closestidx], bm.verts[furthestidx])
-
-                    for i, con in enumerate(closest_conected):
-                        if con[0] == vidx:
-                            mg[closestidx]["connected"][i] = (furthestidx, furthest[1], newdist)
-
-                    if debug:
-                        print(" • updated %d's mg 'connected' entry with vert %d replacing vert %d" % (closestidx, furthestidx, vidx))
-
-                    for i, con in enumerate(furthest_connected):
-                        if con[0] == vidx:
-                            mg[furthestidx]["connected"][i] = (closestidx, closest[1], newdist)
-
-                    if debug:
-                        print(" • updated %d's mg 'connected' entry with vert %d replacing vert %d" % (furthestidx, closestidx, vidx))
-
-                else:
-                    unmoved_vert_coords.append(bm.verts[vidx].co.copy())
+        fixed_vert_coords = [v.co.copy() for v in verts if v.tag]
+        unmoved_vert_coords = [v.co.copy() for v in verts if not v.tag and v.index not in collapsed]
 
         return fixed_vert_coords, unmoved_vert_coords
 
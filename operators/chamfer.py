@@ -4,14 +4,15 @@ import bmesh
 import mathutils
 from .. utils.selection import get_sides
 from .. utils.math import average_normals, average_locations
+from .. utils.bmesh import get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, popup_message, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.draw import draw_lines, draw_line, draw_points
 from .. utils.property import step_enum
 from .. utils.developer import output_traceback
 from .. items import outer_face_method_items, side_selection_items
 
-class Chamfer(bpy.types.Operator):
+class Chamfer(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.chamfer"
     bl_label = "MACHIN3: Chamfer"
     bl_description = "Chamfer cyclic selections resulting from Boolean Operations"
@@ -130,7 +131,7 @@ class Chamfer(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'S', 'Q', 'M', 'V']
+        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'S', 'Q', 'M', 'V', 'TIMER']
 
         if self.allowmodalwidth:
             events.append('MOUSEMOVE')
@@ -201,7 +202,7 @@ class Chamfer(bpy.types.Operator):
                 self.allowmodalwidth = not self.allowmodalwidth
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.active.vertex_groups.remove(self.vgroupA)
@@ -211,6 +212,9 @@ class Chamfer(bpy.types.Operator):
                     return {'FINISHED'}
 
             except Exception as e:
+                self.snapshot.restore()
+                update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
                 self.active.vertex_groups.remove(self.vgroupA)
                 self.active.vertex_groups.remove(self.vgroupB)
 
@@ -224,6 +228,8 @@ class Chamfer(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in ['LEFTMOUSE', 'SPACE']:
+            self.flush_main(self.active)
+
             self.finish()
 
             if not self.create_vgroup:
@@ -235,9 +241,8 @@ class Chamfer(bpy.types.Operator):
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             self.finish()
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(self.active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
             self.active.vertex_groups.remove(self.vgroupA)
             self.active.vertex_groups.remove(self.vgroupB)
@@ -253,6 +258,7 @@ class Chamfer(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def invoke(self, context, event):
         self.active = context.active_object
@@ -260,8 +266,6 @@ class Chamfer(bpy.types.Operator):
         self.vgroupA = self.active.vertex_groups.new(name="chamfer")
         self.vgroupB = self.active.vertex_groups.new(name="chamfer")
 
-        self.active.update_from_editmode()
-
         self.allowmodalwidth = True
         self.width = 0
         self.loop_slide_sideA = False
@@ -273,10 +277,9 @@ class Chamfer(bpy.types.Operator):
         self.reachA = 0
         self.reachB = 0
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -286,6 +289,8 @@ class Chamfer(bpy.types.Operator):
         self.VIEW3D = bpy.types.SpaceView3D.draw_handler_add(self.draw_VIEW3D, (context, ), 'WINDOW', 'POST_VIEW')
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
@@ -306,27 +311,28 @@ class Chamfer(bpy.types.Operator):
                 active.vertex_groups.remove(self.vgroupB)
                 self.vgroupB = None
 
+        self.snapshot = RegionSnapshot(active.data)
+        self.snapshot.extend(max(self.reachA, self.reachB))
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = False
 
-        mesh = active.data
-
-        bpy.ops.object.mode_set(mode='OBJECT')
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+            self.snapshot.extend(max(self.reachA, self.reachB))
 
         groups = bm.verts.layers.deform.verify()
         verts = [v for v in bm.verts if v.select]
@@ -379,14 +385,12 @@ class Chamfer(bpy.types.Operator):
 
                 self.assign_vgroup(groups, chamfer_faces, self.vgroupB, railB, railB_verts, railB_faces)
 
-            bm.to_mesh(mesh)
-            bpy.ops.object.mode_set(mode='EDIT')
+            update_edit_bmesh(active.data)
 
             return True
 
         else:
             popup_message(err[0], title=err[1])
-            bpy.ops.object.mode_set(mode='EDIT')
 
             return False
 
@@ -3,18 +3,18 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty
 import bmesh
 from mathutils import Vector, Matrix
 from ..utils.graph import build_mesh_graph
-from ..utils.bmesh import ensure_custom_data_layers
+from ..utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from ..utils.selection import get_2_rails_from_chamfer
 from ..utils.sweep import init_sweeps, debug_sweeps
 from ..utils.loop import get_loops
 from ..utils.tool import change_width
 from ..utils.ui import popup_message, draw_title, draw_prop, draw_init, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
-from ..utils.ui import init_status, finish_status
+from ..utils.ui import init_status, finish_status, ScheduledModal
 from ..utils.math import get_distance_between_verts, average_locations
 from ..utils.developer import output_traceback
 from ..utils.draw import draw_lines, debug_draw_sweeps
 
-class ChangeWidth(bpy.types.Operator):
+class ChangeWidth(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.change_width"
     bl_label = "MACHIN3: Change Width"
     bl_description = "Change the width of Chamfers(flat Bevels)"
@@ -76,7 +76,7 @@ class ChangeWidth(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        if event.type in ['MOUSEMOVE', 'R', 'T', 'F']:
+        if event.type in ['MOUSEMOVE', 'R', 'T', 'F', 'TIMER']:
 
             if event.type == 'MOUSEMOVE':
                 if self.passthrough:
@@ -102,7 +102,7 @@ class ChangeWidth(bpy.types.Operator):
                     self.taperflip = not self.taperflip
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if ret is False:
                     self.finish()
@@ -110,8 +110,8 @@ class ChangeWidth(bpy.types.Operator):
             except Exception as e:
                 self.finish()
 
-                if context.mode == 'OBJECT':
-                    bpy.ops.object.mode_set(mode='EDIT')
+                self.snapshot.restore()
+                update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
                 output_traceback(self, e)
                 return {'FINISHED'}
@@ -121,15 +121,16 @@ class ChangeWidth(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in ['LEFTMOUSE', 'SPACE']:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             self.finish()
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(self.active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
             return {'CANCELLED'}
 
@@ -143,20 +144,18 @@ class ChangeWidth(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.DEBUG, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.width = 0
         self.reverse = False
         self.loops = []
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -166,37 +165,37 @@ class ChangeWidth(bpy.types.Operator):
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
         self.DEBUG = bpy.types.SpaceView3D.draw_handler_add(self.draw_DEBUG, (context, ), 'WINDOW', 'POST_VIEW')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         bw = ensure_custom_data_layers(bm)[1]
 
-        mg = build_mesh_graph(bm, debug=debug)
+        mg = build_mesh_graph(bm, selected=True, debug=debug)
         verts = [v for v in bm.verts if v.select]
         faces = [f for f in bm.faces if f.select]
 
@@ -229,11 +228,12 @@ class ChangeWidth(bpy.types.Operator):
             changed_width = change_width(bm, sweeps, self.width, taper=self.taper, debug=debug)
 
             if changed_width:
-                bm.to_mesh(active.data)
+                update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
             else:
-                popup_message("Something went wrong, likely not a valid chamfer selection.", title="Chamfer Width")
+                self.snapshot.restore()
+                update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
 
-        bpy.ops.object.mode_set(mode='EDIT')
+                popup_message("Something went wrong, likely not a valid chamfer selection.", title="Chamfer Width")
 
         if ret:
             if changed_width:
@@ -6,8 +6,8 @@ from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_pr
 from .. utils.ui import init_status, finish_status
 from .. utils.property import step_collection, step_enum
 from .. utils.selection import get_selected_ids
-from .. utils.mesh import get_coords
-from .. utils.draw import draw_mesh_wire
+from .. utils.draw import draw_mesh_wire, get_stash_batch
+from .. utils.stash import rehydrate_stash
 from .. utils.modifier import apply_mod
 from .. utils.vgroup import set_vgroup, get_vgroup
 from .. colors import red, white
@@ -62,7 +62,7 @@ class Conform(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.area == self.area:
             if self.batch:
-                draw_mesh_wire(self.batch, color=white, alpha=self.alpha, xray=self.xray)
+                draw_mesh_wire(self.batch, mx=self.active.matrix_world, color=white, alpha=self.alpha, xray=self.xray)
 
     @classmethod
     def poll(cls, context):
@@ -108,8 +108,9 @@ class Conform(bpy.types.Operator):
                     if self.stash.obj.matrix_world != self.active.matrix_world:
                         self.stash.obj.matrix_world = self.active.matrix_world
 
+                    rehydrate_stash(self.stash.obj)
                     offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-                    self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+                    self.batch = get_stash_batch(self.stash, offset=offset)
 
                     self.shrink_wrap.target = self.stash.obj
 
@@ -131,8 +132,9 @@ class Conform(bpy.types.Operator):
                     if self.stash.obj.matrix_world != self.active.matrix_world:
                         self.stash.obj.matrix_world = self.active.matrix_world
 
+                    rehydrate_stash(self.stash.obj)
                     offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-                    self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+                    self.batch = get_stash_batch(self.stash, offset=offset)
 
                     self.shrink_wrap.target = self.stash.obj
 
@@ -216,8 +218,9 @@ class Conform(bpy.types.Operator):
         self.stash = self.active.MM.stashes[self.active.MM.active_stash_idx]
 
         if self.stash.obj:
+            rehydrate_stash(self.stash.obj)
             offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-            self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+            self.batch = get_stash_batch(self.stash, offset=offset)
 
         else:
             self.batch = None
@@ -244,6 +247,8 @@ class Conform(bpy.types.Operator):
         stash = active.MM.stashes[active.MM.active_stash_idx]
         stashobj = stash.obj
 
+        rehydrate_stash(stashobj)
+
         if stashobj.matrix_world != active.matrix_world:
             stashobj.matrix_world = active.matrix_world
 
@@ -3,10 +3,11 @@ from bpy.props import BoolProperty, IntProperty, EnumProperty, StringProperty
 import bmesh
 from mathutils import Matrix
 import os
+import shutil
 from .. utils.bmesh import ensure_custom_data_layers
 from .. utils.object import parent
 from .. utils.registration import set_new_plug_index, reload_plug_libraries, get_prefs, get_path
-from .. utils.append import append_scene
+from .. utils.thumbnail import queue_thumbnail_render
 from .. items import add_plug_to_library_mode_items, plug_prop_items
 from uuid import uuid4
 
@@ -224,7 +225,6 @@ class AddPlugToLibrary(bpy.types.Operator):
         assetspath = get_prefs().assetspath
         library = context.scene.userpluglibs
         index = context.window_manager.newplugidx
-        plugiconrenderblendpath = os.path.join(get_path(), "resources", "Templates.blend")
 
         if self.addmode == "NEW":
             if self.plugname:
@@ -248,16 +248,17 @@ class AddPlugToLibrary(bpy.types.Operator):
         plugobjs, fillet, deformer, occluder, mods = self.get_plug_objs(handle, debug=debug)
         mx = handle.matrix_world.copy()
 
-        scene = self.render_thumbnail(context, plugobjs, plugiconrenderblendpath, iconpath, fillet, deformer, mods)
-        if not scene:
-            return {'FINISHED'}
-
-        self.save_blend(context, scene, plugobjs, plugname, blendpath)
+        self.save_blend(context, plugobjs, plugname, blendpath)
 
         handle.matrix_world = mx
-        bpy.ops.view3d.view_selected(use_all_regions=False)
+
+        # libraries list plugs by their icons, a placeholder makes a new plug show up right away, and stay, if its thumbnail fails to render
+        if not os.path.exists(iconpath):
+            shutil.copy(os.path.join(get_path(), "icons", "refresh.png"), iconpath)
 
         reload_plug_libraries(library=library, default=plugname)
+
+        queue_thumbnail_render(library, plugname, blendpath, iconpath, indicators=self.get_indicators())
         return {'FINISHED'}
 
     def get_plug_objs(self, handle, debug=False):
@@ -304,175 +305,27 @@ class AddPlugToLibrary(bpy.types.Operator):
             print("mods:", mods)
 
         return plugobjects, fillet, deformer, occluder, mods
-    def render_thumbnail(self, context, plugobjs, iconrenderblendpath, iconpath, fillet, deformer, mods):
-        scene = append_scene(iconrenderblendpath, "Thumbnail")
-        context.window.scene = scene
-
-        for obj in bpy.data.objects:
-            if "demo" in obj.name:
-                bpy.data.objects.remove(obj, do_unlink=True)
-
-        made_local = False
-
-        for col in scene.collection.children:
-            if col.library:
-                col.make_local()
-
-                print(f"WARNING: Making linked collection '{col.name}' local!")
-
-                made_local = True
-
-            for obj in col.objects:
-                if obj.library:
-                    obj.make_local()
-
-                    print(f"WARNING: Making linked object '{obj.name}' local!")
-
-                    made_local = True
-
-                    if obj.data and obj.data.library:
-                        obj.data.make_local()
-
-                        print(f"WARNING: Making linked data '{obj.data.name}' local!")
-
-            for matname in ['base', 'HUD.black.transparent', 'HUD.blue', 'HUD.red', 'HUD.white', 'HUD.white.transparent']:
-                mat = bpy.data.materials.get(matname)
-
-                if mat.library:
-                    mat.make_local()
-
-                    made_local = True
-
-                    print(f"WARNING: Making linked material '{mat.name}' local!")
-
-        plugcol = bpy.data.collections.get('Plug')
-
-        for obj in plugobjs:
-            plugcol.objects.link(obj)
-
-        handle = plugobjs[0]
-        handle.matrix_world = Matrix()
-
-        dg = context.evaluated_depsgraph_get()
-
-        maxscale = 1.8
-        handlemaxdim = max(handle.dimensions)
-
-        handle.matrix_world = Matrix.Scale(maxscale / handlemaxdim, 4) @ handle.matrix_world
-        dg.update()
-
-        HUDlayer = scene.view_layers.get('HUD')
-        bglayer = scene.view_layers.get('bg')
-        Pluglayer = scene.view_layers.get('Plug')
-
-        basemat = bpy.data.materials.get('base')
-
-        if not basemat:
-            print("WARNING: No basemat found!")
-
-        if not Pluglayer.material_override:
-            print(f"WARNING: Material Override is not set in view layer '{Pluglayer.name}'")
-            Pluglayer.material_override = basemat
-
-        if not bglayer.material_override:
-            print(f"WARNING: Material Override is not set in view layer '{bglayer.name}'")
-            bglayer.material_override = basemat
-
-        context.window.view_layer = HUDlayer
+    def get_indicators(self):
+        indicators = []
 
         if self.showindicatorHUD:
+            indicators.append('HUD')
+
             if self.showindicatorFILLETorEDGE:
-                hudfillet = bpy.data.objects.get("HUD_FILLET")
-                hudedge = bpy.data.objects.get("HUD_EDGE")
-                if hudfillet and hudedge:
-                    if fillet:
-                        hudfillet.hide_render = False
-                        hudfillet.hide_set(False)
-                        hudedge.hide_render = True
-                        hudedge.hide_set(True)
-                    else:
-                        hudfillet.hide_render = True
-                        hudfillet.hide_set(True)
-                        hudedge.hide_render = False
-                        hudedge.hide_set(False)
+                indicators.append('FILLETorEDGE')
 
             if self.showindicatorHOOKorARRAY:
-                hudarray = bpy.data.objects.get("HUD_ARRAY")
-                hudhook = bpy.data.objects.get("HUD_HOOK")
-                if hudarray and hudhook:
-                    if mods == "ARRAY":
-                        hudarray.hide_render = False
-                        hudarray.hide_set(False)
-                        hudhook.hide_render = True
-                        hudhook.hide_set(True)
-                    elif mods == "HOOK":
-                        hudarray.hide_render = True
-                        hudarray.hide_set(True)
-                        hudhook.hide_render = False
-                        hudhook.hide_set(False)
+                indicators.append('HOOKorARRAY')
 
             if self.showindicatorDEFORMER:
-                huddeformer = bpy.data.objects.get("HUD_DEFORMER")
-                if huddeformer:
-                    if deformer:
-                        huddeformer.hide_render = False
-                        huddeformer.hide_set(False)
-                        if deformer.MM.usedeformer:
-                            mat = bpy.data.materials.get("HUD.white.transparent")
-                            if mat:
-                                huddeformer.material_slots[0].material = mat
-        scene.render.filepath = iconpath
-
-        scene.render.image_settings.file_format = 'PNG'
-
-        context.window.view_layer = Pluglayer
-        handle.select_set(True)
-        bpy.ops.view3d.view_selected(use_all_regions=False)
-
-        bpy.ops.render.render(write_still=True)
+                indicators.append('DEFORMER')
 
-        print(" • Saved plug icon to '%s'" % (iconpath))
+        return indicators
 
-        for obj in scene.objects:
-            if obj not in plugobjs:
-                if obj.type == "CAMERA":
-                    bpy.data.cameras.remove(obj.data, do_unlink=True)
+    def save_blend(self, context, plugobjs, plugname, blendpath):
+        scene = bpy.data.scenes.new(name='Plug Asset')
+        view_layer = scene.view_layers[0]
 
-                elif obj.type == "LIGHT":
-                    bpy.data.lights.remove(obj.data, do_unlink=True)
-
-                else:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-
-        img = bpy.data.images.get('Render Result')
-        if img:
-            bpy.data.images.remove(img, do_unlink=True)
-
-        for name in ['base', 'HUD.black.transparent', 'HUD.blue', 'HUD.red', 'HUD.white', 'HUD.white.transparent']:
-            mat = bpy.data.materials.get(name)
-            if mat:
-                bpy.data.materials.remove(mat, do_unlink=True)
-
-        for name in ['comp.blur', 'comp.combine', 'comp.passes']:
-            group = bpy.data.node_groups.get(name)
-            if group:
-                bpy.data.node_groups.remove(group)
-
-        world = bpy.data.worlds.get('ThumbnailWorld')
-        if world:
-            bpy.data.worlds.remove(world, do_unlink=True)
-
-        for col in scene.collection.children:
-            bpy.data.collections.remove(col, do_unlink=True)
-
-        scene.view_layers.remove(HUDlayer)
-        scene.view_layers.remove(bglayer)
-
-        Pluglayer.name = 'View Layer'
-
-        return scene
-
-    def save_blend(self, context, scene, plugobjs, plugname, blendpath):
         mcol = scene.collection
 
         plugcol = bpy.data.collections.new(name=plugname)
@@ -483,13 +336,11 @@ class AddPlugToLibrary(bpy.types.Operator):
         for obj in plugobjs:
             plugcol.objects.link(obj)
             if not any([obj.MM.isplug, obj.MM.isplughandle, obj.MM.isplugsubset, obj.type == "EMPTY"]):
-                obj.hide_set(True)
-
-        scene.name = 'Plug Asset'
+                obj.hide_set(True, view_layer=view_layer)
 
         handle = plugobjs[0]
         handle.matrix_world = Matrix()
-        context.view_layer.objects.active = handle
+        view_layer.objects.active = handle
 
         bpy.data.libraries.write(filepath=blendpath, datablocks={scene}, path_remap='RELATIVE_ALL')
 
@@ -4,10 +4,13 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. items import fuse_method_items, handle_method_items, tension_preset_items, side_selection_items
 from .. utils.graph import build_mesh_graph
-from .. utils.selection import get_2_rails_from_chamfer, get_sides, get_selected_vert_sequences
+from .. utils.selection import get_2_rails_from_chamfer, get_sides, get_selected_vert_sequences, get_selection_islands, get_boundary_edges
 from .. utils.sweep import init_sweeps
 from .. utils.loop import get_loops
 from .. utils.handle import create_loop_intersection_handles, create_face_intersection_handles
+from .. utils.tool import create_splines, create_splines_per_sweep, fuse_surface
+from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.session import FuseSession
 from .. utils.math import get_angle_between_edges
 from .. utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, popup_message
 from .. utils.developer import output_traceback
@@ -17,6 +20,7 @@ from .. utils.object import add_facemap
 from .. utils.vgroup import add_vgroup
 from .. utils.draw import draw_point, draw_vector, draw_vectors, draw_line, draw_points
 import math
+import time
 
 class DebugWhatever(bpy.types.Operator):
     bl_idname = "machin3.debug_whatever"
@@ -99,6 +103,131 @@ class GetLength(bpy.types.Operator):
 
             return {'FINISHED'}
 
+class BenchmarkSplines(bpy.types.Operator):
+    bl_idname = "machin3.benchmark_splines"
+    bl_label = "MACHIN3: Benchmark Splines"
+    bl_description = "Compare per-sweep and batched Spline Creation on the selected Chamfer"
+    bl_options = {'REGISTER'}
+
+    segments: IntProperty(name="Segments", default=30, min=1, max=100)
+    iterations: IntProperty(name="Iterations", default=10, min=1)
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'EDIT_MESH'
+
+    def execute(self, context):
+        active = context.active_object
+        active.update_from_editmode()
+
+        bm = bmesh.new()
+        bm.from_mesh(active.data)
+        bm.normal_update()
+        bm.verts.ensure_lookup_table()
+
+        bw = ensure_custom_data_layers(bm)[1]
+
+        mg = build_mesh_graph(bm, mesh=active.data, selected=True)
+        verts = [v for v in bm.verts if v.select]
+        faces = [f for f in bm.faces if f.select]
+
+        ret = get_2_rails_from_chamfer(bm, mg, verts, faces)
+
+        if not ret:
+            bm.free()
+            return {'CANCELLED'}
+
+        rails, cyclic = ret
+
+        sweeps = init_sweeps(bm, active, rails)
+        get_loops(bm, bw, faces, sweeps)
+        create_face_intersection_handles(bm, sweeps, tension=0.7)
+
+        session = FuseSession(bm)
+        session.store(bm, None, faces=faces, rails=rails, sweeps=sweeps, cyclic=cyclic)
+
+        print(f"\nBenchmarking {len(sweeps)} sweeps with {self.segments} segments, {self.iterations} iterations")
+
+        timings = {}
+
+        for name, create in [('per sweep', create_splines_per_sweep), ('batched', create_splines)]:
+            splines = 0
+            surface = 0
+
+            for _ in range(self.iterations):
+                testbm, testfaces, _, testsweeps = session.restore()
+
+                start = time.time()
+                spline_sweeps = create(testbm, testsweeps, self.segments)
+                splines += time.time() - start
+
+                bmesh.ops.delete(testbm, geom=testfaces, context='FACES')
+
+                start = time.time()
+                fuse_surface(testbm, spline_sweeps, smooth=False, capholes=False, cyclic=cyclic)
+                surface += time.time() - start
+
+                testbm.free()
+
+            timings[name] = splines / self.iterations
+
+            print("--- %f - %s splines" % (timings[name], name))
+            print("--- %f - %s surface" % (surface / self.iterations, name))
+
+        session.finish()
+
+        speedup = timings['per sweep'] / timings['batched'] if timings['batched'] else 0
+        print("  • %.2fx - batched speedup" % (speedup))
+
+        self.report({'INFO'}, "Batched splines are %.2fx faster than per-sweep splines" % (speedup))
+        return {'FINISHED'}
+
+class BenchmarkTopology(bpy.types.Operator):
+    bl_idname = "machin3.benchmark_topology"
+    bl_label = "MACHIN3: Benchmark Topology"
+    bl_description = "Time the Selection Island and Boundary Edge passes on generated 100k and 500k Face Grids, to verify they scale linearly"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        print("\nBenchmarking topology passes")
+
+        rates = []
+
+        for count in [100000, 500000]:
+            segments = int(math.sqrt(count))
+
+            bm = bmesh.new()
+            bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1)
+            bm.faces.ensure_lookup_table()
+
+            facecount = len(bm.faces)
+
+            for f in bm.faces:
+                f.select = f.index < facecount / 2
+
+            start = time.time()
+            islands = get_selection_islands(bm)
+            islands_time = time.time() - start
+
+            start = time.time()
+            get_boundary_edges(islands[0][2])
+            boundary_time = time.time() - start
+
+            bm.free()
+
+            rate = (islands_time + boundary_time) / facecount * 100000
+            rates.append(rate)
+
+            print("--- %f - selection islands, %d faces" % (islands_time, facecount))
+            print("--- %f - boundary edges, %d faces" % (boundary_time, facecount))
+            print("  • %f - per 100k faces" % (rate))
+
+        scaling = rates[1] / rates[0] if rates[0] else 0
+        print("  • %.2f - scaling factor, 1.0 is linear" % (scaling))
+
+        self.report({'INFO'}, "Topology passes scale by %.2f per face from 100k to 500k faces, 1.0 is linear" % (scaling))
+        return {'FINISHED'}
+
 class DrawDebug(bpy.types.Operator):
     bl_idname = "machin3.draw_debug"
     bl_label = "MACHIN3: Draw Debug"
@@ -666,7 +795,7 @@ class GetLoopsHandles(bpy.types.Operator):
         bm.normal_update()
         bm.verts.ensure_lookup_table()
 
-        mg = build_mesh_graph(bm, debug=debug)
+        mg = build_mesh_graph(bm, selected=True, debug=debug)
         verts = [v for v in bm.verts if v.select]
         faces = [f for f in bm.faces if f.select]
 
@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import FloatProperty
 from ... utils.mesh import get_coords
-from ... utils.draw import draw_lines
+from ... utils.draw import DrawBatch
 from ... utils.registration import get_prefs
 from ... utils.ui import init_timer_modal, set_countdown, get_timer_progress
 
@@ -15,7 +15,7 @@ class DrawPlug(bpy.types.Operator):
         if context.area == self.area:
             alpha = get_timer_progress(self) * self.alpha
 
-            draw_lines(self.coords, indices=self.indices, alpha=alpha)
+            self.batch.draw(mx=self.mx, alpha=alpha)
 
     def modal(self, context, event):
         if context.area:
@@ -39,13 +39,15 @@ class DrawPlug(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
     def execute(self, context):
+        if bpy.app.background:
+            return {'CANCELLED'}
+
         active = context.active_object
-        mx = active.matrix_world
+        self.mx = active.matrix_world.copy()
 
         from .. plug import vert_ids
 
-        self.indices = vert_ids
-        self.coords = get_coords(active.data, mx=mx)
+        self.batch = DrawBatch(get_coords(active.data), indices=vert_ids)
 
         init_timer_modal(self)
 
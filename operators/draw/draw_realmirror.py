@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import FloatProperty
 from ... utils.mesh import get_coords
-from ... utils.draw import draw_points
+from ... utils.draw import DrawBatch
 from ... utils.registration import get_prefs
 from ... colors import normal, white
 from ... utils.ui import init_timer_modal, set_countdown, get_timer_progress
@@ -18,8 +18,8 @@ class DrawRealMirror(bpy.types.Operator):
         if context.area == self.area:
             alpha = get_timer_progress(self) * self.alpha
 
-            for coords, color in self.batches:
-                draw_points(coords, color=color, alpha=alpha)
+            for batch, mx, color in self.batches:
+                batch.draw(mx=mx, color=color, alpha=alpha)
 
     def modal(self, context, event):
         if context.area:
@@ -44,15 +44,18 @@ class DrawRealMirror(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
     def execute(self, context):
+        if bpy.app.background:
+            return {'CANCELLED'}
+
         from .. real_mirror import mirrored, custom_normals
 
         self.batches = []
 
         for obj, cn in zip(mirrored, custom_normals):
             offset = sum([d for d in obj.dimensions]) / 3 * self.normal_offset
-            coords = get_coords(obj.data, mx=obj.matrix_world, offset=offset)
+            batch = DrawBatch(get_coords(obj.data, offset=offset), type='POINTS')
             color = normal if cn else white
-            self.batches.append((coords, color))
+            self.batches.append((batch, obj.matrix_world.copy(), color))
 
         init_timer_modal(self)
 
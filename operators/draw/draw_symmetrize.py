@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import FloatProperty, BoolProperty, IntProperty
 from ... utils.mesh import get_coords
-from ... utils.draw import draw_points
+from ... utils.draw import DrawBatch
 from ... utils.registration import get_prefs
 from ... utils.ui import init_timer_modal, set_countdown, get_timer_progress
 from ... colors import normal, white, red
@@ -18,7 +18,7 @@ class DrawSymmetrize(bpy.types.Operator):
         if context.area == self.area:
             alpha = get_timer_progress(self) * self.alpha * (10 if self.remove else 1)
 
-            draw_points(self.coords, indices=self.indices, color=self.color, size=6, alpha=alpha, xray=False)
+            self.batch.draw(mx=self.mx, color=self.color, size=6, alpha=alpha, xray=False)
 
     def modal(self, context, event):
         if context.area:
@@ -43,17 +43,19 @@ class DrawSymmetrize(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
     def execute(self, context):
+        if bpy.app.background:
+            return {'CANCELLED'}
+
         active = context.active_object
-        mx = active.matrix_world
+        self.mx = active.matrix_world.copy()
         offset = sum([d for d in active.dimensions]) / 3 * self.normal_offset
 
         from .. symmetrize import vert_ids, custom_normals, remove
 
-        self.indices = vert_ids
         self.color = red if remove else normal if custom_normals else white
         self.remove = remove
 
-        self.coords = get_coords(active.data, mx=mx, offset=offset)
+        self.batch = DrawBatch(get_coords(active.data, offset=offset), indices=vert_ids, type='POINTS')
 
         init_timer_modal(self)
 
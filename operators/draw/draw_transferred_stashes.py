@@ -1,7 +1,6 @@
 import bpy
 from bpy.props import FloatProperty
-from ... utils.mesh import get_coords
-from ... utils.draw import draw_mesh_wire
+from ... utils.draw import draw_mesh_wire, get_wire_batch
 from ... utils.registration import get_prefs
 from ... utils.ui import init_timer_modal, set_countdown, get_timer_progress
 
@@ -16,7 +15,7 @@ class DrawTransferredStashes(bpy.types.Operator):
             alpha = get_timer_progress(self) * self.alpha
 
             for batch in self.batches:
-                draw_mesh_wire(batch, alpha=alpha)
+                draw_mesh_wire(batch, mx=self.mx, alpha=alpha)
 
     def modal(self, context, event):
         if context.area:
@@ -41,14 +40,17 @@ class DrawTransferredStashes(bpy.types.Operator):
         return {'PASS_THROUGH'}
 
     def execute(self, context):
+        if bpy.app.background:
+            return {'CANCELLED'}
+
         active = context.active_object
-        mx = active.matrix_world
+        self.mx = active.matrix_world.copy()
 
         from .. stash import transferred_stash_meshes
 
         self.batches = []
         for mesh in transferred_stash_meshes:
-            self.batches.append(get_coords(mesh, mx=mx, indices=True))
+            self.batches.append(get_wire_batch(mesh))
 
         init_timer_modal(self)
 
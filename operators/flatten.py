@@ -2,6 +2,7 @@ import bpy
 from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. utils.tool import flatten_verts, flatten_faces
+from .. utils.bmesh import get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.draw import draw_lines, draw_points
 from .. utils.developer import output_traceback
 from .. utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, update_HUD_location
@@ -116,19 +117,15 @@ class Flatten(bpy.types.Operator):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.coords = []
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
         init_cursor(self, event)
 
@@ -138,9 +135,6 @@ class Flatten(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
-
             output_traceback(self, e)
             return {'FINISHED'}
 
@@ -156,27 +150,25 @@ class Flatten(bpy.types.Operator):
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         verts = [v for v in bm.verts if v.select]
         edges = [e for e in bm.edges if e.select]
@@ -190,7 +182,6 @@ class Flatten(bpy.types.Operator):
             self.coords = flatten_verts(bm, verts, self.flatten_mode, debug=debug)
 
         bm.normal_update()
-        bm.to_mesh(active.data)
+        update_edit_bmesh(active.data, destructive=self.snapshot.destructive or (self.face_mode and self.dissolve))
 
-        bpy.ops.object.mode_set(mode='EDIT')
         return True
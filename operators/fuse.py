@@ -3,7 +3,7 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. items import fuse_method_items, handle_method_items, tension_preset_items
 from .. colors import blue, yellow
-from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.graph import build_mesh_graph
 from .. utils.selection import get_2_rails_from_chamfer
 from .. utils.sweep import init_sweeps, debug_sweeps
@@ -12,13 +12,14 @@ from .. utils.handle import create_loop_intersection_handles, create_face_inters
 from .. utils.tool import change_width, fuse_surface, set_sweep_sharps_and_bweights, clear_rail_sharps_and_bweights, create_splines
 from .. utils.draw import debug_draw_sweeps, draw_lines
 from .. utils.ui import draw_title, draw_prop, draw_init, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.property import step_enum
+from .. utils.session import FuseSession
 from .. utils.developer import output_traceback
 from .. utils.math import average_locations
 from .. utils.registration import get_prefs, get_addon
 
-class Fuse(bpy.types.Operator):
+class Fuse(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.fuse"
     bl_label = "MACHIN3: Fuse"
     bl_description = "Create rounded Bevels from Chamfers"
@@ -134,7 +135,7 @@ class Fuse(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'R', 'S', 'F', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'A', 'P']
+        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'R', 'S', 'F', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'A', 'P', 'TIMER']
 
         if any([self.allowmodalwidth, self.allowmodaltension]):
             events.append('MOUSEMOVE')
@@ -221,16 +222,13 @@ class Fuse(bpy.types.Operator):
                 self.force_projected_loop = not self.force_projected_loop
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
                     return {'FINISHED'}
             except Exception as e:
-                self.finish()
-
-                if bpy.context.mode == 'OBJECT':
-                    bpy.ops.object.mode_set(mode='EDIT')
+                self.cancel_modal()
 
                 output_traceback(self, e)
                 return {'FINISHED'}
@@ -240,6 +238,8 @@ class Fuse(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
@@ -257,20 +257,22 @@ class Fuse(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.DEBUG, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
+
+        self.session.finish()
 
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
+        self.session.finish()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.width = 0
         self.reverse = False
         self.force_projected_loop = False
@@ -279,10 +281,11 @@ class Fuse(bpy.types.Operator):
         self.loops = []
         self.handles = []
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
+
+        self.session = FuseSession(self.snapshot.bm)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -294,8 +297,7 @@ class Fuse(bpy.types.Operator):
         except Exception as e:
             output_traceback(self, e)
 
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
+            self.cancel_modal(removeHUD=False)
             return {'FINISHED'}
 
         init_status(self, context, 'Fuse')
@@ -304,17 +306,26 @@ class Fuse(bpy.types.Operator):
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
         self.DEBUG = bpy.types.SpaceView3D.draw_handler_add(self.draw_DEBUG, (context, ), 'WINDOW', 'POST_VIEW')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
@@ -326,89 +337,121 @@ class Fuse(bpy.types.Operator):
             debug = True
             debug = False
 
-            bpy.ops.object.mode_set(mode='OBJECT')
+            if modal and self.segments == 0:
+                self.snapshot.restore()
+                update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+                return True
 
-            if modal:
-                self.initbm.to_mesh(active.data)
-                if self.segments == 0:
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    return True
+            if modal and self.session.is_cached(self.get_session_key()):
+                bm, faces, rails, sweeps = self.session.restore()
+                self.cyclic = self.session.cyclic
 
-            bm = bmesh.new()
-            bm.from_mesh(active.data)
-            bm.normal_update()
-            bm.verts.ensure_lookup_table()
+                bw = ensure_custom_data_layers(bm)[1]
 
-            bw = ensure_custom_data_layers(bm)[1]
+                self.single = True if len(faces) == 1 else False
 
-            mg = build_mesh_graph(bm, debug=debug)
-            verts = [v for v in bm.verts if v.select]
-            faces = [f for f in bm.faces if f.select]
+            else:
+                if modal:
+                    bm = self.session.get_base()
+
+                else:
+                    bm = get_edit_bmesh(active.data)
 
-            self.single = True if len(faces) == 1 else False
+                bw = ensure_custom_data_layers(bm)[1]
 
-            if self.init:
-                self.init = False
-                self.smooth = True if any(f.smooth for f in faces) else False
+                mg = build_mesh_graph(bm, selected=True, debug=debug)
+                verts = [v for v in bm.verts if v.select]
+                faces = [f for f in bm.faces if f.select]
 
-                self.init_panel_decal(active)
+                self.single = True if len(faces) == 1 else False
 
-            ret = get_2_rails_from_chamfer(bm, mg, verts, faces, self.reverse, debug=debug)
+                if self.init:
+                    self.init = False
+                    self.smooth = True if any(f.smooth for f in faces) else False
+
+                    self.init_panel_decal(active)
+
+                ret = get_2_rails_from_chamfer(bm, mg, verts, faces, self.reverse, debug=debug)
+
+                if not ret:
+                    if modal:
+                        bm.free()
+
+                        self.snapshot.restore()
+                        update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
+                    return False
 
-            if ret:
                 rails, self.cyclic = ret
+                sweeps = None
 
                 if self.method == "FUSE":
                     sweeps = init_sweeps(bm, active, rails, debug=debug)
 
                     get_loops(bm, bw, faces, sweeps, force_projected=self.force_projected_loop, debug=debug)
 
-                    if self.width != 0:
-                        change_width(bm, sweeps, self.width, debug=debug)
+                if modal:
+                    self.session.store(bm, self.get_session_key(), faces=faces, rails=rails, sweeps=sweeps, cyclic=self.cyclic)
+
+                    bm, faces, rails, sweeps = self.session.restore()
+                    bw = ensure_custom_data_layers(bm)[1]
 
+            if self.method == "FUSE":
+                if self.width != 0:
+                    change_width(bm, sweeps, self.width, debug=debug)
+
+                handlekey = (self.handlemethod, self.tension, self.average, self.width)
+
+                if not (modal and self.session.get_handles(sweeps, handlekey)):
                     if self.handlemethod == "FACE":
                         create_face_intersection_handles(bm, sweeps, tension=self.tension, average=self.average, debug=debug)
                     elif self.handlemethod == "LOOP":
                         create_loop_intersection_handles(bm, sweeps, self.tension, debug=debug)
 
-                    if bpy.context.scene.MM.debug:
-                        debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
+                    if modal:
+                        self.session.store_handles(sweeps, handlekey)
 
-                    spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
+                if bpy.context.scene.MM.debug:
+                    debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
 
-                    self.clean_up(bm, sweeps, faces, debug=debug)
+                spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
 
-                    fuse_faces, _ = fuse_surface(bm, spline_sweeps, self.smooth, self.capholes, self.capdissolveangle, self.cyclic, debug=debug)
+                self.clean_up(bm, sweeps, faces, debug=debug)
 
-                    set_sweep_sharps_and_bweights(bm, bw, sweeps, spline_sweeps)
-                    clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic)
+                fuse_faces, _ = fuse_surface(bm, spline_sweeps, self.smooth, self.capholes, self.capdissolveangle, self.cyclic, debug=debug)
 
-                elif self.method == "BRIDGE":
-                    if bpy.context.scene.MM.debug:
-                        self.loops.clear()
-                        self.handles.clear()
+                set_sweep_sharps_and_bweights(bm, bw, sweeps, spline_sweeps)
+                clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic)
 
-                    for f in bm.faces:
-                        f.select = False
+            elif self.method == "BRIDGE":
+                if bpy.context.scene.MM.debug:
+                    self.loops.clear()
+                    self.handles.clear()
 
-                    bmesh.ops.delete(bm, geom=faces, context='FACES')
+                for f in bm.faces:
+                    f.select = False
 
-                    clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic, select=True)
+                bmesh.ops.delete(bm, geom=faces, context='FACES')
 
-                bm.to_mesh(active.data)
+                clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic, select=True)
 
-                bpy.ops.object.mode_set(mode='EDIT')
+            # modal runs work on session copies of the snapshot region, that replace it in the edit mesh in one go
+            if modal:
+                self.snapshot.restore(bm)
+                bm.free()
 
-                if self.method == "BRIDGE":
-                    bpy.ops.mesh.bridge_edge_loops(number_cuts=self.segments, smoothness=self.tension, interpolation='SURFACE')
+            update_edit_bmesh(active.data)
 
-                return True
+            if self.method == "BRIDGE":
+                bpy.ops.mesh.bridge_edge_loops(number_cuts=self.segments, smoothness=self.tension, interpolation='SURFACE')
 
-            else:
-                bpy.ops.object.mode_set(mode='EDIT')
+            return True
 
         return False
 
+    def get_session_key(self):
+        return (self.method, self.reverse, self.force_projected_loop)
+
     def init_panel_decal(self, active):
         if self.decalmachine and active.DM.decaltype == "PANEL":
             self.reverse = True
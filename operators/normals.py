@@ -1,19 +1,18 @@
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty
 import bmesh
-import math
-import mathutils
 from .. items import normal_flatten_threshold_preset_items, loop_mapping_items, loop_mapping_dict
 from .. utils.developer import output_traceback
 from .. utils.graph import build_mesh_graph
 from .. utils.selection import get_2_rails_from_chamfer, get_selection_islands
-from .. utils.normal import normal_clear, normal_transfer_from_stash, normal_clear_across_sharps, remerge_sharp_edges
+from .. utils.normal import normal_clear, normal_transfer_from_stash, normal_clear_across_sharps, remerge_sharp_edges, LoopNormals, flatten_normals
 from .. utils.math import get_edge_normal
-from .. utils.mesh import smooth, flip_normals, get_coords
+from .. utils.mesh import smooth, flip_normals
 from .. utils.registration import get_prefs
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, update_HUD_location
 from .. utils.ui import init_status, finish_status
-from .. utils.draw import draw_mesh_wire
+from .. utils.draw import draw_mesh_wire, get_stash_batch
+from .. utils.stash import rehydrate_stash
 from .. utils.property import step_collection, step_enum
 from .. utils.modifier import apply_mod
 from .. utils.vgroup import set_vgroup, get_vgroup
@@ -207,52 +206,13 @@ class NormalFlatten(bpy.types.Operator):
         if modal:
             self.initbm.to_mesh(active.data)
 
-        mesh = active.data
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-
-        mesh.calc_normals_split()
-
-        loop_normals = []
-        for loop in mesh.loops:
-            loop_normals.append(loop.normal)
-
-        faces = [f for f in bm.faces if f.select]
+        ln = LoopNormals(active.data)
 
         if self.clear:
-            for v in (v for v in bm.verts if v.select):
-                for loop in v.link_loops:
-                    loop_normals[loop.index] = mathutils.Vector()
-
-        for f in faces:
-
-            border_faces = []
-            for v in f.verts:
-                for face in v.link_faces:
-                    if face not in border_faces and face != f:
-                        border_faces.append(face)
-
-            edge_faces = []
-            for bf in border_faces:
-                for e in bf.edges:
-                    if e in f.edges:
-                        edge_faces.append(bf)
-                        if e.smooth and math.degrees(e.calc_face_angle()) < self.normalthreshold:
-                            for loop in e.link_loops:
-                                loop_normals[loop.index] = f.normal
-                                loop_normals[loop.link_loop_next.index] = f.normal
-
-            for bf in border_faces:
-                if bf not in edge_faces:
-                    cf = bf
-                    if all([e.smooth for e in cf.edges]) and math.degrees(cf.normal.angle(f.normal)) < self.normalthreshold:
-                        cv = [v for v in cf.verts if v in f.verts][0]
-                        loop = [l for l in cv.link_loops if l in cf.loops][0]
-                        loop_normals[loop.index] = f.normal
-
-        mesh.normals_split_custom_set(loop_normals)
-        mesh.use_auto_smooth = True
+            ln.clear(ln.vert_select[ln.loop_verts])
+
+        flatten_normals(ln, self.normalthreshold)
+        ln.set()
 
         bpy.ops.object.mode_set(mode='EDIT')
 
@@ -295,11 +255,7 @@ class NormalStraighten(bpy.types.Operator):
         bpy.ops.object.mode_set(mode='OBJECT')
 
         mesh = active.data
-        mesh.calc_normals_split()
-
-        loop_normals = []
-        for loop in mesh.loops:
-            loop_normals.append(loop.normal)
+        ln = LoopNormals(mesh)
 
         bm = bmesh.new()
         bm.from_mesh(mesh)
@@ -316,7 +272,7 @@ class NormalStraighten(bpy.types.Operator):
                 else:
                     f.select_set(False)
 
-            mg = build_mesh_graph(bm, debug=debug)
+            mg = build_mesh_graph(bm, selected=True, debug=debug)
 
             ret = get_2_rails_from_chamfer(bm, mg, verts, faces, False, debug=debug)
 
@@ -339,11 +295,9 @@ class NormalStraighten(bpy.types.Operator):
                             if fe and be:
                                 edge_normal = get_edge_normal(fe)
 
-                                for loop in rv.link_loops:
-                                    loop_normals[loop.index] = edge_normal
+                                ln.normals[[loop.index for loop in rv.link_loops]] = edge_normal
 
-        mesh.normals_split_custom_set(loop_normals)
-        mesh.use_auto_smooth = True
+        ln.set()
 
         bpy.ops.object.mode_set(mode='EDIT')
 
@@ -406,7 +360,7 @@ class NormalTransfer(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.area == self.area:
             if self.batch:
-                draw_mesh_wire(self.batch, color=white, alpha=self.alpha, xray=self.xray)
+                draw_mesh_wire(self.batch, mx=self.active.matrix_world, color=white, alpha=self.alpha, xray=self.xray)
 
     @classmethod
     def poll(cls, context):
@@ -434,8 +388,9 @@ class NormalTransfer(bpy.types.Operator):
                 self.stash = step_collection(self.active.MM, self.stash, "stashes", "active_stash_idx", -1)
 
                 if self.stash.obj:
+                    rehydrate_stash(self.stash.obj)
                     offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-                    self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+                    self.batch = get_stash_batch(self.stash, offset=offset)
 
                     self.data_transfer.object = self.stash.obj
 
@@ -454,8 +409,9 @@ class NormalTransfer(bpy.types.Operator):
                 self.stash = step_collection(self.active.MM, self.stash, "stashes", "active_stash_idx", 1)
 
                 if self.stash.obj:
+                    rehydrate_stash(self.stash.obj)
                     offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-                    self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+                    self.batch = get_stash_batch(self.stash, offset=offset)
 
                     self.data_transfer.object = self.stash.obj
 
@@ -569,8 +525,9 @@ class NormalTransfer(bpy.types.Operator):
         self.stash = self.active.MM.stashes[self.active.MM.active_stash_idx]
 
         if self.stash.obj:
+            rehydrate_stash(self.stash.obj)
             offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-            self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+            self.batch = get_stash_batch(self.stash, offset=offset)
 
         else:
             self.batch = None
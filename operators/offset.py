@@ -5,13 +5,14 @@ import mathutils
 from .. items import side_selection_items, outer_face_method_items
 from .. utils.selection import get_sides
 from .. utils.math import average_normals
+from .. utils.bmesh import get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, popup_message, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.math import average_locations
 from .. utils.property import step_enum
 from .. utils.developer import output_traceback
 
-class Offset(bpy.types.Operator):
+class Offset(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.offset"
     bl_label = "MACHIN3: Offset"
     bl_description = "Offset cyclic edgeloops resulting from Boolean Operations to create a perimeter loop"
@@ -97,7 +98,7 @@ class Offset(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'S', 'Q', 'M', 'V']
+        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'W', 'S', 'Q', 'M', 'V', 'TIMER']
 
         if self.allowmodalwidth:
             events.append('MOUSEMOVE')
@@ -152,21 +153,26 @@ class Offset(bpy.types.Operator):
                     self.create_vgroup = not self.create_vgroup
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.active.vertex_groups.remove(self.vgroup)
 
                     bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
                     finish_status(self)
+                    self.finish_scheduler()
 
                     return {'FINISHED'}
 
             except Exception as e:
+                self.snapshot.restore()
+                update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
                 self.active.vertex_groups.remove(self.vgroup)
 
                 bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
                 finish_status(self)
+                self.finish_scheduler()
 
                 output_traceback(self, e)
                 return {'FINISHED'}
@@ -176,6 +182,8 @@ class Offset(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in ['LEFTMOUSE', 'SPACE']:
+            self.flush_main(self.active)
+
             self.finish()
 
             if not self.create_vgroup:
@@ -197,13 +205,13 @@ class Offset(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def cancel_modal(self):
         self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
         self.active.vertex_groups.remove(self.vgroup)
 
@@ -212,8 +220,6 @@ class Offset(bpy.types.Operator):
 
         self.vgroup = self.active.vertex_groups.new(name="offset")
 
-        self.active.update_from_editmode()
-
         self.allowmodalwidth = True
         self.width = 0.001
         self.loop_slide = False
@@ -221,10 +227,9 @@ class Offset(bpy.types.Operator):
         self.merge = False
         self.reach = 0
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -233,6 +238,8 @@ class Offset(bpy.types.Operator):
         self.area = context.area
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
@@ -248,27 +255,28 @@ class Offset(bpy.types.Operator):
                 active.vertex_groups.remove(self.vgroup)
                 self.vgroup = None
 
+        self.snapshot = RegionSnapshot(active.data)
+        self.snapshot.extend(self.reach)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = False
 
-        mesh = active.data
-
-        bpy.ops.object.mode_set(mode='OBJECT')
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+            self.snapshot.extend(self.reach)
 
         groups = bm.verts.layers.deform.verify()
         verts = [v for v in bm.verts if v.select]
@@ -320,14 +328,12 @@ class Offset(bpy.types.Operator):
                     for v in f.verts:
                         v[groups][self.vgroup.index] = 1
 
-            bm.to_mesh(mesh)
-            bpy.ops.object.mode_set(mode='EDIT')
+            update_edit_bmesh(active.data)
 
             return True
 
         else:
             popup_message(err[0], title=err[1])
-            bpy.ops.object.mode_set(mode='EDIT')
 
             return False
 
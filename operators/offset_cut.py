@@ -117,16 +117,17 @@ class OffsetCut(bpy.types.Operator):
         bmesh.ops.recalc_face_normals(bm, faces=all_pipe_faces)
         bmesh.update_edit_mesh(active.data)
 
-        for idx in range(len(pipes)):
-            self.boolean_pipe(bm, face_layer, idx)
+        self.boolean_pipes(all_pipe_faces, len(pipes))
 
         bpy.ops.mesh.select_all(action='DESELECT')
 
+        pipe_face_index = self.get_pipe_faces(bm, face_layer)
+
         merge_verts = []
         junk_edges = []
 
         for pipe_idx, (coords, cyclic) in enumerate(pipes):
-            faces = [f for f in bm.faces if f[face_layer] == pipe_idx + 1]
+            faces = pipe_face_index.get(pipe_idx, [])
             edges = {e for f in faces for e in f.edges}
             verts = {v for f in faces for v in f.verts}
 
@@ -283,15 +284,22 @@ class OffsetCut(bpy.types.Operator):
 
         return pipe_faces
 
-    def boolean_pipe(self, bm, face_layer, pipe_idx):
-        
+    def boolean_pipes(self, pipe_faces, pipe_count):
         bpy.ops.mesh.select_all(action='DESELECT')
 
+        for f in pipe_faces:
+            f.select_set(True)
+
+        bpy.ops.mesh.intersect_boolean(operation='DIFFERENCE', solver=self.solver, use_self=pipe_count > 1)
+
+    def get_pipe_faces(self, bm, face_layer):
+        pipe_faces = {}
+
         for f in bm.faces:
-            if f[face_layer] == pipe_idx + 1:
-                f.select_set(True)
+            if f[face_layer]:
+                pipe_faces.setdefault(f[face_layer] - 1, []).append(f)
 
-        bpy.ops.mesh.intersect_boolean(operation='DIFFERENCE', solver=self.solver)
+        return pipe_faces
 
     def mark_selected_sharp(self, bm, mark_sharp):
         if mark_sharp:
@@ -2,13 +2,14 @@ import bpy
 from bpy.props import BoolProperty, IntProperty, FloatProperty, EnumProperty, StringProperty
 import bmesh
 from .. utils.developer import Benchmark
-from .. utils.plug import get_plug, store_scale, apply_hooks_and_arrays, transform, deform, contain, conform_verts_to_target_surface, create_plug_vgroups, get_target_face_ids, merge_plug_into_target, cleanup
+from .. utils.plug import get_plug, get_plugs, store_scale, apply_hooks_and_arrays, transform, deform, contain, conform_verts_to_target_surface, create_plug_vgroups, get_target_face_ids, merge_plug_into_target, cleanup, create_target_bvh
+from .. utils.plug import contain_bmesh, create_bmesh_bvh, get_target_faces_bmesh, join_plug_bmesh, merge_plug_bmesh, cleanup_bmesh, finish_cleanup_bmesh
 from .. utils.stash import create_stash
 from .. utils.ui import popup_message
 from .. utils.object import unparent, parent
-from .. utils.vgroup import get_vgroup
+from .. utils.vgroup import get_vgroup, set_vgroup
 from .. utils.registration import get_prefs
-from .. items import fillet_or_edge_items
+from .. items import fillet_or_edge_items, plug_engine_items
 
 vert_ids = []
 
@@ -34,12 +35,26 @@ class Plug(bpy.types.Operator):
     dissolve_angle: FloatProperty(name="Dissolve Angle", default=1, min=0, step=50)
     normal_transfer: BoolProperty(name="Normal Transfer", default=False)
     init: BoolProperty(name="Initial Run", default=False)
+    engine: EnumProperty(name="Engine", items=plug_engine_items, default="OPS")
+    debug = False
+    offset_dist = None
+    subsets = False
+    deformer = False
+    batch = False
+
     def draw(self, context):
         layout = self.layout
 
         box = layout.box()
         box.label(text="Integration")
 
+        row = box.row()
+        row.active = not self.batch
+        row.prop(self, "engine", expand=True)
+
+        if self.batch:
+            box.label(text="Several handles are always plugged in one pass, using BMesh", icon='INFO')
+
         row = box.row()
         row.prop(self, "contain")
 
@@ -91,12 +106,22 @@ class Plug(bpy.types.Operator):
     def invoke(self, context, event):
         self.debug = False
 
-        target, handle, plug, subsets, deformer, modifiers, others, err = get_plug(self, context, context.selected_objects, debug=self.debug)
+        if len(context.selected_objects) > 2:
+            target, plugs, err = get_plugs(self, context, context.selected_objects, debug=self.debug)
+
+        else:
+            target, handle, plug, subsets, deformer, modifiers, others, err = get_plug(self, context, context.selected_objects, debug=self.debug)
+            plugs = [(handle, plug, subsets, deformer, modifiers, others)]
+
         if err:
             popup_message(err[0], err[1])
             return {'CANCELLED'}
 
         else:
+            handle, plug, subsets, deformer, modifiers, others = plugs[0]
+
+            self.batch = len(plugs) > 1
+
             bpy.context.scene.tool_settings.vertex_group_weight = 1  # set the vertex group tool weight to 1, without it the normal transfer may not work as expected
             self.rotation = 0
             self.offset = 0
@@ -117,10 +142,18 @@ class Plug(bpy.types.Operator):
         return self.execute(context)
 
     def execute(self, context):
-        target, handle, plug, subsets, deformer, modifiers, others, err = get_plug(self, context, context.selected_objects, debug=self.debug)
-        shrinkwraps = [mod for subset in subsets for mod in subset.modifiers if mod.type == 'SHRINKWRAP' and mod.target == plug]
+        if len(context.selected_objects) > 2:
+            target, plugs, err = get_plugs(self, context, context.selected_objects, debug=self.debug)
+            shrinkwraps = [mod for _, plug, subsets, _, _, _ in plugs for subset in subsets for mod in subset.modifiers if mod.type == 'SHRINKWRAP' and mod.target == plug]
+
+            self.plug_batch(context, target, plugs)
+
+        else:
+            target, handle, plug, subsets, deformer, modifiers, others, err = get_plug(self, context, context.selected_objects, debug=self.debug)
+            shrinkwraps = [mod for subset in subsets for mod in subset.modifiers if mod.type == 'SHRINKWRAP' and mod.target == plug]
+
+            self.plug(context, target, handle, plug, subsets, deformer, modifiers, others)
 
-        self.plug(context, target, handle, plug, subsets, deformer, modifiers, others)
         for mod in shrinkwraps:
             mod.target = target
 
@@ -170,21 +203,42 @@ class Plug(bpy.types.Operator):
             create_stash(active=target, source=target)
         T.measure("create_stash")
 
+        bvh = create_target_bvh(dg, target)
+        T.measure("create target bvh")
+
         if self.deformation:
-            deform(context, dg, target, handle, deformer, plug, subsets, self.deform_plug, self.deform_subsets, self.filletoredge, self.use_mesh_deform, self.deform_interpolation_falloff, self.deformer_plug_precision, self.deformer_subset_precision, debug=self.debug)
+            deform(context, dg, target, handle, deformer, plug, subsets, self.deform_plug, self.deform_subsets, self.filletoredge, self.use_mesh_deform, self.deform_interpolation_falloff, self.deformer_plug_precision, self.deformer_subset_precision, bvh=bvh, debug=self.debug)
         T.measure("deformation")
 
+        if self.engine == 'BMESH':
+            self.plug_bmesh(context, dg, target, handle, plug, deformer, nrmsrc, bvh, T)
+
+        else:
+            self.plug_ops(context, dg, target, handle, plug, deformer, nrmsrc, bvh, T)
+
+        global vert_ids
+        vert_ids = self.get_perimeter_edge_ids(target)
+
+        bpy.ops.machin3.draw_plug()
+        T.measure("modal_wire")
+
+        T.total()
+        return {'FINISHED'}
+
+    def plug_ops(self, context, dg, target, handle, plug, deformer, nrmsrc, bvh, T):
         if self.contain:
             contain(self, context, target, handle, self.contain_amnt, self.precision, debug=self.debug)
+
+            bvh = create_target_bvh(dg, target)
         T.measure("contain_handle")
 
         if self.deformation:
-            conform_verts_to_target_surface(self, plug, target, self.filletoredge, debug=self.debug)
+            conform_verts_to_target_surface(self, plug, target, self.filletoredge, bvh=bvh, debug=self.debug)
         else:
             create_plug_vgroups(self, plug, push_back=True)
         T.measure("conform_verts_to_target_surface")
 
-        face_ids = get_target_face_ids(context, handle, target, precision=self.precision, debug=self.debug)
+        face_ids = get_target_face_ids(context, handle, target, precision=self.precision, bvh=bvh, debug=self.debug)
         T.measure("get_target_face_ids")
 
         target.select_set(True)
@@ -202,6 +256,178 @@ class Plug(bpy.types.Operator):
         cleanup(self, target, deformer, self.dissolve_angle, nrmsrc, self.filletoredge)
         T.measure("cleanup")
 
+    def plug_bmesh(self, context, dg, target, handle, plug, deformer, nrmsrc, bvh, T):
+        bm = bmesh.new()
+        bm.from_mesh(target.data)
+        bm.normal_update()
+
+        if self.contain:
+            contain_bmesh(self, context, dg, bm, target, handle, self.contain_amnt, self.precision, debug=self.debug)
+
+            bvh = create_bmesh_bvh(bm)
+        T.measure("contain_handle")
+
+        if self.deformation:
+            conform_verts_to_target_surface(self, plug, target, self.filletoredge, bvh=bvh, debug=self.debug)
+        else:
+            create_plug_vgroups(self, plug, push_back=True)
+        T.measure("conform_verts_to_target_surface")
+
+        faces = get_target_faces_bmesh(dg, bm, handle, target, precision=self.precision, bvh=bvh, debug=self.debug)
+        T.measure("get_target_face_ids")
+
+        join_plug_bmesh(bm, target, plug)
+        T.measure("join")
+
+        merge_plug_bmesh(self, bm, target, faces, debug=self.debug)
+        T.measure("merge_plug_into_target")
+
+        cleanup_bmesh(self, bm, target, self.dissolve_angle, debug=self.debug)
+
+        bm.to_mesh(target.data)
+        bm.free()
+
+        target.select_set(True)
+        context.view_layer.objects.active = target
+
+        finish_cleanup_bmesh(self, target, deformer, nrmsrc, self.filletoredge)
+        T.measure("cleanup")
+
+    def plug_batch(self, context, target, plugs):
+        dg = context.evaluated_depsgraph_get()
+
+        T = Benchmark(False)
+
+        for handle, plug, subsets, deformer, modifiers, others in plugs:
+            store_scale(context.scene, handle, [o for o in others if o.type == "EMPTY"])
+        T.measure("store plug scale")
+
+        nrmsrc = False
+        if self.normal_transfer:
+            nrmsrc = target.copy()
+            nrmsrc.data = target.data.copy()
+
+        T.measure("create normal source")
+
+        for handle, plug, subsets, deformer, modifiers, others in plugs:
+            for sub in subsets + [plug]:
+                sub.show_in_front = False
+
+            apply_hooks_and_arrays(dg, handle, plug, subsets, deformer, others, modifiers)
+
+            for obj in others:
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+            subs = [sub for sub in subsets if sub.parent in [plug, handle]]
+
+            transform(dg, handle, plug, deformer, self.rotation, self.offset, self.offset_dist, debug=self.debug)
+
+            for obj in [plug] + subs:
+                unparent(obj)
+
+            for obj in subs:
+                parent(obj, target)
+
+        T.measure("transform")
+
+        if not target.MM.stashes:
+            create_stash(active=target, source=target)
+        T.measure("create_stash")
+
+        bvh = create_target_bvh(dg, target)
+        T.measure("create target bvh")
+
+        if self.deformation:
+            for handle, plug, subsets, deformer, modifiers, others in plugs:
+                filletoredge = "FILLET" if plug.MM.hasfillet else "EDGE"
+                use_mesh_deform = deformer.MM.usedeformer if deformer else self.use_mesh_deform
+                subset_precision = max([sub.MM.deformerprecision for sub in subsets]) if subsets else self.deformer_subset_precision
+
+                deform(context, dg, target, handle, deformer, plug, subsets, self.deform_plug, self.deform_subsets, filletoredge, use_mesh_deform, self.deform_interpolation_falloff, plug.MM.deformerprecision, subset_precision, bvh=bvh, debug=self.debug)
+        T.measure("deformation")
+
+        bm = bmesh.new()
+        bm.from_mesh(target.data)
+        bm.normal_update()
+
+        container_vgroups = []
+
+        if self.contain:
+            for handle, plug, subsets, deformer, modifiers, others in plugs:
+                container_vgroups.append(contain_bmesh(self, context, dg, bm, target, handle, self.contain_amnt, self.precision, debug=self.debug))
+        T.measure("contain_handle")
+
+        bvh = create_bmesh_bvh(bm)
+
+        for handle, plug, subsets, deformer, modifiers, others in plugs:
+            filletoredge = "FILLET" if plug.MM.hasfillet else "EDGE"
+
+            if self.deformation:
+                conform_verts_to_target_surface(self, plug, target, filletoredge, bvh=bvh, debug=self.debug)
+            else:
+                create_plug_vgroups(self, plug, push_back=True)
+        T.measure("conform_verts_to_target_surface")
+
+        faces = [get_target_faces_bmesh(dg, bm, handle, target, precision=self.precision, bvh=bvh, debug=self.debug) for handle, _, _, _, _, _ in plugs]
+        T.measure("get_target_face_ids")
+
+        boundary = set()
+
+        for idx, (handle, plug, subsets, deformer, modifiers, others) in enumerate(plugs):
+            join_plug_bmesh(bm, target, plug)
+
+            if container_vgroups:
+                set_vgroup(self, container_vgroups[idx], 'contain')
+
+            merge_plug_bmesh(self, bm, target, [f for f in faces[idx] if f.is_valid], debug=self.debug)
+
+            groups = bm.verts.layers.deform.verify()
+            border_vgroup = get_vgroup(self, target, 'border')
+            boundary_vgroup = get_vgroup(self, target, 'boundary')
+
+            for v in bm.verts:
+                if boundary_vgroup.index in v[groups]:
+                    del v[groups][boundary_vgroup.index]
+                    boundary.add(v)
+
+                if border_vgroup.index in v[groups]:
+                    del v[groups][border_vgroup.index]
+        T.measure("join and merge")
+
+        groups = bm.verts.layers.deform.verify()
+        boundary_vgroup = get_vgroup(self, target, 'boundary')
+
+        for v in boundary:
+            if v.is_valid:
+                v[groups][boundary_vgroup.index] = 1
+
+        if container_vgroups:
+            for v in bm.verts:
+                for vg in container_vgroups[1:]:
+                    if vg.index in v[groups]:
+                        v[groups][container_vgroups[0].index] = 1
+
+            set_vgroup(self, container_vgroups[0], 'contain')
+
+        cleanup_bmesh(self, bm, target, self.dissolve_angle, debug=self.debug)
+
+        bm.to_mesh(target.data)
+        bm.free()
+
+        target.select_set(True)
+        context.view_layer.objects.active = target
+
+        filletoredge = "EDGE" if any(not plug.MM.hasfillet for _, plug, _, _, _, _ in plugs) else "FILLET"
+        finish_cleanup_bmesh(self, target, None, nrmsrc, filletoredge)
+
+        for vg in container_vgroups[1:]:
+            target.vertex_groups.remove(vg)
+
+        for handle, plug, subsets, deformer, modifiers, others in plugs:
+            if deformer:
+                bpy.data.objects.remove(deformer, do_unlink=True)
+        T.measure("cleanup")
+
         global vert_ids
         vert_ids = self.get_perimeter_edge_ids(target)
 
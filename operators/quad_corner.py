@@ -3,7 +3,7 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. items import turn_items, tension_preset_items
 from .. utils.graph import build_mesh_graph
-from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.selection import get_3_sides_from_tri_corner, get_2_rails_from_tri_corner
 from .. utils.sweep import init_sweeps, debug_sweeps
 from .. utils.handle import create_tri_corner_handles
@@ -165,19 +165,15 @@ class QuadCorner(bpy.types.Operator):
     def cancel_modal(self):
         self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
-
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -201,11 +197,18 @@ class QuadCorner(bpy.types.Operator):
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
@@ -215,19 +218,11 @@ class QuadCorner(bpy.types.Operator):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         bw = ensure_custom_data_layers(bm)[1]
 
-        mg = build_mesh_graph(bm, debug=debug)
+        mg = build_mesh_graph(bm, selected=True, debug=debug)
         verts = [v for v in bm.verts if v.select]
         edges = [e for e in bm.edges if e.select]
         faces = [f for f in bm.faces if f.select]
@@ -265,9 +260,7 @@ class QuadCorner(bpy.types.Operator):
 
             rebuild_corner_faces(bm, sides, rails, spline_sweeps, self.single, smooth, debug=debug)
 
-        bm.to_mesh(active.data)
-
-        bpy.ops.object.mode_set(mode='EDIT')
+        update_edit_bmesh(active.data)
 
         if ret:
             return True
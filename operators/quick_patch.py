@@ -5,9 +5,8 @@ from mathutils import Matrix
 from .. utils.ui import init_cursor, draw_init, draw_title, draw_prop, get_zoom_factor, update_HUD_location
 from .. utils.ui import init_status, finish_status
 from .. utils.raycast import cast_obj_ray_from_mouse, cast_obj_ray_from_point
-from .. utils.draw import draw_points, draw_vector, draw_point, draw_mesh_wire
+from .. utils.draw import draw_points, draw_vector, draw_point, draw_mesh_wire, get_wire_batch
 from .. utils.math import average_locations, remap
-from .. utils.mesh import get_coords
 from .. colors import white, green, red
 
 def draw_quick_patch(self, context):
@@ -134,7 +133,7 @@ class QuickPatch(bpy.types.Operator):
 
             if len(self.draw_coords) == 4:
                 self.factor, self.mesh_corner_coords, self.mesh_subd_coords = self.create_patch_mesh(context, self.subdivisions, self.offset_patch, self.simple)
-                self.batch = get_coords(self.mesh, indices=True)
+                self.batch = get_wire_batch(self.mesh)
 
             else:
                 self.factor = None
@@ -1,12 +1,8 @@
 import bpy
 from bpy.props import IntProperty, BoolProperty
-import bmesh
-import mathutils
-import math
-from .. utils.bmesh import loop_index_update
-from .. utils.draw import draw_vector
+from mathutils import Matrix
+import numpy as np
 from .. utils.collection import create_realmirror_collections, sort_into_realmirror_collections
-from .. items import axis_mapping_dict
 
 mirrored = []
 custom_normals = []
@@ -47,6 +43,7 @@ class RealMirror(bpy.types.Operator):
         debug = False
 
         sel = context.selected_objects
+        active = context.active_object
 
         originals = sel.copy()
 
@@ -54,21 +51,25 @@ class RealMirror(bpy.types.Operator):
         mirrored = []
 
         while sel:
-            context.view_layer.objects.active = sel[0]
-            active = context.active_object
+            actives = []
 
-            mirrors = [mod for mod in active.modifiers if mod.type == "MIRROR" and mod.show_render and mod.show_render and any(mod.use_axis)]
+            for obj in sel:
+                mirrors = [mod for mod in obj.modifiers if mod.type == "MIRROR" and mod.show_render and any(mod.use_axis)]
 
-            if not mirrors:
-                sel.remove(active)
+                if mirrors:
+                    actives.append((obj, mirrors))
 
-            else:
-                self.custom_normals = active.data.has_custom_normals
+            sel = []
 
-                loop_data = self.get_loop_data(active) if self.custom_normals else None
+            base_meshes = self.get_base_meshes(context, [obj for obj, _ in actives]) if self.apply_data_transfers else {}
+
+            for obj, mirrors in actives:
+                base = base_meshes.get(obj, obj.data)
+
+                loop_normals = self.get_loop_normals(base) if self.mirror_custom_normals and base.has_custom_normals else None
 
                 for mod in mirrors:
-                    target = mod.mirror_object if mod.mirror_object else active
+                    target = mod.mirror_object if mod.mirror_object else obj
 
                     mod.show_viewport = False
                     mod.show_render = False
@@ -76,50 +77,17 @@ class RealMirror(bpy.types.Operator):
                     uvs = (mod.use_mirror_u, mod.use_mirror_v)
                     uvoffsets = (self.uoffset, self.voffset)
 
-                    if mod.use_axis[0]:
-                        mirror_obj1 = self.real_mirror(active, target, loop_data, mod.name, "X", uvs, uvoffsets, debug=debug)
-                        loop_data1 = self.get_loop_data(mirror_obj1) if self.custom_normals else (None, None)
-
-                        sel.append(mirror_obj1)
-                        mirrored.append(mirror_obj1)
-
-                        if mod.use_axis[1]:
-                            mirror_obj2 = self.real_mirror(mirror_obj1, target, loop_data1, mod.name, "Y", uvs, uvoffsets, debug=debug)
-                            loop_data2 = self.get_loop_data(mirror_obj2) if self.custom_normals else (None, None)
-
-                            sel.append(mirror_obj2)
-                            mirrored.append(mirror_obj2)
-
-                            if mod.use_axis[2]:
-                                mirror_obj3 = self.real_mirror(mirror_obj2, target, loop_data2, mod.name, "Z", uvs, uvoffsets, debug=debug)
-
-                                sel.append(mirror_obj3)
-                                mirrored.append(mirror_obj3)
-
-                        if mod.use_axis[2]:
-                            mirror_obj2 = self.real_mirror(mirror_obj1, target, loop_data1, mod.name, "Z", uvs, uvoffsets, debug=debug)
-                            loop_data2 = self.get_loop_data(mirror_obj2) if self.custom_normals else (None, None)
-
-                            sel.append(mirror_obj2)
-                            mirrored.append(mirror_obj2)
+                    for axes in self.get_octants(mod.use_axis):
+                        mirror_obj = self.mirror_object(obj, target, base, axes, mod.name, remove_data_transfers=obj in base_meshes)
+                        self.mirror_mesh(mirror_obj.data, axes, loop_normals, uvs, uvoffsets, debug=debug)
 
-                    if mod.use_axis[1]:
-                        mirror_obj1 = self.real_mirror(active, target, loop_data, mod.name, "Y", uvs, uvoffsets, debug=debug)
-                        loop_data1 = self.get_loop_data(mirror_obj1) if self.custom_normals else (None, None)
+                        sel.append(mirror_obj)
+                        mirrored.append(mirror_obj)
 
-                        sel.append(mirror_obj1)
-                        mirrored.append(mirror_obj1)
+                if obj in base_meshes:
+                    bpy.data.meshes.remove(base, do_unlink=True)
 
-                        if mod.use_axis[2]:
-                            mirror_obj2 = self.real_mirror(mirror_obj1, target, loop_data1, mod.name, "Z", uvs, uvoffsets, debug=debug)
-
-                            sel.append(mirror_obj2)
-                            mirrored.append(mirror_obj2)
-
-                    if mod.use_axis[2]:
-                        mirror_obj1 = self.real_mirror(active, target, loop_data, mod.name, "Z", uvs, uvoffsets, debug=debug)
-                        sel.append(mirror_obj1)
-                        mirrored.append(mirror_obj1)
+        context.view_layer.objects.active = active
 
         if self.create_collections and mirrored:
             _, rmocol, rmmcol = create_realmirror_collections(context.scene)
@@ -134,177 +102,131 @@ class RealMirror(bpy.types.Operator):
 
         return {'FINISHED'}
 
-    def real_mirror(self, active, target, loop_data, modname, axis, uvs, uvoffsets, debug=False):
-        mirror_obj, loop_data = self.mirror_object(active, target, loop_data, axis, modname, debug=debug)
-
-        bm = self.apply_transformation(mirror_obj, axis)
-
-        if any(uvs):
-            bm = self.mirror_uvs(bm, *uvs, *uvoffsets)
-
-        if self.mirror_custom_normals and self.custom_normals:
-            self.mirror_normals(bm, mirror_obj, loop_data, axis, debug=debug)
-        else:
-            bm.to_mesh(mirror_obj.data)
-            bm.clear()
-
-        mirror_obj.data.update()
-
-        return mirror_obj
-
-    def mirror_uvs(self, bm, umirror, vmirror, uoffset=0, voffset=0):
-        uvs = bm.loops.layers.uv.active
+    def get_octants(self, use_axis):
+        axes = [axis for axis, use in zip("XYZ", use_axis) if use]
+        octants = []
 
-        if uvs:
+        def add(prefix, remaining):
+            for idx, axis in enumerate(remaining):
+                octant = prefix + (axis,)
+                octants.append(octant)
 
-            us = []
-            vs = []
-            mir_us = []
-            mir_vs = []
+                add(octant, remaining[idx + 1:])
 
-            for face in bm.faces:
-                for loop in face.loops:
-                    uv = loop[uvs].uv
+        add((), axes)
+        return octants
 
-                    us.append(uv[0])
-                    vs.append(uv[1])
+    def get_base_meshes(self, context, objects):
+        states = {}
 
-                    if umirror:
-                        loop[uvs].uv = uv.reflect(mathutils.Vector((1, 0)))
-                    if vmirror:
-                        loop[uvs].uv = uv.reflect(mathutils.Vector((0, 1)))
+        for obj in objects:
+            if any(mod.type == "DATA_TRANSFER" for mod in obj.modifiers) and not any(mod.type == "SUBSURF" for mod in obj.modifiers):
+                states[obj] = [(mod, mod.show_viewport) for mod in obj.modifiers]
 
-                    uv = loop[uvs].uv
+                for mod in obj.modifiers:
+                    mod.show_viewport = mod.type == "DATA_TRANSFER"
 
-                    mir_us.append(uv[0])
-                    mir_vs.append(uv[1])
+        base_meshes = {}
 
-            for face in bm.faces:
-                for loop in face.loops:
-                    loop[uvs].uv += mathutils.Vector((min(us) - min(mir_us), min(vs) - min(mir_vs)))
+        if states:
+            dg = context.evaluated_depsgraph_get()
 
-                    if any([uoffset, voffset]):
-                        loop[uvs].uv += mathutils.Vector((uoffset, voffset))
+            for obj, modstates in states.items():
+                base_meshes[obj] = bpy.data.meshes.new_from_object(obj.evaluated_get(dg), preserve_all_data_layers=True, depsgraph=dg)
 
-        return bm
+                for mod, state in modstates:
+                    mod.show_viewport = state
 
-    def mirror_normals(self, bm, mirror_obj, loop_data, axis, debug=False):
-        mirror_loops = self.pair_loops(bm, mirror_obj, loop_data["indices"], debug=debug)
+        return base_meshes
 
-        new_loop_normals = self.create_loop_normals(loop_data["normals"], mirror_loops, axis)
+    def get_loop_normals(self, mesh):
+        mesh.calc_normals_split()
 
-        mirror_obj.data.calc_normals_split()
-        mirror_obj.data.normals_split_custom_set(new_loop_normals)
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.loops.foreach_get('normal', normals)
+        normals = normals.reshape(-1, 3)
 
-    def create_loop_normals(self, orig_loop_normals, mirror_loops, axis):
-        new_loop_normals = []
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
 
-        for idx in range(len(orig_loop_normals)):
-            nrm = orig_loop_normals[mirror_loops[idx]]
+    def get_face_vert_keys(self, mesh):
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
 
-            new_loop_normals.append(nrm.reflect(axis_mapping_dict[axis]))
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int64)
+        mesh.polygons.foreach_get('loop_total', loop_total)
 
-        return new_loop_normals
+        loop_faces = np.repeat(np.arange(len(mesh.polygons), dtype=np.int64), loop_total)
 
-    def pair_loops(self, bm, obj, orig_loop_indices, debug=False):
-        loop_index_update(bm)
+        return loop_faces * len(mesh.vertices) + loop_verts
 
-        mirror_loops = {}
-
-        for face in bm.faces:
-            if debug:
-                print("face:", face.index)
-
-            for loop in face.loops:
-                if debug:
-                    print(" • vert:", loop.vert.index, "loop:", loop.index)
-                    print("  • original loop:", orig_loop_indices[(face.index, loop.vert.index)])
-                mirror_loops[loop.index] = orig_loop_indices[(face.index, loop.vert.index)]
-
-        bm.to_mesh(obj.data)
-        bm.clear()
-
-        return mirror_loops
-
-    def apply_transformation(self, obj, axis):
-        mx_world = obj.matrix_world.copy()
-        mx_scale = mathutils.Matrix.Scale(-1, 4)
-
-        mx_rotation = mathutils.Matrix.Rotation(math.radians(180), 4, axis)
-
-        obj.matrix_world = mx_world @ mx_rotation @ mx_scale @ mx_world.inverted_safe() @ mx_world
+    def mirror_object(self, obj, target, base, axes, mirrormodname, remove_data_transfers=False):
+        targetmx = target.matrix_world
 
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
+        mir = obj.copy()
+        mir.data = base.copy()
 
-        for v in bm.verts:
-            v.co = mx_rotation @ mx_scale @ v.co
+        for col in obj.users_collection:
+            col.objects.link(mir)
 
-        for f in bm.faces:
-            f.normal_flip()
+        mod = mir.modifiers.get(mirrormodname)
 
-        return bm
+        if mod:
+            mir.modifiers.remove(mod)
 
-    def mirror_object(self, obj, target, loop_data, axis, mirrormodname, debug=False):
-        targetmx = target.matrix_world
+        if remove_data_transfers:
+            for mod in [mod for mod in mir.modifiers if mod.type == "DATA_TRANSFER"]:
+                mir.modifiers.remove(mod)
 
-        mir = obj.copy()
-        mir.data = obj.data.copy()
+        mir_mx = Matrix.Diagonal([-1 if axis in axes else 1 for axis in "XYZ"] + [1])
 
-        for col in obj.users_collection:
-            col.objects.link(mir)
+        mir.matrix_world = targetmx @ mir_mx @ targetmx.inverted_safe() @ obj.matrix_world @ mir_mx
 
-        bpy.context.view_layer.objects.active = mir
+        return mir
 
-        if mir.modifiers.get(mirrormodname):
-            bpy.ops.object.modifier_remove(modifier=mirrormodname)
+    def mirror_mesh(self, mesh, axes, loop_normals, uvs, uvoffsets, debug=False):
+        flip = np.array([-1 if axis in axes else 1 for axis in "XYZ"], dtype=np.float32)
 
-        if self.apply_data_transfers:
-            data_transfers = [mod for mod in mir.modifiers if mod.type == "DATA_TRANSFER"]
-            subds = [mod for mod in mir.modifiers if mod.type == "SUBSURF"]
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coords)
+        mesh.vertices.foreach_set('co', (coords.reshape(-1, 3) * flip).ravel())
 
-            if not subds:
-                for d in data_transfers:
-                    bpy.ops.object.modifier_apply(modifier=d.name)
+        remap = None
 
-            self.custom_normals = mir.data.has_custom_normals
+        if len(axes) % 2:
+            keys = self.get_face_vert_keys(mesh)
 
-            if self.custom_normals:
-                loop_data = self.get_loop_data(mir, debug=debug)
+            mesh.flip_normals()
 
-        mir_mx = mathutils.Matrix.Scale(-1, 4, axis_mapping_dict[axis])
+            remap = np.empty(len(keys), dtype=np.int64)
+            remap[np.argsort(self.get_face_vert_keys(mesh))] = np.argsort(keys)
 
-        mir.matrix_world = targetmx @ mir_mx @ targetmx.inverted_safe() @ mir.matrix_world
+        if any(uvs):
+            self.mirror_uvs(mesh, *uvs, *uvoffsets, count=len(axes))
 
-        return mir, loop_data
+        mesh.update()
 
-    def get_loop_data(self, obj, debug=False):
-        obj.data.calc_normals_split()
+        if loop_normals is not None:
+            normals = loop_normals[remap] if remap is not None else loop_normals
 
-        loop_normals = []
-        for idx, loop in enumerate(obj.data.loops):
-            loop_normals.append(loop.normal.normalized())  # normalize them, or you will run into weird issues at the end!
             if debug:
-                print(idx, loop.normal)
+                print("mirrored", len(normals), "loop normals across", axes)
 
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
+            mesh.calc_normals_split()
+            mesh.normals_split_custom_set(normals * flip)
 
-        loop_indices = {}
-        for face in bm.faces:
-            if debug:
-                print("face:", face.index)
-            for loop in face.loops:
-                if debug:
-                    print(" • vert:", loop.vert.index, "loop:", loop)
+    def mirror_uvs(self, mesh, umirror, vmirror, uoffset=0, voffset=0, count=1):
+        uvs = mesh.uv_layers.active
 
-                loop_indices[(face.index, loop.vert.index)] = loop.index
+        if uvs and len(mesh.loops):
+            coords = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+            uvs.data.foreach_get('uv', coords)
+            coords = coords.reshape(-1, 2)
 
-        bm.clear()
+            flip = np.array([-1 if umirror else 1, -1 if vmirror else 1], dtype=np.float32)
 
-        loop_data = {}
-        loop_data["normals"] = loop_normals
-        loop_data["indices"] = loop_indices
+            for _ in range(count):
+                flipped = coords * flip
+                coords = flipped + (coords.min(axis=0) - flipped.min(axis=0)) + (uoffset, voffset)
 
-        return loop_data
+            uvs.data.foreach_set('uv', coords.ravel())
@@ -3,21 +3,22 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. items import fuse_method_items, handle_method_items, tension_preset_items
 from .. utils.graph import build_mesh_graph
-from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.selection import get_sweeps_from_fillet, get_2_rails_from_chamfer
 from .. utils.sweep import init_sweeps, debug_sweeps
 from .. utils.loop import get_loops
 from .. utils.handle import create_loop_intersection_handles, create_face_intersection_handles
 from .. utils.tool import unfuse, change_width, fuse_surface, create_splines, set_sweep_sharps_and_bweights, clear_rail_sharps_and_bweights
 from .. utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.math import average_locations
 from .. utils.property import step_enum
 from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_lines
+from .. utils.session import FuseSession
 from .. utils.developer import output_traceback
 from .. utils.registration import get_prefs, get_addon
 
-class Refuse(bpy.types.Operator):
+class Refuse(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.refuse"
     bl_label = "MACHIN3: Refuse"
     bl_description = "Edit Fillets by using Unfuse + Fuse in sequence"
@@ -135,7 +136,7 @@ class Refuse(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'R', 'S', 'F', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'A', 'P']
+        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'R', 'S', 'F', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'A', 'P', 'TIMER']
 
         if any([self.allowmodalwidth, self.allowmodaltension]):
             events.append('MOUSEMOVE')
@@ -222,16 +223,13 @@ class Refuse(bpy.types.Operator):
                 self.force_projected_loop = not self.force_projected_loop
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
                     return {'FINISHED'}
             except Exception as e:
-                self.finish()
-
-                if bpy.context.mode == 'OBJECT':
-                    bpy.ops.object.mode_set(mode='EDIT')
+                self.cancel_modal()
 
                 output_traceback(self, e)
                 return {'FINISHED'}
@@ -241,6 +239,8 @@ class Refuse(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
@@ -258,20 +258,24 @@ class Refuse(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.DEBUG, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
+
+        if self.session:
+            self.session.finish()
 
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
+        if self.session:
+            self.session.finish()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.width = 0
         self.reverse = False
         self.force_projected_loop = False
@@ -280,10 +284,11 @@ class Refuse(bpy.types.Operator):
         self.loops = []
         self.handles = []
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
+
+        self.session = None
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -293,8 +298,7 @@ class Refuse(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
+            self.cancel_modal(removeHUD=False)
 
             output_traceback(self, e)
             return {'FINISHED'}
@@ -305,17 +309,26 @@ class Refuse(bpy.types.Operator):
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
         self.DEBUG = bpy.types.SpaceView3D.draw_handler_add(self.draw_DEBUG, (context, ), 'WINDOW', 'POST_VIEW')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
@@ -325,101 +338,157 @@ class Refuse(bpy.types.Operator):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
         if modal:
-            self.initbm.to_mesh(active.data)
+            if not self.session:
+                unfusedbm = self.snapshot.copy()
+                faces = self.unfuse_fillet(unfusedbm, active, debug=debug)
 
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+                if not faces:
+                    unfusedbm.free()
+
+                    self.snapshot.restore()
+                    update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+                    return False
+
+                self.session = FuseSession(unfusedbm)
+
+            if self.segments == 0:
+                self.snapshot.restore(self.session.initbm)
+                update_edit_bmesh(active.data)
+                return True
+
+            cached = self.session.is_cached(self.get_session_key())
+
+            if cached:
+                bm, faces, rails, sweeps = self.session.restore()
+                self.cyclic = self.session.cyclic
+
+            else:
+                bm = self.session.get_base()
+                faces = [f for f in bm.faces if f.select]
+
+        else:
+            cached = False
+
+            bm = get_edit_bmesh(active.data)
+
+            faces = self.unfuse_fillet(bm, active, debug=debug)
+
+            if not faces:
+                self.snapshot.restore()
+                update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+                return False
+
+            if self.segments == 0:
+                update_edit_bmesh(active.data)
+                return True
 
         bw = ensure_custom_data_layers(bm)[1]
 
-        mg = build_mesh_graph(bm, debug=debug)
-        verts = [v for v in bm.verts if v.select]
-        initial_faces = [f for f in bm.faces if f.select]
+        self.single = True if len(faces) == 1 else False
 
-        initial_sweeps = get_sweeps_from_fillet(bm, mg, verts, initial_faces, debug=debug)
+        if not cached:
+            mg = build_mesh_graph(bm, selected=True, debug=debug)
+            chamfer_verts = [v for v in bm.verts if v.select]
 
-        if initial_sweeps:
+            ret = get_2_rails_from_chamfer(bm, mg, chamfer_verts, faces, reverse=self.reverse, debug=debug)
 
-            if self.init:
-                self.init = False
-                self.segments = len(initial_sweeps) - 2
+            if not ret:
+                if modal:
+                    self.snapshot.restore(bm)
+                    bm.free()
 
-                self.smooth = True if any(f.smooth for f in initial_faces) else False
+                update_edit_bmesh(active.data)
+                return True
 
-                self.init_panel_decal(active)
+            rails, self.cyclic = ret
+            sweeps = None
+
+            if self.method == "FUSE":
+                sweeps = init_sweeps(bm, active, rails, debug=debug)
+                get_loops(bm, bw, faces, sweeps, force_projected=self.force_projected_loop, debug=debug)
+
+            if modal:
+                self.session.store(bm, self.get_session_key(), faces=faces, rails=rails, sweeps=sweeps, cyclic=self.cyclic)
+
+                bm, faces, rails, sweeps = self.session.restore()
+                bw = ensure_custom_data_layers(bm)[1]
+
+        if self.method == "FUSE":
+            if self.width != 0:
+                change_width(bm, sweeps, self.width, debug=debug)
 
-            faces = unfuse(bm, initial_faces, initial_sweeps, debug=debug)
+            handlekey = (self.handlemethod, self.tension, self.average, self.width)
 
-            bm.to_mesh(active.data)
+            if not (modal and self.session.get_handles(sweeps, handlekey)):
+                if self.handlemethod == "FACE":
+                    create_face_intersection_handles(bm, sweeps, tension=self.tension, average=self.average, debug=debug)
+                elif self.handlemethod == "LOOP":
+                    create_loop_intersection_handles(bm, sweeps, self.tension, debug=debug)
 
-            if faces:
-                if self.segments == 0:
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    return True
+                if modal:
+                    self.session.store_handles(sweeps, handlekey)
 
-                self.single = True if len(faces) == 1 else False
+            if bpy.context.scene.MM.debug:
+                debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
 
-                mg = build_mesh_graph(bm, debug=debug)
-                chamfer_verts = [v for v in bm.verts if v.select]
+            spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
 
-                ret = get_2_rails_from_chamfer(bm, mg, chamfer_verts, faces, reverse=self.reverse, debug=debug)
+            self.clean_up(bm, sweeps, faces, debug=debug)
 
-                if ret:
-                    rails, self.cyclic = ret
+            fuse_surface(bm, spline_sweeps, self.smooth, self.capholes, self.capdissolveangle, self.cyclic, debug=debug)
 
-                    if self.method == "FUSE":
-                        sweeps = init_sweeps(bm, active, rails, debug=debug)
-                        get_loops(bm, bw, faces, sweeps, force_projected=self.force_projected_loop, debug=debug)
+            set_sweep_sharps_and_bweights(bm, bw, sweeps, spline_sweeps)
+            clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic)
 
-                        if self.width != 0:
-                            change_width(bm, sweeps, self.width, debug=debug)
+        elif self.method == "BRIDGE":
+            if bpy.context.scene.MM.debug:
+                self.loops.clear()
+                self.handles.clear()
 
-                        if self.handlemethod == "FACE":
-                            create_face_intersection_handles(bm, sweeps, tension=self.tension, average=self.average, debug=debug)
-                        elif self.handlemethod == "LOOP":
-                            create_loop_intersection_handles(bm, sweeps, self.tension, debug=debug)
+            for f in bm.faces:
+                f.select = False
 
-                        if bpy.context.scene.MM.debug:
-                            debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
+            bmesh.ops.delete(bm, geom=faces, context='FACES')
 
-                        spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
+            clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic, select=True)
 
-                        self.clean_up(bm, sweeps, faces, debug=debug)
+        # modal runs work on session copies of the snapshot region, that replace it in the edit mesh in one go
+        if modal:
+            self.snapshot.restore(bm)
+            bm.free()
 
-                        fuse_surface(bm, spline_sweeps, self.smooth, self.capholes, self.capdissolveangle, self.cyclic, debug=debug)
+        update_edit_bmesh(active.data)
 
-                        set_sweep_sharps_and_bweights(bm, bw, sweeps, spline_sweeps)
-                        clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic)
+        if self.method == "BRIDGE":
+            bpy.ops.mesh.bridge_edge_loops(number_cuts=self.segments, smoothness=self.tension, interpolation='SURFACE')
 
-                    elif self.method == "BRIDGE":
-                        if bpy.context.scene.MM.debug:
-                            self.loops.clear()
-                            self.handles.clear()
+        return True
 
-                        for f in bm.faces:
-                            f.select = False
+    def unfuse_fillet(self, bm, active, debug=False):
+        bm.normal_update()
+        bm.verts.ensure_lookup_table()
 
-                        bmesh.ops.delete(bm, geom=faces, context='FACES')
+        mg = build_mesh_graph(bm, selected=True, debug=debug)
+        verts = [v for v in bm.verts if v.select]
+        initial_faces = [f for f in bm.faces if f.select]
 
-                        clear_rail_sharps_and_bweights(bm, bw, rails, self.cyclic, select=True)
+        initial_sweeps = get_sweeps_from_fillet(bm, mg, verts, initial_faces, debug=debug)
 
-                bm.to_mesh(active.data)
+        if initial_sweeps:
 
-                bpy.ops.object.mode_set(mode='EDIT')
+            if self.init:
+                self.init = False
+                self.segments = len(initial_sweeps) - 2
 
-                if self.method == "BRIDGE":
-                    bpy.ops.mesh.bridge_edge_loops(number_cuts=self.segments, smoothness=self.tension, interpolation='SURFACE')
+                self.smooth = True if any(f.smooth for f in initial_faces) else False
 
-                return True
+                self.init_panel_decal(active)
 
-        bpy.ops.object.mode_set(mode='EDIT')
+            return unfuse(bm, initial_faces, initial_sweeps, debug=debug)
 
-        return False
+    def get_session_key(self):
+        return (self.method, self.reverse, self.force_projected_loop)
 
     def init_panel_decal(self, active):
         if self.decalmachine and active.DM.decaltype == "PANEL":
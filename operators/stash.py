@@ -4,9 +4,8 @@ import bmesh
 from .. utils.ui import draw_init, draw_title, draw_prop, draw_text, init_cursor, update_HUD_location
 from .. utils.ui import init_status, finish_status, init_timer_modal, set_countdown, get_timer_progress
 from .. utils.property import step_collection
-from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash
-from .. utils.mesh import get_coords
-from .. utils.draw import draw_mesh_wire, draw_region_border
+from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash, remove_stash_obj, make_stash_mesh_unique, get_mesh_hash, rehydrate_stash, invalidate_stash_index
+from .. utils.draw import draw_mesh_wire, draw_region_border, get_wire_batch, get_stash_batch, clear_stash_batches
 from .. utils.object import update_local_view
 from .. utils.registration import get_prefs
 from .. utils.scene import set_cursor
@@ -74,9 +73,9 @@ class CreateStash(bpy.types.Operator):
             if self.is_partial:
                 alpha *= 2
 
-            for batch in self.batches:
+            for batch, mx in self.batches:
                 color = light_blue if self.is_partial else green if self.is_self_stash else red if self.remove_sources else yellow
-                draw_mesh_wire(batch, color=color, alpha=alpha)
+                draw_mesh_wire(batch, mx=mx, color=color, alpha=alpha)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -148,8 +147,7 @@ class CreateStash(bpy.types.Operator):
         self.batches = []
 
         for stash in self.stashes:
-            coords, indices = get_coords(stash.obj.data, mx=stash.obj.matrix_world, indices=True)
-            self.batches.append((coords, indices))
+            self.batches.append((get_wire_batch(stash.obj.data), stash.obj.matrix_world.copy()))
 
         init_cursor(self, event)
 
@@ -286,7 +284,7 @@ class ViewStashes(bpy.types.Operator):
             if not self.editing:
                 if self.batch:
                     clear = self.clear_all or self.stash.mark_delete
-                    draw_mesh_wire(self.batch, color=red if clear else white, width=2 if clear else 1, xray=self.xray, alpha=self.alpha)
+                    draw_mesh_wire(self.batch, mx=self.active.matrix_world, color=red if clear else white, width=2 if clear else 1, xray=self.xray, alpha=self.alpha)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -366,6 +364,8 @@ class ViewStashes(bpy.types.Operator):
 
                 if self.clear_all:
                     self.active.MM.stashes.clear()
+                    invalidate_stash_index(self.active)
+
                     bpy.ops.outliner.orphans_purge()
 
                 else:
@@ -430,8 +430,9 @@ class ViewStashes(bpy.types.Operator):
             context.space_data.overlay.show_wireframes = False
 
         if self.stash.obj:
+            rehydrate_stash(self.stash.obj)
             offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-            self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+            self.batch = get_stash_batch(self.stash, offset=offset)
 
         init_cursor(self, event)
 
@@ -462,11 +463,15 @@ class ViewStashes(bpy.types.Operator):
             bpy.ops.view3d.localview(frame_selected=False)
 
         self.stash.obj.update_from_editmode()
+        self.stash.obj.MM.stashhash = get_mesh_hash(self.stash.obj.data, vertex_groups=bool(self.stash.obj.vertex_groups))
+        clear_stash_batches(self.stash.uuid)
+
+        rehydrate_stash(self.stash.obj)
         offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-        self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+        self.batch = get_stash_batch(self.stash, offset=offset)
 
         from .. import handlers
-        handlers.oldstashesuuid = None
+        handlers.oldstashuuid = None
 
         if self.mode == 'EDIT':
             bpy.ops.object.mode_set(mode='EDIT')
@@ -474,6 +479,8 @@ class ViewStashes(bpy.types.Operator):
     def enter_stash_edit_mode(self, context):
         self.editing = True
 
+        make_stash_mesh_unique(self.stash.obj)
+
         context.collection.objects.link(self.stash.obj)
 
         if self.stash.obj.matrix_world != self.active.matrix_world:
@@ -498,8 +505,9 @@ class ViewStashes(bpy.types.Operator):
 
     def update_batch(self):
         if self.stash.obj:
+            rehydrate_stash(self.stash.obj)
             offset = sum([d for d in self.stash.obj.dimensions]) / 3 * self.normal_offset
-            self.batch = get_coords(self.stash.obj.data, mx=self.active.matrix_world, offset=offset, indices=True)
+            self.batch = get_stash_batch(self.stash, offset=offset)
 
         else:
             self.batch = None
@@ -599,9 +607,9 @@ class ViewOrphanStashes(bpy.types.Operator):
 
     def draw_VIEW3D(self, context):
         if context.area == self.area:
-            for idx, batch in enumerate(self.batches):
+            for idx, (batch, mx) in enumerate(self.batches):
                 clear = self.clear_all or self.mark_delete[idx]
-                draw_mesh_wire(batch, color=red if clear else white, width=2 if clear else 1, xray=self.xray, alpha=0.5 if idx == self.idx else 0.1 if clear else 0.05)
+                draw_mesh_wire(batch, mx=mx, color=red if clear else white, width=2 if clear else 1, xray=self.xray, alpha=0.5 if idx == self.idx else 0.1 if clear else 0.05)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -657,7 +665,7 @@ class ViewOrphanStashes(bpy.types.Operator):
 
             if objects:
                 for obj in objects:
-                    bpy.data.meshes.remove(obj.data, do_unlink=True)
+                    remove_stash_obj(obj)
 
                 bpy.ops.outliner.orphans_purge()
 
@@ -690,7 +698,7 @@ class ViewOrphanStashes(bpy.types.Operator):
     def invoke(self, context, event):
         self.clear_all = False
         self.orphans = [obj for obj in bpy.data.objects if obj.MM.isstashobj and obj.use_fake_user and obj.users == 1]
-        self.batches = [(get_coords(obj.data, mx=obj.MM.stashorphanmx, offset=sum([d for d in obj.dimensions]) / 3 * self.normal_offset, indices=True)) for obj in self.orphans]
+        self.batches = [(get_wire_batch(obj.data, offset=sum([d for d in obj.dimensions]) / 3 * self.normal_offset), obj.MM.stashorphanmx.copy()) for obj in self.orphans]
         self.mark_delete = [False for obj in self.orphans]
         self.retrieved_name = ''
         self.retrieved = []
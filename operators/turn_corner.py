@@ -2,7 +2,7 @@ import bpy
 from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from ..utils.math import get_distance_between_verts, average_locations
-from ..utils.bmesh import ensure_custom_data_layers
+from ..utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from ..utils.tool import turn_corner
 from ..utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
 from ..utils.ui import init_status, finish_status
@@ -152,21 +152,17 @@ class TurnCorner(bpy.types.Operator):
     def cancel_modal(self):
         self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        context.object.update_from_editmode()
-
         self.count = 1
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(context.object.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -193,27 +189,26 @@ class TurnCorner(bpy.types.Operator):
         self.count = 1
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
         for i in range(self.count):
-            bm = bmesh.new()
-            bm.from_mesh(active.data)
-            bm.normal_update()
-            bm.verts.ensure_lookup_table()
+            bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal and i == 0 else None)
 
             bw = ensure_custom_data_layers(bm)[1]
 
@@ -234,9 +229,7 @@ class TurnCorner(bpy.types.Operator):
                     if self.bweights:
                         e[bw] = self.bweight
 
-            bm.to_mesh(active.data)
-
-        bpy.ops.object.mode_set(mode='EDIT')
+        update_edit_bmesh(active.data)
 
         if new_edges:
             return True
@@ -3,7 +3,7 @@ from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. items import handle_method_items
 from .. utils.graph import build_mesh_graph
-from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.selection import get_2_rails_from_chamfer, get_sweeps_from_fillet
 from .. utils.sweep import init_sweeps, debug_sweeps
 from .. utils.loop import get_loops
@@ -12,11 +12,11 @@ from .. utils.tool import unfuse, unchamfer_loop_intersection, unchamfer_face_in
 from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_lines
 from .. utils.developer import output_traceback
 from .. utils.ui import popup_message, draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.property import step_enum
 from .. utils.registration import get_addon
 
-class Unbevel(bpy.types.Operator):
+class Unbevel(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.unbevel"
     bl_label = "MACHIN3: Unbevel"
     bl_description = "Reconstruct hard edge from Bevel by using Unfuse + Unchamfer in sequence"
@@ -94,7 +94,7 @@ class Unbevel(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'S', 'B', 'W', 'R']
+        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'S', 'B', 'W', 'R', 'TIMER']
 
         if self.allowmodalslide:
             events.append('MOUSEMOVE')
@@ -143,16 +143,13 @@ class Unbevel(bpy.types.Operator):
                     self.allowmodalslide = not self.allowmodalslide
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
                     return {'FINISHED'}
             except Exception as e:
-                self.finish()
-
-                if bpy.context.mode == 'OBJECT':
-                    bpy.ops.object.mode_set(mode='EDIT')
+                self.cancel_modal()
 
                 output_traceback(self, e)
                 return {'FINISHED'}
@@ -162,6 +159,8 @@ class Unbevel(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
@@ -179,20 +178,18 @@ class Unbevel(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.DEBUG, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.slide = 0
         self.allowmodalslide = False
         self.init = True
@@ -200,8 +197,7 @@ class Unbevel(bpy.types.Operator):
         self.loops = []
         self.handles = []
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
         init_cursor(self, event)
 
@@ -212,8 +208,7 @@ class Unbevel(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
+            self.cancel_modal(removeHUD=False)
 
             output_traceback(self, e)
             return {'FINISHED'}
@@ -224,36 +219,37 @@ class Unbevel(bpy.types.Operator):
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
         self.DEBUG = bpy.types.SpaceView3D.draw_handler_add(self.draw_DEBUG, (context, ), 'WINDOW', 'POST_VIEW')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         bw = ensure_custom_data_layers(bm)[1]
 
-        initial_mg = build_mesh_graph(bm, debug=debug)
+        initial_mg = build_mesh_graph(bm, selected=True, debug=debug)
         initial_verts = [v for v in bm.verts if v.select]
         initial_faces = [f for f in bm.faces if f.select]
 
@@ -277,7 +273,7 @@ class Unbevel(bpy.types.Operator):
                         self.init_panel_decal(active)
 
                 verts = [v for v in bm.verts if v.select]
-                mg = build_mesh_graph(bm, debug=debug)
+                mg = build_mesh_graph(bm, selected=True, debug=debug)
 
                 ret = get_2_rails_from_chamfer(bm, mg, verts, faces, reverse=self.reverse, debug=debug)
                 if ret:
@@ -307,9 +303,7 @@ class Unbevel(bpy.types.Operator):
                     if double_verts:
                         set_sharps_and_bweights([e for e in bm.edges if e.select], bw, self.sharps, self.bweights, self.bweight)
 
-                        bm.to_mesh(active.data)
-
-                        bpy.ops.object.mode_set(mode='EDIT')
+                        update_edit_bmesh(active.data)
                         return True
 
                     else:
@@ -318,12 +312,11 @@ class Unbevel(bpy.types.Operator):
                         else:
                             popup_message(["Loop edges don't intersect."])
                 else:
-                    bm.to_mesh(active.data)
-
-                    bpy.ops.object.mode_set(mode='EDIT')
+                    update_edit_bmesh(active.data)
                     return True
 
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
 
         return False
 
@@ -5,13 +5,14 @@ from .. items import tension_preset_items
 from .. utils.graph import build_mesh_graph
 from .. utils.selection import get_vert_sequence, propagate_edge_loops
 from .. utils.tool import align_vert_sequence_to_spline
+from .. utils.bmesh import get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.ui import popup_message, draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
-from .. utils.ui import init_status, finish_status
+from .. utils.ui import init_status, finish_status, ScheduledModal
 from .. utils.math import average_locations
 from .. utils.developer import output_traceback
 from .. utils.registration import get_prefs
 
-class Unfuck(bpy.types.Operator):
+class Unfuck(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.unfuck"
     bl_label = "MACHIN3: Unf*ck"
     bl_description = "Align non-cyclic edge loop along bezier"
@@ -104,7 +105,7 @@ class Unfuck(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'M']
+        events = ['WHEELUPMOUSE', 'UP_ARROW', 'ONE', 'WHEELDOWNMOUSE', 'DOWN_ARROW', 'TWO', 'Y', 'Z', 'X', 'C', 'V', 'W', 'T', 'M', 'TIMER']
 
         if any([self.allowmodalwidth, self.allowmodaltension]):
             events.append('MOUSEMOVE')
@@ -171,7 +172,7 @@ class Unfuck(bpy.types.Operator):
                 self.allowmodaltension = not self.allowmodaltension
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
@@ -181,6 +182,9 @@ class Unfuck(bpy.types.Operator):
 
                 self.finish()
 
+                self.snapshot.restore()
+                update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
                 self.merge = False
                 return {'FINISHED'}
 
@@ -189,15 +193,16 @@ class Unfuck(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
             self.finish()
 
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(self.active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
             return {'CANCELLED'}
 
         self.last_mouse_x = event.mouse_x
@@ -209,19 +214,17 @@ class Unfuck(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.width = 0
         self.propagate = 0
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -232,17 +235,26 @@ class Unfuck(bpy.types.Operator):
         self.area = context.area
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
@@ -254,18 +266,10 @@ class Unfuck(bpy.types.Operator):
 
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        if modal:
-            self.initbm.to_mesh(active.data)
-
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        bm = get_edit_bmesh(active.data, snapshot=self.snapshot if modal else None)
 
         verts = [v for v in bm.verts if v.select]
-        mg = build_mesh_graph(bm)
+        mg = build_mesh_graph(bm, selected=True)
 
         seq = get_vert_sequence(bm, mg, verts, debug=debug)
 
@@ -282,8 +286,7 @@ class Unfuck(bpy.types.Operator):
                     for mvs in self.merge_verts:
                         bmesh.ops.remove_doubles(bm, verts=mvs, dist=0.00001)
 
-        bm.to_mesh(active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        update_edit_bmesh(active.data)
 
         if seq:
             return True
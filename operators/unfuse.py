@@ -2,13 +2,14 @@ import bpy
 from bpy.props import IntProperty, FloatProperty, BoolProperty, EnumProperty
 import bmesh
 from .. utils.graph import build_mesh_graph
-from .. utils.bmesh import ensure_custom_data_layers
+from .. utils.bmesh import ensure_custom_data_layers, get_edit_bmesh, update_edit_bmesh, RegionSnapshot
 from .. utils.selection import get_sweeps_from_fillet, get_2_rails_from_chamfer
 from .. utils.sweep import debug_sweeps
 from .. utils.tool import unfuse, set_rail_sharps_and_bweights
 from .. utils.ui import popup_message, draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, update_HUD_location
 from .. utils.ui import init_status, finish_status
 from .. utils.draw import vert_debug_print
+from .. utils.session import FuseSession
 from .. utils.developer import output_traceback
 from .. utils.registration import get_addon
 
@@ -106,24 +107,26 @@ class Unfuse(bpy.types.Operator):
 
         finish_status(self)
 
+        self.session.finish()
+
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
+
+        self.session.finish()
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.init = True
         self.decalmachine = get_addon("DECALmachine")[0]
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
+
+        self.session = FuseSession(self.snapshot.bm)
 
         init_cursor(self, event)
 
@@ -134,8 +137,7 @@ class Unfuse(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
+            self.cancel_modal(removeHUD=False)
 
             output_traceback(self, e)
             return {'FINISHED'}
@@ -151,30 +153,48 @@ class Unfuse(bpy.types.Operator):
     def execute(self, context):
         active = context.active_object
 
+        self.snapshot = RegionSnapshot(active.data)
+
         try:
             self.main(active)
         except Exception as e:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
             output_traceback(self, e)
 
+        self.snapshot.free()
+
         return {'FINISHED'}
 
     def main(self, active, modal=False):
         debug = True
         debug = False
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if modal and self.session.is_cached(()):
+            bm, _, chamfer_rails, _ = self.session.restore()
+            self.cyclic = self.session.cyclic
+
+            bw = ensure_custom_data_layers(bm)[1]
+
+            if chamfer_rails:
+                set_rail_sharps_and_bweights(bm, bw, chamfer_rails, self.cyclic, self.sharps, self.bweights, self.bweight)
+
+            self.snapshot.restore(bm)
+            bm.free()
+
+            update_edit_bmesh(active.data)
+            return True
 
         if modal:
-            self.initbm.to_mesh(active.data)
+            bm = self.session.get_base()
 
-        bm = bmesh.new()
-        bm.from_mesh(active.data)
-        bm.normal_update()
-        bm.verts.ensure_lookup_table()
+        else:
+            bm = get_edit_bmesh(active.data)
 
         bw = ensure_custom_data_layers(bm)[1]
 
-        mg = build_mesh_graph(bm, debug=debug)
+        mg = build_mesh_graph(bm, selected=True, debug=debug)
         verts = [v for v in bm.verts if v.select]
         faces = [f for f in bm.faces if f.select]
 
@@ -192,20 +212,37 @@ class Unfuse(bpy.types.Operator):
 
             if chamfer_faces:
                 chamfer_verts = [v for v in bm.verts if v.select]
-                chamfer_mg = build_mesh_graph(bm, debug=debug)
+                chamfer_mg = build_mesh_graph(bm, selected=True, debug=debug)
 
                 ret = get_2_rails_from_chamfer(bm, chamfer_mg, chamfer_verts, chamfer_faces, False, debug=debug)
 
                 if ret:
                     chamfer_rails, self.cyclic = ret
+
+                if modal:
+                    self.session.store(bm, (), faces=chamfer_faces, rails=chamfer_rails if ret else None, cyclic=self.cyclic)
+
+                    bm, _, chamfer_rails, _ = self.session.restore()
+                    bw = ensure_custom_data_layers(bm)[1]
+
+                if ret:
                     set_rail_sharps_and_bweights(bm, bw, chamfer_rails, self.cyclic, self.sharps, self.bweights, self.bweight)
 
-                bm.to_mesh(active.data)
+                # modal runs work on session copies of the snapshot region, that replace it in the edit mesh in one go
+                if modal:
+                    self.snapshot.restore(bm)
+                    bm.free()
 
-                bpy.ops.object.mode_set(mode='EDIT')
+                update_edit_bmesh(active.data)
                 return True
 
-        bpy.ops.object.mode_set(mode='EDIT')
+        if modal:
+            bm.free()
+
+        else:
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
         return False
 
     def init_panel_decal(self, active):
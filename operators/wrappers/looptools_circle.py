@@ -1,15 +1,15 @@
 import bpy
-import bmesh
 from bpy.props import BoolProperty, FloatProperty, EnumProperty
 from mathutils import Vector
 from ... utils.developer import output_traceback
+from ... utils.bmesh import update_edit_bmesh, RegionSnapshot
 from ... utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
-from ... utils.ui import init_status, finish_status
+from ... utils.ui import init_status, finish_status, ScheduledModal
 from ... utils.property import step_enum
 from ... utils.math import average_locations, get_irregular_circle_center
 from ... items import looptools_circle_method
 
-class LoopToolsCircle(bpy.types.Operator):
+class LoopToolsCircle(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.looptools_circle"
     bl_label = "MACHIN3: LoopTools Circle"
     bl_description = "LoopTools' Circle as a modal"
@@ -59,7 +59,7 @@ class LoopToolsCircle(bpy.types.Operator):
             wrap_cursor(self, context, event)
             update_HUD_location(self, event)
 
-        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'C', 'W', 'I', 'F', 'R', 'X']
+        events = ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'C', 'W', 'I', 'F', 'R', 'X', 'TIMER']
 
         if any([self.allowmodalradius, self.allowmodalinfluence]):
             events.append('MOUSEMOVE')
@@ -121,7 +121,7 @@ class LoopToolsCircle(bpy.types.Operator):
                 self.fix_midpoint = not self.fix_midpoint
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
@@ -141,6 +141,8 @@ class LoopToolsCircle(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
@@ -157,26 +159,23 @@ class LoopToolsCircle(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
         self.fix_midpoint = False
 
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data)
 
-        verts = [v for v in self.initbm.verts if v.select]
+        verts = [v for v in self.snapshot.bm.verts if v.select]
 
         avg_center = average_locations([v.co for v in verts])
 
@@ -184,7 +183,7 @@ class LoopToolsCircle(bpy.types.Operator):
 
         self.circle_offset = circle_center - avg_center if circle_center else Vector()
 
-        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.initbm.verts if v.select]))
+        self.factor = get_zoom_factor(context, self.active.matrix_world @ average_locations([v.co for v in self.snapshot.bm.verts if v.select]))
 
         init_cursor(self, event)
 
@@ -195,9 +194,6 @@ class LoopToolsCircle(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
-
             output_traceback(self, e)
             return {'FINISHED'}
 
@@ -206,14 +202,15 @@ class LoopToolsCircle(bpy.types.Operator):
         self.area = context.area
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def main(self, active, modal=False):
         if modal:
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
 
         bpy.ops.mesh.looptools_circle(custom_radius=self.custom_radius, fit=self.method, flatten=self.flatten, influence=self.influence, lock_x=self.lock_x, lock_y=self.lock_y, lock_z=self.lock_z, radius=self.radius, regular=self.regular)
 
@@ -1,13 +1,13 @@
 import bpy
-import bmesh
 from bpy.props import BoolProperty, FloatProperty, EnumProperty
 from ... utils.developer import output_traceback
+from ... utils.bmesh import update_edit_bmesh, RegionSnapshot
 from ... utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, update_HUD_location
-from ... utils.ui import init_status, finish_status
+from ... utils.ui import init_status, finish_status, ScheduledModal
 from ... utils.property import step_enum
 from ... items import looptools_relax_input_items, looptools_relax_interpolation_items, looptools_relax_iterations_items
 
-class LoopToolsRelax(bpy.types.Operator):
+class LoopToolsRelax(ScheduledModal, bpy.types.Operator):
     bl_idname = "machin3.looptools_relax"
     bl_label = "MACHIN3: LoopTools Relax"
     bl_description = "LoopTools's Relax as a modal"
@@ -40,7 +40,7 @@ class LoopToolsRelax(bpy.types.Operator):
         if event.type == 'MOUSEMOVE':
             update_HUD_location(self, event)
 
-        if event.type in ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'R']:
+        if event.type in ['WHEELUPMOUSE', 'ONE', 'WHEELDOWNMOUSE', 'TWO', 'R', 'TIMER']:
 
             if event.type in {'WHEELUPMOUSE', 'ONE'} and event.value == 'PRESS':
                 if event.ctrl:
@@ -66,7 +66,7 @@ class LoopToolsRelax(bpy.types.Operator):
                 self.regular = not self.regular
 
             try:
-                ret = self.main(self.active, modal=True)
+                ret = self.run_main(event, self.active)
 
                 if not ret:
                     self.finish()
@@ -85,6 +85,8 @@ class LoopToolsRelax(bpy.types.Operator):
             return {'PASS_THROUGH'}
 
         elif event.type in {'LEFTMOUSE', 'SPACE'}:
+            self.flush_main(self.active)
+
             self.finish()
             return {'FINISHED'}
 
@@ -98,22 +100,19 @@ class LoopToolsRelax(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
 
         finish_status(self)
+        self.finish_scheduler()
 
     def cancel_modal(self, removeHUD=True):
         if removeHUD:
             self.finish()
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        self.initbm.to_mesh(self.active.data)
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.snapshot.restore()
+        update_edit_bmesh(self.active.data, destructive=self.snapshot.destructive)
 
     def invoke(self, context, event):
         self.active = context.active_object
 
-        self.active.update_from_editmode()
-
-        self.initbm = bmesh.new()
-        self.initbm.from_mesh(self.active.data)
+        self.snapshot = RegionSnapshot(self.active.data, full=True)
 
         init_cursor(self, event)
 
@@ -124,9 +123,6 @@ class LoopToolsRelax(bpy.types.Operator):
                 self.cancel_modal(removeHUD=False)
                 return {'FINISHED'}
         except Exception as e:
-            if bpy.context.mode == 'OBJECT':
-                bpy.ops.object.mode_set(mode='EDIT')
-
             output_traceback(self, e)
             return {'FINISHED'}
 
@@ -135,14 +131,15 @@ class LoopToolsRelax(bpy.types.Operator):
         self.area = context.area
         self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (context, ), 'WINDOW', 'POST_PIXEL')
 
+        self.init_scheduler(context)
+
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
     def main(self, active, modal=False):
         if modal:
-            bpy.ops.object.mode_set(mode='OBJECT')
-            self.initbm.to_mesh(active.data)
-            bpy.ops.object.mode_set(mode='EDIT')
+            self.snapshot.restore()
+            update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
 
         bpy.ops.mesh.looptools_relax(input=self.input, interpolation=self.interpolation, iterations=self.iterations, regular=self.regular)
 
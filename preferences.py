@@ -60,6 +60,9 @@ class MESHmachinePreferences(bpy.types.AddonPreferences):
 
     matcap: StringProperty(name="Normal Transfer Matcap", default="toon.exr", update=update_matcap)
     experimental: BoolProperty(name="Experimental Features", default=False)
+    stash_archive: BoolProperty(name="Archive Stashes", description="On Save, store Stash Geometry in a compressed Sidecar Folder next to the blend file, and only load it back when a Stash is used", default=False)
+    snap_cache_size: IntProperty(name="Snap Cache Size", description="Memory in MB used to keep evaluated Snapping Meshes between Tool Invocations, 0 to disable", default=256, min=0)
+    snapshot_rings: IntProperty(name="Snapshot Rings", description="Rings of neighbouring Faces around the Selection, that modal Tools record to restore the Mesh on each Step and on Cancel", default=2, min=1)
 
     assetspath: StringProperty(name="Plug Libraries", subtype='DIR_PATH', default=os.path.join(path, "assets", "Plugs"))
     pluglibsCOL: CollectionProperty(type=PlugLibsCollection)
@@ -210,6 +213,27 @@ class MESHmachinePreferences(bpy.types.AddonPreferences):
 
         draw_split_row(self, column, 'symmetrize_flick_distance', label="Flick Distance")
 
+        b = box.box()
+        b.label(text="Stashes")
+
+        column = b.column()
+
+        draw_split_row(self, column, 'stash_archive', label="Archive Stash Geometry to <blendname>_stashes folder on Save", info="Keep the folder with the blend file!")
+
+        b = box.box()
+        b.label(text="Snapping")
+
+        column = b.column()
+
+        draw_split_row(self, column, 'snap_cache_size', label="Memory in MB to keep Snapping Meshes between Wedge and Plug invocations", info="Set to 0 to disable")
+
+        b = box.box()
+        b.label(text="Modal Tools")
+
+        column = b.column()
+
+        draw_split_row(self, column, 'snapshot_rings', label="Rings of Faces around the Selection, that are recorded to restore the Mesh between Steps", info="Tools with Reach extend this as needed")
+
         b = box.box()
         b.label(text="Experimental")
 
@@ -274,6 +298,7 @@ class MESHmachinePreferences(bpy.types.AddonPreferences):
         col.separator()
         col.operator("machin3.clear_plug_libraries", text="", icon="LOOP_BACK")
         col.operator("machin3.reload_plug_libraries", text="", icon_value=get_icon("refresh"))
+        col.operator("machin3.render_plug_library_thumbnails", text="", icon="RENDER_STILL")
         col.separator()
         col.operator("machin3.open_plug_library", text="", icon="FILE_FOLDER")
         col.operator("machin3.rename_plug_library", text="", icon="OUTLINER_DATA_FONT")
@@ -63,15 +63,20 @@ class MeshSceneProperties(bpy.types.PropertyGroup):
     revision: StringProperty()
 
 class MeshObjectProperties(bpy.types.PropertyGroup):
+    def update_active_stash_idx(self, context):
+        from . utils.stash import invalidate_stash_index
+        invalidate_stash_index(self.id_data)
 
     stashes: CollectionProperty(type=StashCollection)
-    active_stash_idx: IntProperty()
+    active_stash_idx: IntProperty(update=update_active_stash_idx)
 
     stashuuid: StringProperty(name="stash uuid")
     isstashobj: BoolProperty(name="is stash object", default=False)
     stashdeltamx: FloatVectorProperty(name="Delta Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashorphanmx: FloatVectorProperty(name="Orphan Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashname: StringProperty(name="stash name")
+    stashhash: StringProperty(name="stash mesh hash")
+    stasharchive: StringProperty(name="stash archive file")
 
     stashmx: FloatVectorProperty(name="Stash Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
     stashtargetmx: FloatVectorProperty(name="Target Matrix", subtype="MATRIX", size=16, default=flatten_matrix(Matrix()))
@@ -10,6 +10,7 @@ classes = {'CORE': [('ui.UILists', [('PlugLibsUIList', ''),
                     ('ui.operators.libraries', [('Move', 'move_plug_library'),
                                                 ('Clear', 'clear_plug_library'),
                                                 ('Reload', 'reload_plug_libraries'),
+                                                ('RenderThumbnails', 'render_plug_library_thumbnails'),
                                                 ('Add', 'add_plug_library'),
                                                 ('Open', 'open_plug_library'),
                                                 ('Rename', 'rename_plug_library'),
@@ -58,7 +59,8 @@ classes = {'CORE': [('ui.UILists', [('PlugLibsUIList', ''),
                                             ('ViewOrphanStashes', 'view_orphan_stashes')]),
                        ('ui.operators.stash', [('RemoveStash', 'remove_stash'),
                                                ('SwapStash', 'swap_stash'),
-                                               ('SweepStashes', 'sweep_stashes')]),
+                                               ('SweepStashes', 'sweep_stashes'),
+                                               ('ReportStashes', 'report_stashes')]),
                        ('operators.draw.draw_transferred_stashes', [('DrawTransferredStashes', 'draw_transferred_stashes')])],
 
            'CONFORM': [('operators.conform', [('Conform', 'conform')])],
@@ -107,6 +109,8 @@ classes = {'CORE': [('ui.UILists', [('PlugLibsUIList', ''),
 
            'DEBUG': [('operators.debug', [('GetAngle', 'get_angle'),
                                           ('GetLength', 'get_length'),
+                                          ('BenchmarkSplines', 'benchmark_splines'),
+                                          ('BenchmarkTopology', 'benchmark_topology'),
                                           ('DrawDebug', 'draw_debug'),
                                           ('DebugHUD', 'debug_hud'),
                                           ('DebugToggle', 'meshmachine_debug')])],
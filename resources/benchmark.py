@@ -0,0 +1,51 @@
+import bpy
+import addon_utils
+import argparse
+import importlib
+import os
+import sys
+
+# runs headless, from within the installed add-on folder
+# blender -b --factory-startup --python benchmark.py -- [--output results.json] [--baseline baseline.json] [--tolerance 0.2] [--repeat 3] [--cases fuse refuse]
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="benchmark.py", description="Time MESHmachine's core tools on synthetic meshes")
+    parser.add_argument('--output', help="write the results to this json file")
+    parser.add_argument('--baseline', help="compare the results against this json file")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown relative to the baseline, 0.2 is 20%%")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per case, the median is compared")
+    parser.add_argument('--cases', nargs='*', help="only run these cases, for instance fuse refuse plug")
+
+    return parser.parse_args(sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else [])
+
+def get_addon():
+    name = os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    if not addon_utils.check(name)[1]:
+        addon_utils.enable(name, default_set=True)
+
+    return importlib.import_module(f"{name}.utils.benchmark")
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark = get_addon()
+
+    print("\nBenchmarking MESHmachine")
+    results = benchmark.run_benchmarks(bpy.context, names=args.cases, repeat=args.repeat)
+
+    if args.output:
+        benchmark.save_benchmarks(results, args.output)
+        print(" • Saved benchmark results to '%s'" % (args.output))
+
+    errors = [name for name, result in results['cases'].items() if 'error' in result]
+
+    if args.baseline:
+        print("\nComparing against '%s'" % (args.baseline))
+        regressions = benchmark.compare_benchmarks(results, benchmark.load_benchmarks(args.baseline), tolerance=args.tolerance)
+
+        if regressions:
+            print(" ! WARNING: %d case(s) are more than %d%% slower than the baseline" % (len(regressions), args.tolerance * 100))
+            sys.exit(1)
+
+    if errors:
+        sys.exit(1)
@@ -0,0 +1,92 @@
+import bpy
+import sys
+from mathutils import Matrix
+
+# runs headless in a separate Blender process, with Templates.blend loaded
+# blender -b Templates.blend --python thumbnail.py -- <plug blend> <icon path> [indicators]
+
+def get_mm(obj, prop):
+    mm = obj.get('MM')
+    return mm.get(prop, False) if mm else False
+
+def load_plug_objs(blendpath):
+    with bpy.data.libraries.load(blendpath) as (data_from, data_to):
+        data_to.objects = data_from.objects
+
+    plugobjs = [obj for obj in data_to.objects if obj]
+    handle = next((obj for obj in plugobjs if get_mm(obj, 'isplughandle')), None)
+
+    return plugobjs, handle
+
+def set_indicator(name, state):
+    obj = bpy.data.objects.get(name)
+
+    if obj:
+        obj.hide_render = not state
+
+    return obj
+
+def render(blendpath, iconpath, indicators):
+    scene = bpy.data.scenes.get('Thumbnail')
+
+    for obj in bpy.data.objects:
+        if "demo" in obj.name:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+    plugobjs, handle = load_plug_objs(blendpath)
+
+    if not handle:
+        print(f"WARNING: No plug handle found in '{blendpath}'")
+        sys.exit(1)
+
+    plugcol = bpy.data.collections.get('Plug')
+
+    for obj in plugobjs:
+        plugcol.objects.link(obj)
+
+    fillet = any(get_mm(obj, 'hasfillet') for obj in plugobjs if get_mm(obj, 'isplug'))
+    deformer = next((obj for obj in plugobjs if get_mm(obj, 'isplugdeformer')), None)
+    modtypes = [mod.type for obj in plugobjs if obj != handle for mod in obj.modifiers]
+    mods = "ARRAY" if "ARRAY" in modtypes else "HOOK" if "HOOK" in modtypes else None
+
+    handle.matrix_world = Matrix()
+    scene.view_layers['Plug'].update()
+
+    maxscale = 1.8
+    handlemaxdim = max(handle.dimensions)
+
+    handle.matrix_world = Matrix.Scale(maxscale / handlemaxdim, 4) @ handle.matrix_world
+
+    basemat = bpy.data.materials.get('base')
+
+    for layer in [scene.view_layers.get('Plug'), scene.view_layers.get('bg')]:
+        if not layer.material_override:
+            print(f"WARNING: Material Override is not set in view layer '{layer.name}'")
+            layer.material_override = basemat
+
+    if 'HUD' in indicators:
+        if 'FILLETorEDGE' in indicators:
+            set_indicator("HUD_FILLET", fillet)
+            set_indicator("HUD_EDGE", not fillet)
+
+        if 'HOOKorARRAY' in indicators and mods:
+            set_indicator("HUD_ARRAY", mods == "ARRAY")
+            set_indicator("HUD_HOOK", mods == "HOOK")
+
+        if 'DEFORMER' in indicators and deformer:
+            huddeformer = set_indicator("HUD_DEFORMER", True)
+
+            if huddeformer and get_mm(deformer, 'usedeformer'):
+                mat = bpy.data.materials.get("HUD.white.transparent")
+
+                if mat:
+                    huddeformer.material_slots[0].material = mat
+
+    scene.render.filepath = iconpath
+    scene.render.image_settings.file_format = 'PNG'
+
+    bpy.ops.render.render(write_still=True, scene=scene.name)
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index('--') + 1:]
+    render(args[0], args[1], args[2:])
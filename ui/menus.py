@@ -1,5 +1,5 @@
 import bpy
-from .. utils.registration import get_prefs, get_addon
+from .. utils.registration import get_prefs, get_addon, get_library_plug_count
 from .. utils.ui import get_keymap_item, get_icon
 from .. import bl_info
 
@@ -230,6 +230,10 @@ class MenuDebug(bpy.types.Menu):
         layout.operator("machin3.draw_debug", text="Draw Debug")
         layout.operator("machin3.debug_hud", text="debug HUD")
 
+        layout.separator()
+        layout.operator("machin3.benchmark_splines", text="Benchmark Splines")
+        layout.operator("machin3.benchmark_topology", text="Benchmark Topology")
+
 class MenuLoops(bpy.types.Menu):
     bl_idname = "MACHIN3_MT_mesh_machine_loops"
     bl_label = "Loops"
@@ -293,7 +297,6 @@ class MenuPlugLibraries(bpy.types.Menu):
         show_button_name = get_prefs().showplugbuttonname
 
         wm = context.window_manager
-        wmt = bpy.types.WindowManager
 
         pluglibs = [lib.name for lib in pluglibsCOL if lib.isvisible]
         lockedlibs = [lib.name for lib in pluglibsCOL if lib.islocked]
@@ -315,7 +318,7 @@ class MenuPlugLibraries(bpy.types.Menu):
                 column.separator()
 
                 if show_count:
-                    plugcount = len(getattr(wmt, "pluglib_" + library).keywords['items'])
+                    plugcount = get_library_plug_count(library)
                     liblabel = "%s, %d" % (libname, plugcount)
                 else:
                     liblabel = libname
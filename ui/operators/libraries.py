@@ -6,6 +6,7 @@ from ... utils.ui import popup_message
 from ... utils.registration import get_prefs, reload_plug_libraries
 from ... utils.system import makedir, open_folder
 from ... utils.library import get_lib
+from ... utils.thumbnail import queue_thumbnail_render, start_thumbnail_renders, get_thumbnail_worker_count
 from ... items import library_move_items
 
 class Move(bpy.types.Operator):
@@ -48,6 +49,35 @@ class Reload(bpy.types.Operator):
 
         return {'FINISHED'}
 
+class RenderThumbnails(bpy.types.Operator):
+    bl_idname = "machin3.render_plug_library_thumbnails"
+    bl_label = "MACHIN3: Render Plug Library Thumbnails"
+    bl_description = "Re-render the thumbnails of all plugs in the selected library.\nRenders in the background, using all cores"
+
+    @classmethod
+    def poll(cls, context):
+        _, _, active = get_lib()
+        return active and not active.islocked
+
+    def execute(self, context):
+        _, _, active = get_lib()
+        assetspath = get_prefs().assetspath
+
+        blendspath = os.path.join(assetspath, active.name, "blends")
+        iconspath = os.path.join(assetspath, active.name, "icons")
+
+        blends = [f for f in sorted(os.listdir(blendspath)) if f.endswith(".blend")] if os.path.exists(blendspath) else []
+
+        for blend in blends:
+            plugname = blend[:-6]
+            queue_thumbnail_render(active.name, plugname, os.path.join(blendspath, blend), os.path.join(iconspath, plugname + ".png"), start=False)
+
+        start_thumbnail_renders()
+
+        self.report({'INFO'}, "Rendering %d thumbnails of library '%s' using %d background processes" % (len(blends), active.name, min(len(blends), get_thumbnail_worker_count())))
+
+        return {'FINISHED'}
+
 class Add(bpy.types.Operator):
     bl_idname = "machin3.add_plug_library"
     bl_label = "MACHIN3: Add Plug Library"
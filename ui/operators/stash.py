@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import IntProperty
-from ... utils.stash import clear_stashes, swap_stash
+from ... utils.stash import clear_stashes, swap_stash, get_stash_mesh_stats
+from ... import handlers
 
 class RemoveStash(bpy.types.Operator):
     bl_idname = "machin3.remove_stash"
@@ -69,3 +70,23 @@ class SweepStashes(bpy.types.Operator):
                 col.objects.unlink(obj)
 
         return {'FINISHED'}
+
+class ReportStashes(bpy.types.Operator):
+    bl_idname = "machin3.report_stashes"
+    bl_label = "MACHIN3: Report Stashes"
+    bl_description = "Report how many stash meshes are shared between stash objects and how much memory that saves, as well as the overhead of the stash handlers"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.MM.isstashobj for obj in bpy.data.objects)
+
+    def execute(self, context):
+        stashcount, meshcount, saved = get_stash_mesh_stats()
+
+        self.report({'INFO'}, "%d stashes share %d meshes, saving ~%.2f MB" % (stashcount, meshcount, saved / 1024 ** 2))
+
+        for name, timing in handlers.handler_timings.items():
+            print("%s: %d updates, %.3f ms avg, %.3f ms max" % (name, timing['count'], timing['total'] / timing['count'] * 1000, timing['max'] * 1000))
+
+        return {'FINISHED'}
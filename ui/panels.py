@@ -44,6 +44,7 @@ class PanelMESHmachine(bpy.types.Panel):
             column.label(text=f"{active.name} {'(' + active.MM.stashname + ')' if active.MM.stashname else ''}")
 
             column.template_list("MACHIN3_UL_stashes", "", active.MM, "stashes", active.MM, "active_stash_idx", rows=max(len(active.MM.stashes), 1))
+            column.operator('machin3.report_stashes', text='Stash Report')
 
         if sweep:
             box = layout.box()
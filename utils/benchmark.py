@@ -0,0 +1,225 @@
+import bpy
+import bmesh
+import json
+import os
+import time
+from math import sqrt
+from statistics import median
+from .. import bl_info
+
+def create_chamfer_strip(bm, sweeps=100):
+    profile = [(-1, 0), (-0.1, 0), (0, 0.1), (0, 1)]
+    sections = []
+
+    for i in range(sweeps):
+        x = 2 * i / (sweeps - 1) - 1
+        sections.append([bm.verts.new((x, y, z)) for y, z in profile])
+
+    for section, next_section in zip(sections, sections[1:]):
+        for idx in range(len(profile) - 1):
+            face = bm.faces.new((section[idx], next_section[idx], next_section[idx + 1], section[idx + 1]))
+
+            if idx == 1:
+                face.select_set(True)
+
+def create_cyclic_bevel(bm, segments=64):
+    bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments, radius1=1, radius2=1, depth=2)
+
+    rim = [e for e in bm.edges if all(v.co.z > 0 for v in e.verts)]
+    ret = bmesh.ops.bevel(bm, geom=rim, offset=0.1, offset_type='OFFSET', profile_type='SUPERELLIPSE', segments=1, profile=0.5, affect='EDGES')
+
+    for face in ret['faces']:
+        face.select_set(True)
+
+def create_plug_target(bm, faces=10000):
+    segments = max(2, int(sqrt(faces)))
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=2)
+
+def create_plug_mesh(bm, segments=8):
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=0.4)
+
+    border = {v for e in bm.edges if not e.is_manifold for v in e.verts}
+
+    for v in bm.verts:
+        if v not in border:
+            v.co.z = 0.1
+
+def create_symmetric_mesh(bm, segments=64):
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=segments // 2, radius=1)
+
+def create_boolean_seam(bm, cuts=8, segments=32):
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=2)
+
+    extent = max(v.co.x for v in bm.verts)
+    r = round(extent * 2 / segments * (segments // 4), 6)
+    ring = [e for e in bm.edges if all(round(max(abs(v.co.x), abs(v.co.y)), 6) == r for v in e.verts)]
+    ret = bmesh.ops.subdivide_edges(bm, edges=ring, cuts=cuts, use_grid_fill=False)
+
+    ring_verts = {v for e in ring for v in e.verts} | {el for el in ret['geom_inner'] if isinstance(el, bmesh.types.BMVert)}
+
+    for e in bm.edges:
+        if all(v in ring_verts for v in e.verts):
+            e.select_set(True)
+
+def create_pipe_panel(bm, pipes=1, segments=64):
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1)
+    bmesh.ops.solidify(bm, geom=bm.faces[:], thickness=0.2)
+
+    top = max(v.co.z for v in bm.verts)
+    extent = max(v.co.x for v in bm.verts)
+
+    ys = sorted({round(v.co.y, 6) for v in bm.verts})
+    rows = {ys[int((i + 1) * len(ys) / (pipes + 1))] for i in range(pipes)}
+
+    for e in bm.edges:
+        if all(v.co.z > top - 0.0001 and abs(v.co.x) < extent * 0.8 for v in e.verts):
+            y = round(e.verts[0].co.y, 6)
+
+            if y in rows and y == round(e.verts[1].co.y, 6):
+                e.select_set(True)
+
+def create_benchmark_object(context, name, create, params):
+    mesh = bpy.data.meshes.new(name)
+    obj = bpy.data.objects.new(name, mesh)
+    context.scene.collection.objects.link(obj)
+
+    bm = bmesh.new()
+    create(bm, **params)
+    bm.select_flush(True)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    for o in context.view_layer.objects:
+        o.select_set(False)
+
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+    return obj
+
+def prepare_refuse(context, obj):
+    bpy.ops.machin3.fuse()
+
+def prepare_plug(context, obj):
+    target = obj
+    plug = create_benchmark_object(context, "Plug", create_plug_mesh, {})
+
+    bpy.ops.machin3.create_plug()
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    handle = context.active_object
+    handle.location.z = 0.01
+
+    target.select_set(True)
+    context.view_layer.objects.active = target
+
+    return plug
+
+benchmark_cases = [
+    {'name': 'fuse', 'create': create_chamfer_strip, 'params': [{'sweeps': 100}, {'sweeps': 1000}], 'mode': 'EDIT', 'run': lambda: bpy.ops.machin3.fuse()},
+    {'name': 'fuse_cyclic', 'create': create_cyclic_bevel, 'params': [{'segments': 64}, {'segments': 512}], 'mode': 'EDIT', 'run': lambda: bpy.ops.machin3.fuse()},
+    {'name': 'unchamfer', 'create': create_chamfer_strip, 'params': [{'sweeps': 100}, {'sweeps': 1000}], 'mode': 'EDIT', 'run': lambda: bpy.ops.machin3.unchamfer()},
+    {'name': 'refuse', 'create': create_cyclic_bevel, 'params': [{'segments': 64}, {'segments': 512}], 'mode': 'EDIT', 'prepare': prepare_refuse, 'run': lambda: bpy.ops.machin3.refuse()},
+    {'name': 'symmetrize', 'create': create_symmetric_mesh, 'params': [{'segments': 64}, {'segments': 256}], 'mode': 'OBJECT', 'run': lambda: bpy.ops.machin3.symmetrize(objmode=True)},
+    {'name': 'plug', 'create': create_plug_target, 'params': [{'faces': 10000}, {'faces': 100000}], 'mode': 'OBJECT', 'prepare': prepare_plug, 'run': lambda: bpy.ops.machin3.plug()},
+    {'name': 'boolean_cleanup', 'create': create_boolean_seam, 'params': [{'cuts': 8}, {'cuts': 64}], 'mode': 'EDIT', 'select_mode': (False, True, False), 'run': lambda: bpy.ops.machin3.boolean_cleanup()},
+    {'name': 'offset_cut', 'create': create_pipe_panel, 'params': [{'pipes': 1}, {'pipes': 8}], 'mode': 'EDIT', 'select_mode': (False, True, False), 'run': lambda: bpy.ops.machin3.offset_cut()},
+]
+
+def get_case_name(case, params):
+    return "_".join([case['name']] + ["%s_%s" % (key, value) for key, value in params.items()])
+
+def run_case(context, case, params, repeat=3):
+    times = []
+
+    for _ in range(repeat):
+        objects = set(bpy.data.objects)
+        meshes = set(bpy.data.meshes)
+
+        try:
+            obj = create_benchmark_object(context, case['name'], case['create'], params)
+
+            if case.get('select_mode'):
+                context.tool_settings.mesh_select_mode = case['select_mode']
+
+            if case['mode'] == 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+
+            if case.get('prepare'):
+                case['prepare'](context, obj)
+
+            start = time.perf_counter()
+            case['run']()
+            times.append(time.perf_counter() - start)
+
+        finally:
+            if context.mode != 'OBJECT':
+                bpy.ops.object.mode_set(mode='OBJECT')
+
+            for obj in set(bpy.data.objects) - objects:
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+            for mesh in set(bpy.data.meshes) - meshes:
+                bpy.data.meshes.remove(mesh, do_unlink=True)
+
+    return {'params': params, 'times': times, 'min': min(times), 'median': median(times)}
+
+def run_benchmarks(context, names=None, repeat=3, debug=True):
+    results = {'blender': bpy.app.version_string,
+               'meshmachine': '.'.join(str(v) for v in bl_info['version']),
+               'date': time.strftime("%Y-%m-%d %H:%M:%S"),
+               'repeat': repeat,
+               'cases': {}}
+
+    for case in benchmark_cases:
+        if names and case['name'] not in names:
+            continue
+
+        for params in case['params']:
+            name = get_case_name(case, params)
+
+            try:
+                results['cases'][name] = run_case(context, case, params, repeat=repeat)
+
+                if debug:
+                    print("--- %f - %s" % (results['cases'][name]['median'], name))
+
+            except Exception as e:
+                results['cases'][name] = {'params': params, 'error': str(e)}
+
+                if debug:
+                    print(" ! WARNING: %s failed: %s" % (name, e))
+
+    return results
+
+def save_benchmarks(results, path):
+    folder = os.path.dirname(path)
+
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=4)
+
+def load_benchmarks(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare_benchmarks(results, baseline, tolerance=0.2, debug=True):
+    regressions = []
+
+    for name, result in results['cases'].items():
+        base = baseline['cases'].get(name)
+
+        if not base or 'median' not in base or 'median' not in result:
+            continue
+
+        ratio = result['median'] / base['median'] if base['median'] else 1
+
+        if ratio > 1 + tolerance:
+            regressions.append((name, base['median'], result['median'], ratio))
+
+        if debug:
+            print("%s %f -> %f (%.2fx) - %s" % ("!" if ratio > 1 + tolerance else "•", base['median'], result['median'], ratio, name))
+
+    return regressions
@@ -1,4 +1,6 @@
 import bpy
+import bmesh
+from . registration import get_prefs
 
 def ensure_custom_data_layers(bm, vertex_groups=True, bevel_weights=True, crease=True):
 
@@ -36,3 +38,423 @@ def loop_index_update(bm, debug=False):
             lidx += 1
             if debug:
                 print(" •", l)
+
+def get_edit_bmesh(mesh, snapshot=None):
+    if snapshot and not snapshot.full:
+        bm = snapshot.restore()
+
+        # outside of the restored region and the faces around it, normals are still up to date
+        for f in snapshot.faces + list(snapshot.outer_faces):
+            f.normal_update()
+
+        for v in snapshot.verts:
+            v.normal_update()
+
+    else:
+        bm = snapshot.restore() if snapshot else bmesh.from_edit_mesh(mesh)
+        bm.normal_update()
+
+    # restoring in place keeps the indices, otherwise deleted elements free up slots, that new ones are put in, changing the order
+    if not snapshot or snapshot.destructive:
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+
+    bm.verts.ensure_lookup_table()
+
+    return bm
+
+def copy_edit_bmesh(mesh):
+    bm = bmesh.from_edit_mesh(mesh).copy()
+
+    bm.verts.index_update()
+    bm.edges.index_update()
+    bm.faces.index_update()
+
+    return bm
+
+def load_edit_bmesh(mesh, bm):
+    tmpmesh = bpy.data.meshes.new(name="%s_tmp" % (mesh.name))
+    bm.to_mesh(tmpmesh)
+
+    # to_mesh sets the indices, and the elements keep their order, so the selection history can be found again by index
+    history = [(elem.index, isinstance(elem, bmesh.types.BMVert), isinstance(elem, bmesh.types.BMEdge)) for elem in bm.select_history]
+
+    editbm = bmesh.from_edit_mesh(mesh)
+    editbm.clear()
+    editbm.from_mesh(tmpmesh)
+
+    bpy.data.meshes.remove(tmpmesh, do_unlink=True)
+
+    editbm.verts.ensure_lookup_table()
+    editbm.edges.ensure_lookup_table()
+    editbm.faces.ensure_lookup_table()
+
+    for idx, isvert, isedge in history:
+        editbm.select_history.add(editbm.verts[idx] if isvert else editbm.edges[idx] if isedge else editbm.faces[idx])
+
+    return editbm
+
+def update_edit_bmesh(mesh, destructive=True):
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=destructive)
+
+def copy_custom_data_layers(source, target):
+    for seq in ['verts', 'edges', 'faces', 'loops']:
+        source_layers = getattr(source, seq).layers
+        target_layers = getattr(target, seq).layers
+
+        for layertype in ['deform', 'shape', 'bevel_weight', 'crease', 'skin', 'paint_mask', 'face_map', 'freestyle', 'uv', 'color', 'float', 'int', 'string', 'float_vector', 'float_color']:
+            layers = getattr(source_layers, layertype, None)
+
+            if layers is not None:
+                for name in layers.keys():
+                    if name not in getattr(target_layers, layertype):
+                        getattr(target_layers, layertype).new(name)
+
+# restoring recreates the region, unless its topology is unchanged, so its elements can get new indices, use verts, which holds the restored verts in the snapshot's order, to keep track of them
+class RegionSnapshot:
+    def log(self, *args, **kwargs):
+        if self.debug:
+            print(*args, **kwargs)
+
+    debug = False
+
+    mesh = None
+    base_rings = 0
+    rings = 0
+    full = False
+    destructive = False
+
+    bm = None
+    source = None
+    verts = None
+    edges = None
+    faces = None
+    history = None
+    boundary = None
+    outer_faces = None
+    outer_edges = None
+
+    def __init__(self, mesh, rings=None, full=False, debug=False):
+        self.debug = debug
+
+        self.mesh = mesh
+        self.full = full
+        self.base_rings = max(1, get_prefs().snapshot_rings if rings is None else rings)
+        self.rings = self.base_rings
+
+        self.capture()
+
+    def capture(self):
+        editbm = bmesh.from_edit_mesh(self.mesh)
+
+        editbm.verts.index_update()
+        editbm.edges.index_update()
+        editbm.faces.index_update()
+
+        self.destructive = False
+
+        # custom split normals can't be accessed from python, and a region covering most of the mesh is rebuilt faster as a whole
+        if not self.full and not self.mesh.has_custom_normals:
+            faces, edges, verts = self.get_region(editbm)
+
+            if len(faces) <= len(editbm.faces) / 2:
+                boundary = [v for v in verts if any(f not in faces for f in v.link_faces) or any(e not in edges for e in v.link_edges)]
+
+                self.boundary = boundary
+                self.outer_faces = {f for v in boundary for f in v.link_faces if f not in faces}
+                self.outer_edges = {e for v in boundary for e in v.link_edges if e not in edges}
+
+                # parts of the region that aren't connected to the rest of the mesh, couldn't be found again after a tool modified them
+                if self.get_current_region(editbm) == (faces, edges, verts - set(boundary)):
+                    self.full = False
+                    self.bm = self.copy_region(editbm, faces, edges, verts)
+                    self.source = self.bm
+
+                    self.log("Region snapshot of %d faces, %d boundary verts, %d rings" % (len(faces), len(boundary), self.rings))
+                    return
+
+        self.full = True
+        self.boundary = None
+        self.outer_faces = None
+        self.outer_edges = None
+
+        self.bm = copy_edit_bmesh(self.mesh)
+        self.source = self.bm
+
+        self.history = []
+        self.bm.select_history.clear()
+
+        self.bm.verts.ensure_lookup_table()
+        self.bm.edges.ensure_lookup_table()
+        self.bm.faces.ensure_lookup_table()
+
+        for elem in editbm.select_history:
+            if isinstance(elem, bmesh.types.BMVert):
+                self.bm.select_history.add(self.bm.verts[elem.index])
+
+            elif isinstance(elem, bmesh.types.BMEdge):
+                self.bm.select_history.add(self.bm.edges[elem.index])
+
+            else:
+                self.bm.select_history.add(self.bm.faces[elem.index])
+
+        self.log("Full snapshot of %d faces" % (len(self.bm.faces)))
+
+    def get_region(self, bm):
+        verts = {v for v in bm.verts if v.select}
+        faces = {f for v in verts for f in v.link_faces}
+
+        ring = faces
+
+        for _ in range(self.rings):
+            ring = {f for face in ring for v in face.verts for f in v.link_faces} - faces
+            faces |= ring
+
+        verts |= {v for f in faces for v in f.verts}
+        edges = {e for v in verts for e in v.link_edges if all(ev in verts for ev in e.verts) and (not e.link_faces or any(f in faces for f in e.link_faces))}
+
+        return faces, edges, verts
+
+    def get_current_region(self, bm):
+        boundary = set(self.boundary)
+
+        faces = {f for v in boundary for f in v.link_faces if f not in self.outer_faces}
+        edges = {e for v in boundary for e in v.link_edges if e not in self.outer_edges}
+        verts = {v for e in edges for v in e.verts if v not in boundary}
+
+        stack = list(verts)
+
+        while stack:
+            v = stack.pop()
+
+            faces.update(v.link_faces)
+
+            for e in v.link_edges:
+                edges.add(e)
+
+                other = e.other_vert(v)
+
+                if other not in boundary and other not in verts:
+                    verts.add(other)
+                    stack.append(other)
+
+        return faces, edges, verts
+
+    def copy_region(self, bm, faces, edges, verts):
+        regionbm = bmesh.new()
+        copy_custom_data_layers(bm, regionbm)
+
+        # boundary verts come first, so they can be identified by index in copies of the region too
+        boundary = set(self.boundary)
+        vmap = {}
+
+        for v in self.boundary + [v for v in verts if v not in boundary]:
+            vmap[v] = regionbm.verts.new(v.co, v)
+
+            if v.select:
+                vmap[v].select = True
+
+        emap = {}
+
+        for e in edges:
+            emap[e] = regionbm.edges.new([vmap[v] for v in e.verts], e)
+
+            if e.select:
+                emap[e].select = True
+
+        fmap = {}
+
+        for f in faces:
+            fmap[f] = regionbm.faces.new([vmap[v] for v in f.verts], f)
+
+            for loop, l in zip(fmap[f].loops, f.loops):
+                loop.copy_from(l)
+
+            if f.select:
+                fmap[f].select = True
+
+        # the edit mesh's region elements, in the order of the copy, and the selection history, split into the part outside and inside the region
+        self.verts = list(vmap)
+        self.edges = list(emap)
+        self.faces = list(fmap)
+
+        elements = {**vmap, **emap, **fmap}
+
+        self.history = [elem for elem in bm.select_history if elem not in elements]
+
+        for elem in bm.select_history:
+            if elem in elements:
+                regionbm.select_history.add(elements[elem])
+
+        return regionbm
+
+    def copy(self):
+        bm = self.bm.copy()
+        bm.normal_update()
+
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        return bm
+
+    def is_unchanged(self, source, faces, edges, verts):
+        if source is not self.source or any(not elem.is_valid for elem in self.verts + self.edges + self.faces):
+            return False
+
+        boundary = set(self.boundary)
+
+        if faces != set(self.faces) or edges != set(self.edges) or verts != {v for v in self.verts if v not in boundary}:
+            return False
+
+        vmap = dict(zip(source.verts, self.verts))
+
+        if any([vmap[v] for v in se.verts] != list(e.verts) for se, e in zip(source.edges, self.edges)):
+            return False
+
+        return all([vmap[v] for v in sf.verts] == list(f.verts) for sf, f in zip(source.faces, self.faces))
+
+    def restore(self, source=None):
+        if source is None:
+            source = self.bm
+
+        # the whole mesh is rebuilt faster by converting it, than element by element
+        if self.full:
+            editbm = load_edit_bmesh(self.mesh, source)
+
+            self.destructive = True
+            self.source = source
+            self.verts = list(editbm.verts)
+
+            return editbm
+
+        editbm = bmesh.from_edit_mesh(self.mesh)
+
+        faces, edges, verts = self.get_current_region(editbm)
+
+        source_verts = list(source.verts)
+        source_edges = list(source.edges)
+        source_faces = list(source.faces)
+
+        # tools only moving verts around, leave the topology intact, so the elements can be restored in place, which keeps them and their indices
+        if self.is_unchanged(source, faces, edges, verts):
+            self.log("Restoring %d faces in place" % (len(source_faces)))
+
+            self.destructive = False
+
+            vmap = dict(zip(source_verts, self.verts))
+            emap = dict(zip(source_edges, self.edges))
+            fmap = dict(zip(source_faces, self.faces))
+
+            for sv, v in vmap.items():
+                v.co = sv.co
+                v.copy_from(sv)
+
+            for se, e in emap.items():
+                e.copy_from(se)
+                e.seam = se.seam
+                e.smooth = se.smooth
+
+            for sf, f in fmap.items():
+                f.copy_from(sf)
+                f.smooth = sf.smooth
+
+                for loop, l in zip(f.loops, sf.loops):
+                    loop.copy_from(l)
+
+        else:
+            self.log("Restoring %d faces, replacing %d faces" % (len(source_faces), len(faces)))
+
+            self.destructive = True
+
+            bmesh.ops.delete(editbm, geom=list(verts), context='VERTS')
+            bmesh.ops.delete(editbm, geom=[f for f in faces if f.is_valid], context='FACES_ONLY')
+            bmesh.ops.delete(editbm, geom=[e for e in edges if e.is_valid and not e.link_faces], context='EDGES_FACES')
+
+            vmap = {}
+
+            for v, sv in zip(self.boundary, source_verts):
+                v.co = sv.co
+                v.copy_from(sv)
+                vmap[sv] = v
+
+            for sv in source_verts[len(self.boundary):]:
+                vmap[sv] = editbm.verts.new(sv.co, sv)
+
+            emap = {}
+
+            for se in source_edges:
+                edge_verts = [vmap[v] for v in se.verts]
+                edge = editbm.edges.get(edge_verts)
+
+                if edge:
+                    edge.copy_from(se)
+                else:
+                    edge = editbm.edges.new(edge_verts, se)
+
+                emap[se] = edge
+
+            fmap = {}
+
+            for sf in source_faces:
+                face = editbm.faces.new([vmap[v] for v in sf.verts], sf)
+
+                for loop, l in zip(face.loops, sf.loops):
+                    loop.copy_from(l)
+
+                fmap[sf] = face
+
+            self.verts = [vmap[sv] for sv in source_verts]
+            self.edges = [emap[se] for se in source_edges]
+            self.faces = [fmap[sf] for sf in source_faces]
+
+        self.source = source
+
+        # selection is not part of the copied attributes, deselect first, so selecting can flush down without being undone
+        for f in fmap.values():
+            f.select = False
+
+        for e in emap.values():
+            e.select = False
+
+        for v in vmap.values():
+            v.select = False
+
+        for elements in [vmap, emap, fmap]:
+            for source_element, element in elements.items():
+                if source_element.select:
+                    element.select = True
+
+        history = [elem for elem in self.history if elem.is_valid]
+        elements = {**vmap, **emap, **fmap}
+
+        editbm.select_history.clear()
+
+        for elem in history + [elements[elem] for elem in source.select_history if elem in elements]:
+            editbm.select_history.add(elem)
+
+        return editbm
+
+    # tools reaching beyond the selection need the snapshot to grow with them, call it while the edit mesh is restored
+    def extend(self, reach):
+        rings = self.base_rings + reach
+
+        if not self.full and rings > self.rings:
+            self.log("Extending snapshot to %d rings" % (rings))
+
+            self.free()
+
+            self.rings = rings
+            self.capture()
+
+    def free(self):
+        if self.bm:
+            self.bm.free()
+
+        self.bm = None
+        self.source = None
+        self.verts = None
+        self.edges = None
+        self.faces = None
+        self.history = None
@@ -7,6 +7,7 @@ import blf
 from math import pi, sin, cos
 from . registration import get_prefs
 from . ui import require_header_offset
+from . mesh import get_coords, get_edge_indices
 from .. colors import red
 
 def vert_debug_print(debug, vert, msg, end="\n"):
@@ -52,9 +53,113 @@ def get_builtin_shader_name(name, prefix='3D'):
     else:
         return f"{prefix}_{name}"
 
+shaders = {}
+
+def get_shader(name):
+    shader = shaders.get(name)
+
+    if not shader:
+        shader = shaders[name] = gpu.shader.from_builtin(name)
+
+    return shader
+
+class DrawBatch():
+    def __init__(self, coords=None, indices=None, type='LINES'):
+        self.type = type
+        self.shader = get_shader('POLYLINE_UNIFORM_COLOR' if type == 'LINES' else get_builtin_shader_name('UNIFORM_COLOR'))
+        self.batch = None
+
+        if coords is not None:
+            self.update(coords, indices=indices)
+
+    def __bool__(self):
+        return self.batch is not None
+
+    def update(self, coords, indices=None):
+        if len(coords) and (indices is None or len(indices)):
+            self.batch = batch_for_shader(self.shader, self.type, {"pos": coords}, indices=indices)
+
+        else:
+            self.batch = None
+
+    def draw(self, mx=None, color=(1, 1, 1), alpha=1, width=1, size=6, xray=True):
+        if self.batch is not None:
+            shader = self.shader
+
+            gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+
+            if self.type == 'LINES':
+                gpu.state.blend_set('ALPHA')
+
+                shader.uniform_float("color", (*color, alpha))
+                shader.uniform_float("lineWidth", width)
+                shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
+                shader.bind()
+
+            else:
+                gpu.state.blend_set('ALPHA' if alpha < 1 else 'NONE')
+                gpu.state.point_size_set(size)
+
+                shader.bind()
+                shader.uniform_float("color", (*color, alpha))
+
+            draw_with_matrix(self.batch, shader, mx)
+
+def get_wire_batch(mesh, offset=0):
+    return DrawBatch(*get_coords(mesh, offset=offset, indices=True))
+
+stash_batches = {}
+
+def get_stash_batch(stash, offset=0):
+    mesh = stash.obj.data
+    # the stash hash is recomputed whenever a stash mesh is edited, undo, file loads and stash removal clear the cache instead
+    revision = (mesh.as_pointer(), mesh.name_full, stash.obj.MM.stashhash, stash.obj.MM.stasharchive)
+
+    cached = stash_batches.get(stash.uuid)
+    batch = cached['batches'].get(offset) if cached and cached['revision'] == revision else None
+
+    if not batch:
+
+        # archived stashes only hold an empty proxy mesh, so draw them from a temporary mesh built from the archive
+        if stash.obj.MM.stasharchive:
+            from . stash import get_archived_stash_mesh
+            mesh = get_archived_stash_mesh(stash.obj)
+
+            if not mesh:
+                return DrawBatch(get_coords(stash.obj.data), indices=get_edge_indices(stash.obj.data))
+
+        if not cached or cached['revision'] != revision:
+            cached = stash_batches[stash.uuid] = {'revision': revision,
+                                                  'indices': get_edge_indices(mesh),
+                                                  'batches': {}}
+
+        batch = cached['batches'][offset] = DrawBatch(get_coords(mesh, offset=offset), indices=cached['indices'])
+
+        if mesh != stash.obj.data:
+            bpy.data.meshes.remove(mesh, do_unlink=True)
+
+    return batch
+
+def clear_stash_batches(uuid=None):
+    if uuid:
+        if uuid in stash_batches:
+            del stash_batches[uuid]
+
+    else:
+        stash_batches.clear()
+
+def draw_with_matrix(batch, shader, mx=None):
+    if mx is not None and mx != Matrix():
+        with gpu.matrix.push_pop():
+            gpu.matrix.multiply_matrix(mx)
+            batch.draw(shader)
+
+    else:
+        batch.draw(shader)
+
 def draw_point(co, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, modal=True, screen=False):
     def draw():
-        shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR'))
+        shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR'))
         shader.bind()
         shader.uniform_float("color", (*color, alpha))
 
@@ -76,7 +181,7 @@ def draw_point(co, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, mod
 
 def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alpha=1, xray=True, modal=True, screen=False):
     def draw():
-        shader = gpu.shader.from_builtin(get_builtin_shader_name('UNIFORM_COLOR'))
+        shader = get_shader(get_builtin_shader_name('UNIFORM_COLOR'))
         shader.bind()
         shader.uniform_float("color", (*color, alpha))
 
@@ -85,18 +190,11 @@ def draw_points(coords, indices=None, mx=Matrix(), color=(1, 1, 1), size=6, alph
         gpu.state.point_size_set(size)
 
         if indices:
-            if mx != Matrix():
-                batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co for co in coords]}, indices=indices)
-            else:
-                batch = batch_for_shader(shader, 'POINTS', {"pos": coords}, indices=indices)
-
+            batch = batch_for_shader(shader, 'POINTS', {"pos": coords}, indices=indices)
         else:
-            if mx != Matrix():
-                batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co for co in coords]})
-            else:
-                batch = batch_for_shader(shader, 'POINTS', {"pos": coords})
+            batch = batch_for_shader(shader, 'POINTS', {"pos": coords})
 
-        batch.draw(shader)
+        draw_with_matrix(batch, shader, mx)
 
     if modal:
         draw()
@@ -117,14 +215,14 @@ def draw_line(coords, indices=None, mx=Matrix(), color=(1, 1, 1), alpha=1, width
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        batch.draw(shader)
+        batch = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
+        draw_with_matrix(batch, shader, mx)
 
     if modal:
         draw()
@@ -145,18 +243,14 @@ def draw_lines(coords, indices=None, mx=Matrix(), color=(1, 1, 1), width=1, alph
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
 
-        if mx != Matrix():
-            batch = batch_for_shader(shader, 'LINES', {"pos": [mx @ co for co in coords]}, indices=indices)
-        else:
-            batch = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
-
-        batch.draw(shader)
+        batch = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
+        draw_with_matrix(batch, shader, mx)
 
     if modal:
         draw()
@@ -179,7 +273,7 @@ def draw_vector(vector, origin=Vector((0, 0, 0)), mx=Matrix(), color=(1, 1, 1),
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+        shader = get_shader('POLYLINE_SMOOTH_COLOR')
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
@@ -216,7 +310,7 @@ def draw_vectors(vectors, origins, mx=Matrix(), color=(1, 1, 1), width=1, alpha=
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+        shader = get_shader('POLYLINE_SMOOTH_COLOR')
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
         shader.bind()
@@ -259,7 +353,7 @@ def draw_circle(loc=Vector(), rot=Quaternion(), radius=100, segments='AUTO', wid
         gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
         gpu.state.blend_set('ALPHA')
 
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader = get_shader('POLYLINE_UNIFORM_COLOR')
         shader.uniform_float("color", (*color, alpha))
         shader.uniform_float("lineWidth", width)
         shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
@@ -277,25 +371,9 @@ def draw_circle(loc=Vector(), rot=Quaternion(), radius=100, segments='AUTO', wid
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
-def draw_mesh_wire(batch, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=True):
+def draw_mesh_wire(batch, mx=None, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=True):
     def draw():
-        nonlocal batch
-        coords, indices = batch
-
-        gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
-        gpu.state.blend_set('ALPHA')
-
-        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
-        shader.uniform_float("color", (*color, alpha))
-        shader.uniform_float("lineWidth", width)
-        shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
-        shader.bind()
-
-        b = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
-        b.draw(shader)
-
-        del shader
-        del b
+        batch.draw(mx=mx, color=color, alpha=alpha, width=width, xray=xray)
 
     if modal:
         draw()
@@ -426,8 +504,8 @@ def draw_region_border(context, color=(1, 1, 1), alpha=1, width=2, title="", sub
 
             blf.draw(font, subtitle)
 
-def draw_stashes_VIEW3D(scene, batch):
-    draw_mesh_wire(batch, color=(0.4, 0.7, 1), xray=scene.MM.draw_active_stash_xray, alpha=0.4)
+def draw_stashes_VIEW3D(scene, batch, mx):
+    draw_mesh_wire(batch, mx=mx, color=(0.4, 0.7, 1), xray=scene.MM.draw_active_stash_xray, alpha=0.4)
 
 def draw_split_row(self, layout, prop='prop', text='', label='Label', factor=0.2, align=True, toggle=True, expand=True, info=None, warning=None):
     row = layout.row(align=align)
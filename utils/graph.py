@@ -1,11 +1,123 @@
-def build_mesh_graph(bm, debug=False):
-    mesh_graph = {}
-    for v in bm.verts:
-        mesh_graph[v.index] = []
+import numpy as np
+from heapq import heapify, heappop, heappush
 
-    for edge in bm.edges:
-        mesh_graph[edge.verts[0].index].append((edge.verts[1].index, edge.verts[1].select, edge.select))
-        mesh_graph[edge.verts[1].index].append((edge.verts[0].index, edge.verts[0].select, edge.select))
+class MeshGraph:
+    def __init__(self, keys, select, offsets, neighbors, neighbor_select, edge_select, selected=False):
+        self.keys = keys
+        self.select = select
+
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.neighbor_select = neighbor_select
+        self.edge_select = edge_select
+
+        self.selected = selected
+
+        self._rows = {idx: row for row, idx in enumerate(keys.tolist())} if selected else None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys.tolist())
+
+    def __contains__(self, idx):
+        if self.selected:
+            return idx in self._rows
+
+        return 0 <= idx < len(self.keys)
+
+    def __getitem__(self, idx):
+        start, end = self._get_range(idx)
+
+        return list(zip(self.neighbors[start:end].tolist(), self.neighbor_select[start:end].tolist(), self.edge_select[start:end].tolist()))
+
+    def _get_range(self, idx):
+        if self.selected:
+            row = self._rows[idx]
+
+        elif 0 <= idx < len(self.keys):
+            row = idx
+
+        else:
+            raise KeyError(idx)
+
+        return self.offsets[row], self.offsets[row + 1]
+
+    def get_selected_neighbors(self, idx):
+        start, end = self._get_range(idx)
+        mask = self.neighbor_select[start:end] & self.edge_select[start:end]
+
+        return self.neighbors[start:end][mask].tolist()
+
+    def get_selected_degree_verts(self, degree):
+        mask = self.neighbor_select & self.edge_select
+
+        rows = np.repeat(np.arange(len(self.keys)), np.diff(self.offsets))
+        counts = np.bincount(rows[mask], minlength=len(self.keys))
+
+        return self.keys[self.select & (counts == degree)].tolist()
+
+    @classmethod
+    def from_arrays(cls, vertcount, edges, vert_select, edge_select, selected=False):
+        src = edges.reshape(-1)
+        dst = edges[:, ::-1].reshape(-1)
+        esel = np.repeat(edge_select, 2)
+
+        if selected:
+            keep = vert_select[src]
+            src, dst, esel = src[keep], dst[keep], esel[keep]
+
+            keys = np.flatnonzero(vert_select).astype(np.int32)
+
+        else:
+            keys = np.arange(vertcount, dtype=np.int32)
+
+        order = np.argsort(src, kind='stable')
+        src, dst, esel = src[order], dst[order], esel[order]
+
+        counts = np.bincount(np.searchsorted(keys, src), minlength=len(keys))
+
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return cls(keys, vert_select[keys], offsets, dst.astype(np.int32), vert_select[dst], esel, selected=selected)
+
+    @classmethod
+    def from_mesh(cls, mesh, selected=False):
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edges)
+
+        edge_select = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get('select', edge_select)
+
+        vert_select = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get('select', vert_select)
+
+        return cls.from_arrays(len(mesh.vertices), edges.reshape(-1, 2), vert_select, edge_select, selected=selected)
+
+    @classmethod
+    def from_bmesh(cls, bm, selected=False):
+        bm.verts.index_update()
+        bm.edges.index_update()
+
+        vert_select = np.fromiter((v.select for v in bm.verts), dtype=bool, count=len(bm.verts))
+
+        if selected:
+            edgelist = sorted({e for v in bm.verts if v.select for e in v.link_edges}, key=lambda e: e.index)
+        else:
+            edgelist = bm.edges
+
+        edges = np.fromiter((v.index for e in edgelist for v in e.verts), dtype=np.int32, count=len(edgelist) * 2).reshape(-1, 2)
+        edge_select = np.fromiter((e.select for e in edgelist), dtype=bool, count=len(edgelist))
+
+        return cls.from_arrays(len(bm.verts), edges, vert_select, edge_select, selected=selected)
+
+def build_mesh_graph(bm, mesh=None, selected=False, debug=False):
+    if mesh:
+        mesh_graph = MeshGraph.from_mesh(mesh, selected=selected)
+    else:
+        mesh_graph = MeshGraph.from_bmesh(bm, selected=selected)
 
     if debug:
         for idx in mesh_graph:
@@ -13,22 +125,71 @@ def build_mesh_graph(bm, debug=False):
 
     return mesh_graph
 
-def build_edge_graph(verts, edges, debug=False):
-    mg = {}
-    for v in verts:
-        mg[v.index] = {"fixed": v.tag,
-                       "connected": [],
-                       "children": []}
+def build_collapse_sequence(verts, edges, debug=False):
+    fixed = {v.index: v.tag for v in verts}
+    coords = {v.index: v.co.copy() for v in verts}
+    neighbors = {v.index: set() for v in verts}
+
+    heap = []
 
     for e in edges:
-        v1 = e.verts[0]
-        v2 = e.verts[1]
+        a, b = [v.index for v in e.verts]
 
-        mg[v1.index]["connected"].append((v2.index, v2.tag, e.calc_length()))
-        mg[v2.index]["connected"].append((v1.index, v1.tag, e.calc_length()))
+        neighbors[a].add(b)
+        neighbors[b].add(a)
 
-    if debug:
-        for idx in mg:
-            print(idx, mg[idx])
+        if not (fixed[a] and fixed[b]):
+            heap.append((e.calc_length(), a, b))
+
+    heapify(heap)
+
+    sequence = []
+    reach = 0
+
+    while heap:
+        length, a, b = heappop(heap)
+
+        if a not in neighbors or b not in neighbors[a]:
+            continue
+
+        vidx, cidx = (a, b) if fixed[b] and not fixed[a] else (b, a)
+
+        reach = max(reach, length)
+        sequence.append((reach, vidx, cidx))
+
+        if debug:
+            print(" • collapse vert %d into %d at %f" % (vidx, cidx, reach))
+
+        for nidx in neighbors.pop(vidx):
+            neighbors[nidx].discard(vidx)
+
+            if nidx != cidx and nidx not in neighbors[cidx]:
+                neighbors[cidx].add(nidx)
+                neighbors[nidx].add(cidx)
+
+                if not (fixed[cidx] and fixed[nidx]):
+                    heappush(heap, ((coords[cidx] - coords[nidx]).length, cidx, nidx))
+
+    return sequence
+
+def get_collapsed_verts(sequence, threshold):
+    parents = {}
+
+    for reach, vidx, cidx in sequence:
+        if reach > threshold:
+            break
+
+        parents[vidx] = cidx
+
+    def find(vidx):
+        root = vidx
+
+        while root in parents:
+            root = parents[root]
+
+        while vidx != root:
+            parents[vidx], vidx = root, parents[vidx]
+
+        return root
 
-    return mg
+    return {vidx: find(vidx) for vidx in list(parents)}
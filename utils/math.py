@@ -1,6 +1,7 @@
 from math import degrees, sqrt, pi, sin, cos, radians
 from mathutils import Vector, Matrix, geometry
 from random import choice
+import numpy as np
 from . draw import draw_vector, draw_points, draw_vectors, draw_point, draw_line
 from .. colors import yellow, green, blue, red
 
@@ -96,6 +97,27 @@ def average_normals(normalslist):
 
     return avg.normalized()
 
+def get_bezier_basis(resolution, dtype=np.float64):
+    t = np.linspace(0, 1, resolution, dtype=dtype)
+    mt = 1 - t
+
+    return np.stack((mt ** 3, 3 * mt ** 2 * t, 3 * mt * t ** 2, t ** 3), axis=1)
+
+def interpolate_bezier_batch(points, resolution):
+    points = np.asarray(points)
+
+    if points.ndim == 2:
+        points = points.reshape(-1, 4, 3)
+
+    basis = get_bezier_basis(resolution, dtype=points.dtype if points.dtype.kind == 'f' else np.float64)
+
+    return np.einsum('rk,nkd->nrd', basis, points)
+
+def transform_coords(coords, mx, dtype=np.float64):
+    mx = np.array(mx, dtype=dtype)
+
+    return np.asarray(coords, dtype=dtype) @ mx[:3, :3].T + mx[:3, 3]
+
 def create_rotation_matrix_from_normal(obj, normal, location=Vector((0, 0, 0)), debug=False):
     objup = Vector((0, 0, 1)) @ obj.matrix_world.inverted_safe()
 
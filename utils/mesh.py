@@ -7,34 +7,36 @@ def get_coords(mesh, mx=None, offset=0, indices=False):
     verts = mesh.vertices
     vert_count = len(verts)
 
-    coords = np.empty((vert_count, 3), float)
-    mesh.vertices.foreach_get('co', np.reshape(coords, vert_count * 3))
+    coords = np.empty(vert_count * 3, dtype=np.float32)
+    verts.foreach_get('co', coords)
+    coords = coords.reshape(vert_count, 3)
 
     if offset:
-        normals = np.empty((vert_count, 3), float)
-        mesh.vertices.foreach_get('normal', np.reshape(normals, vert_count * 3))
+        normals = np.empty(vert_count * 3, dtype=np.float32)
+        verts.foreach_get('normal', normals)
 
-        coords = coords + normals * offset
+        coords += normals.reshape(vert_count, 3) * np.float32(offset)
 
-    if mx:
-        coords_4d = np.ones((vert_count, 4), dtype=float)
-        coords_4d[:, :-1] = coords
-
-        coords = np.einsum('ij,aj->ai', mx, coords_4d)[:, :-1]
-
-    coords = np.float32(coords)
+    if mx is not None:
+        mx = np.array(mx, dtype=np.float32)
+        coords = coords @ mx[:3, :3].T + mx[:3, 3]
 
     if indices:
-        edges = mesh.edges
-        edge_count = len(edges)
-
-        indices = np.empty((edge_count, 2), 'i')
-        edges.foreach_get('vertices', np.reshape(indices, edge_count * 2))
+        indices = get_edge_indices(mesh)
 
         return coords, indices
 
     return coords
 
+def get_edge_indices(mesh):
+    edges = mesh.edges
+    edge_count = len(edges)
+
+    indices = np.empty(edge_count * 2, dtype=np.int32)
+    edges.foreach_get('vertices', indices)
+
+    return indices.reshape(edge_count, 2)
+
 def hide(mesh):
     mesh.polygons.foreach_set('hide', [True] * len(mesh.polygons))
     mesh.edges.foreach_set('hide', [True] * len(mesh.edges))
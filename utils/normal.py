@@ -1,11 +1,114 @@
 import bpy
-import mathutils
 import bmesh
+import numpy as np
 from . vgroup import add_vgroup
 from . modifier import apply_mod
 from . registration import get_prefs
+from . stash import rehydrate_stash
 from .. items import loop_mapping_dict
 
+class LoopNormals:
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+        mesh.calc_normals_split()
+
+        self.loop_count = len(mesh.loops)
+        self.face_count = len(mesh.polygons)
+
+        self.normals = self.get(mesh.loops, 'normal', np.float32, 3)
+
+        self.loop_verts = self.get(mesh.loops, 'vertex_index', np.int32)
+        self.loop_edges = self.get(mesh.loops, 'edge_index', np.int32)
+
+        self.loop_start = self.get(mesh.polygons, 'loop_start', np.int32)
+        self.loop_total = self.get(mesh.polygons, 'loop_total', np.int32)
+        self.loop_faces = np.repeat(np.arange(self.face_count, dtype=np.int32), self.loop_total)
+
+        self.vert_select = self.get(mesh.vertices, 'select', bool)
+        self.edge_select = self.get(mesh.edges, 'select', bool)
+        self.edge_sharp = self.get(mesh.edges, 'use_edge_sharp', bool)
+        self.face_select = self.get(mesh.polygons, 'select', bool)
+        self.face_normals = self.get(mesh.polygons, 'normal', np.float32, 3)
+
+    def get(self, collection, attr, dtype, size=1):
+        data = np.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attr, data)
+        return data.reshape(-1, 3) if size == 3 else data
+
+    def get_next_loops(self, loops):
+        faces = self.loop_faces[loops]
+        start = self.loop_start[faces]
+        return start + (loops - start + 1) % self.loop_total[faces]
+
+    def get_loop_pairs(self, loops, keys):
+        order = np.argsort(keys, kind='stable')
+        counts = np.bincount(keys)
+        starts = np.cumsum(counts) - counts
+
+        sizes = counts[keys[loops]]
+        first = np.repeat(loops, sizes)
+        offsets = np.arange(len(first)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second = order[np.repeat(starts[keys[loops]], sizes) + offsets]
+
+        return first, second
+
+    def clear(self, mask):
+        self.normals[mask] = 0
+
+    def set(self):
+        self.mesh.normals_split_custom_set(self.normals)
+        self.mesh.use_auto_smooth = True
+
+def get_angles(normalsA, normalsB):
+    return np.degrees(np.arccos(np.clip(np.einsum('ij,ij->i', normalsA, normalsB), -1, 1)))
+
+def flatten_normals(ln, threshold):
+    faceloops = np.flatnonzero(ln.face_select[ln.loop_faces])
+    face_count = np.int64(ln.face_count)
+
+    first, second = ln.get_loop_pairs(faceloops, ln.loop_edges)
+    edge_pairs = ln.loop_faces[first] != ln.loop_faces[second]
+    first, second = first[edge_pairs], second[edge_pairs]
+
+    faces = ln.loop_faces[first]
+    linked = ln.loop_faces[second]
+
+    edge_face_count = np.bincount(ln.loop_edges, minlength=len(ln.edge_sharp))
+    edges = ln.loop_edges[first]
+
+    flat = (edge_face_count[edges] == 2) & ~ln.edge_sharp[edges] & (get_angles(ln.face_normals[faces], ln.face_normals[linked]) < threshold)
+
+    edge_loops = np.concatenate([first[flat], ln.get_next_loops(first[flat]), second[flat], ln.get_next_loops(second[flat])])
+    edge_sources = np.tile(faces[flat], 4)
+
+    adjacent = np.unique(faces * face_count + linked)
+
+    first, second = ln.get_loop_pairs(faceloops, ln.loop_verts)
+
+    faces = ln.loop_faces[first]
+    corner = ln.loop_faces[second]
+
+    keys = faces * face_count + corner
+    face_smooth = np.bincount(ln.loop_faces, weights=ln.edge_sharp[ln.loop_edges], minlength=ln.face_count) == 0
+
+    mask = (faces != corner) & ~np.isin(keys, adjacent) & face_smooth[corner] & (get_angles(ln.face_normals[faces], ln.face_normals[corner]) < threshold)
+
+    order = np.lexsort((second[mask], keys[mask]))
+    _, idx = np.unique(keys[mask][order], return_index=True)
+
+    corner_loops = second[mask][order][idx]
+    corner_sources = faces[mask][order][idx]
+
+    loops = np.concatenate([edge_loops, corner_loops])
+    sources = np.concatenate([edge_sources, corner_sources])
+    stages = np.concatenate([np.zeros(len(edge_loops), dtype=np.int8), np.ones(len(corner_loops), dtype=np.int8)])
+
+    order = np.lexsort((stages, sources))[::-1]
+    loops, idx = np.unique(loops[order], return_index=True)
+
+    ln.normals[loops] = ln.face_normals[sources[order][idx]]
+
 def add_normal_transfer_mod(obj, nrmsrc, name, vgroup, mapping=None, debug=False):
     data_transfer = obj.modifiers.new(name, "DATA_TRANSFER")
     data_transfer.object = nrmsrc
@@ -57,6 +160,8 @@ def normal_transfer_from_stash(active, mapping=None):
     active.show_wire = False
 
     stashobj = active.MM.stashes[active.MM.active_stash_idx].obj
+    rehydrate_stash(stashobj)
+
     data_transfer = add_normal_transfer_mod(active, stashobj, vgroup.name, vgroup, mapping)
     return vgroup, data_transfer
 
@@ -76,70 +181,36 @@ def normal_transfer_from_obj(active, nrmsrc, vertids=False, vgroup=False, remove
     bpy.ops.object.mode_set(mode='EDIT')
 
 def normal_clear(active, limit=False):
-    debug = True
-    debug = False
-
     bpy.ops.object.mode_set(mode='OBJECT')
 
-    mesh = active.data
-    mesh.calc_normals_split()
+    ln = LoopNormals(active.data)
 
-    loop_normals = []
-    for loop in mesh.loops:
-        loop_normals.append(loop.normal)
+    mask = ln.vert_select[ln.loop_verts]
 
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
-
-    verts = [v for v in bm.verts if v.select]
-    faces = [f for f in bm.faces if f.select]
+    if limit:
+        mask &= ln.face_select[ln.loop_faces]
 
-    for v in verts:
-        for l in v.link_loops:
-            if not limit or l.face in faces:
-                loop_normals[l.index] = mathutils.Vector()
-
-    mesh.normals_split_custom_set(loop_normals)
-    mesh.use_auto_smooth = True
+    ln.clear(mask)
+    ln.set()
 
     bpy.ops.object.mode_set(mode='EDIT')
 
     return True
 
 def normal_clear_across_sharps(active):
-    mesh = active.data
-    mesh.calc_normals_split()
+    ln = LoopNormals(active.data)
 
-    loop_normals = []
-    for loop in mesh.loops:
-        loop_normals.append(loop.normal)
+    across = ln.edge_select[ln.loop_edges] & ~ln.face_select[ln.loop_faces]
 
-    bm = bmesh.new()
-    bm.from_mesh(active.data)
-    bm.normal_update()
-    bm.verts.ensure_lookup_table()
-
-    verts = [v for v in bm.verts if v.select]
-    edges = [e for e in bm.edges if e.select]
-    faces = [f for f in bm.faces if f.select]
+    edges, first = np.unique(ln.loop_edges[across], return_index=True)
+    sharp = ln.edge_sharp[edges]
 
-    faces_across = []
-    for e in edges:
-        for f in e.link_faces:
-            if f not in faces:
-                if not e.smooth:  # sharp boundary edge
-                    faces_across.append(f)  # unselected face across sharp boundary
-                break
-
-    if faces_across:
-        for v in verts:
-            for l in v.link_loops:
-                if l.face in faces_across:
-                    loop_normals[l.index] = mathutils.Vector()
+    if sharp.any():
+        faces_across = np.zeros(ln.face_count, dtype=bool)
+        faces_across[ln.loop_faces[across][first[sharp]]] = True
 
-        mesh.normals_split_custom_set(loop_normals)
-        mesh.use_auto_smooth = True
+        ln.clear(ln.vert_select[ln.loop_verts] & faces_across[ln.loop_faces])
+        ln.set()
 
 def remerge_sharp_edges(active):
     bm = bmesh.new()
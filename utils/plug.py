@@ -1,15 +1,18 @@
 import bpy
 import bmesh
 from mathutils import Matrix, Vector, Euler
+from mathutils.bvhtree import BVHTree
+import numpy as np
 from math import radians
 from . registration import get_addon
 from . raycast import cast_bvh_ray_from_mouse, get_grid_intersection, cast_obj_ray_from_mouse
-from . math import create_rotation_matrix_from_normal, get_loc_matrix, get_rot_matrix, get_sca_matrix
+from . math import create_rotation_matrix_from_normal, get_loc_matrix, get_rot_matrix, get_sca_matrix, transform_coords
 from . mesh import unhide_deselect
-from . normal import normal_transfer_from_obj, normal_clear_across_sharps
+from . normal import normal_transfer_from_obj, normal_clear_across_sharps, add_normal_transfer_mod
 from . object import update_local_view, flatten, add_facemap
 from . vgroup import add_vgroup, set_vgroup, get_vgroup
 from . modifier import apply_mod
+from . selection import get_boundary_edges
 
 def align(scene, depsgraph, handle, empties):
     mm = scene.MM
@@ -174,6 +177,25 @@ def get_plug(self, context, sel, debug=False):
 
     return None, None, None, None, None, None, None, (errmsg, errtitle)
 
+def get_plugs(self, context, sel, debug=False):
+    active = context.active_object
+    handles = [obj for obj in sel if obj != active and obj.MM.isplughandle]
+
+    if active not in sel or len(handles) < 2 or len(handles) != len(sel) - 1:
+        return None, [], ("Select plug handles and a target object to plug into.", "Illegal Selection")
+
+    plugs = []
+
+    for handle in handles:
+        target, handle, plug, subsets, deformer, modifiers, others, err = get_plug(self, context, [active, handle], debug=debug)
+
+        if err:
+            return None, [], err
+
+        plugs.append((handle, plug, subsets, deformer, modifiers, others))
+
+    return target, plugs, None
+
 def apply_hooks_and_arrays(depsgraph, handle, plug, subsets, deformer, others, modifiers):
     if any(mod in modifiers for mod in ['HOOK', 'ARRAY']):
         arraymods = [m for m in plug.modifiers if m.type == "ARRAY"]
@@ -317,7 +339,7 @@ def transform(depsgraph, handle, plug, deformer, rotation, offset, offset_dist,
         if deformer:
             offset_deformer(deformer, offset, offset_dist, debug=debug)
 
-def deform(context, depsgraph, target, handle, deformer, plug, subsets, deform_plug, deform_subsets, filletoredge, use_mesh_deform, deform_interpolation_falloff, deformer_plug_precision, deformer_subset_precision, debug=False):
+def deform(context, depsgraph, target, handle, deformer, plug, subsets, deform_plug, deform_subsets, filletoredge, use_mesh_deform, deform_interpolation_falloff, deformer_plug_precision, deformer_subset_precision, bvh=None, debug=False):
     if deform_plug or filletoredge == "FILLET":
         if deformer and use_mesh_deform:
             context.view_layer.objects.active = deformer
@@ -351,8 +373,12 @@ def deform(context, depsgraph, target, handle, deformer, plug, subsets, deform_p
                 surface_deform.target = handle
                 surface_deform.falloff = deform_interpolation_falloff  # by default this value is 4, but it might not be enough
                 bpy.ops.object.surfacedeform_bind(modifier="Subset Deform")
-    shrink_wrap = handle.modifiers.new(name="Shrink Wrap", type="SHRINKWRAP")
-    shrink_wrap.target = target
+    if bvh and not handle.modifiers:
+        shrinkwrap_to_target(handle, target, bvh)
+
+    else:
+        shrink_wrap = handle.modifiers.new(name="Shrink Wrap", type="SHRINKWRAP")
+        shrink_wrap.target = target
 
     depsgraph.update()
 
@@ -428,6 +454,103 @@ def contain(self, context, target, handle, amount, precision, debug=False):
     bpy.ops.object.mode_set(mode='OBJECT')
     handle.select_set(True)
 
+def contain_bmesh(self, context, depsgraph, bm, target, handle, amount, precision, debug=False):
+    handlescale = (handle.scale.x + handle.scale.y) / 2
+    containamount = handlescale * amount
+
+    container_vgroup = target.vertex_groups.new(name="container")
+    set_vgroup(self, container_vgroup, 'contain')
+
+    if debug:
+        print("INFO: Created new vertex group: %s" % (container_vgroup.name))
+
+    cbm = get_subdivided_bmesh(depsgraph, handle, 1 if precision > 1 else 0)
+
+    mx = handle.matrix_world
+    zaxis = (mx.to_3x3() @ Vector((0, 0, 1))).normalized()
+
+    cbm.transform(mx)
+    bmesh.ops.translate(cbm, vec=zaxis * -containamount, verts=cbm.verts)
+
+    extruded = bmesh.ops.extrude_face_region(cbm, geom=cbm.verts[:] + cbm.edges[:] + cbm.faces[:])
+    bmesh.ops.translate(cbm, vec=zaxis * containamount * 2, verts=[el for el in extruded['geom'] if isinstance(el, bmesh.types.BMVert)])
+
+    cbm.normal_update()
+
+    for v in cbm.verts:
+        v.co = v.co + v.normal * containamount
+
+    cbm.transform(target.matrix_world.inverted_safe())
+
+    for el in bm.verts[:] + bm.edges[:] + bm.faces[:]:
+        el.hide = False
+        el.select = False
+
+    groups = bm.verts.layers.deform.verify()
+
+    verts = {}
+    for v in cbm.verts:
+        verts[v] = bm.verts.new(v.co)
+        verts[v][groups][container_vgroup.index] = 1
+        verts[v].select = True
+
+    for f in cbm.faces:
+        bm.faces.new([verts[v] for v in f.verts]).select = True
+
+    bm.select_flush(True)
+    cbm.free()
+
+    bm.to_mesh(target.data)
+
+    sel = [obj for obj in context.selected_objects if obj != target]
+
+    for obj in sel:
+        obj.select_set(False)
+
+    target.select_set(True)
+    context.view_layer.objects.active = target
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.intersect(separate_mode='NONE', solver='FAST')
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    bm.clear()
+    bm.from_mesh(target.data)
+    bm.normal_update()
+
+    groups = bm.verts.layers.deform.verify()
+
+    selected = [v for v in bm.verts if v.select or container_vgroup.index in v[groups]]
+    faces = {f for v in selected for f in v.link_faces}
+
+    for f in faces:
+        for v in f.verts:
+            v[groups][container_vgroup.index] = 1
+
+    bmesh.ops.delete(bm, geom=list(faces), context='FACES')
+
+    for obj in sel:
+        obj.select_set(True)
+
+    return container_vgroup
+
+def get_subdivided_bmesh(depsgraph, obj, levels):
+    bm = bmesh.new()
+
+    if levels:
+        subd = obj.modifiers.new(name="Subsurf", type="SUBSURF")
+        subd.levels = levels
+
+        depsgraph.update()
+        bm.from_object(obj, depsgraph)
+
+        obj.modifiers.remove(subd)
+
+    else:
+        bm.from_mesh(obj.data)
+
+    return bm
+
 def create_plug_vgroups(self, plug, push_back=False):
     conform_vgroup = get_vgroup(self, plug, 'conform')
     plug_vgroup = plug.vertex_groups.new(name="plug")
@@ -464,7 +587,7 @@ def create_plug_vgroups(self, plug, push_back=False):
 
     return bm, conform_verts, border_verts
 
-def conform_verts_to_target_surface(self, obj, target, filletoredge, debug=False):
+def conform_verts_to_target_surface(self, obj, target, filletoredge, bvh=None, debug=False):
     if debug:
         print("\nConforming plug obj's verts to the target's surface")
 
@@ -478,45 +601,58 @@ def conform_verts_to_target_surface(self, obj, target, filletoredge, debug=False
         objmx = obj.matrix_world
         targetmx = target.matrix_world
 
+        if not bvh:
+            bvh = create_target_bvh(bpy.context.evaluated_depsgraph_get(), target)
+
+        obj_to_target_mx = targetmx.inverted_safe() @ objmx
+        target_to_obj_mx = objmx.inverted_safe() @ targetmx
+
+        conform = border_verts + conform_verts
+        points = transform_coords([v.co for v in conform], obj_to_target_mx).tolist()
+
+        moved = set()
         distances = []
-        for v in border_verts + conform_verts:
-            vert_origin_world_co = obj.matrix_world @ v.co  # vertex location in world space
-            vert_origin_target_local_co = targetmx.inverted_safe() @ vert_origin_world_co   # vertex location in the targets local space
 
-            hit, co, nrm, face_idx = target.closest_point_on_mesh(vert_origin_target_local_co)
+        for v, co in zip(conform, points):
+            if v in moved:  # border verts are listed once per border edge, re-query them from where they were moved to
+                co = obj_to_target_mx @ v.co
 
-            if hit:
+            location, nrm, face_idx, _ = bvh.find_nearest(co)
+
+            if location:
                 if debug:
                     print(" • idx:", v.index, "normal:", nrm, "target face index:", face_idx)
 
-                vert_destination_world_co = targetmx @ co
+                vert_origin_world_co = objmx @ v.co
+                vert_destination_world_co = targetmx @ location
 
                 dist = (vert_destination_world_co - vert_origin_world_co).length
                 distances.append(dist)
                 if debug:
                     print("  • projection distance:", dist)
 
-                vert_destination_obj_local_co = objmx.inverted_safe() @ vert_destination_world_co
-
-                v.co = vert_destination_obj_local_co
+                v.co = target_to_obj_mx @ location
+                moved.add(v)
 
         if debug:
-            print(" • moved %d verts" % (len(border_verts + conform_verts)))
+            print(" • moved %d verts" % (len(conform)))
 
         avg_dist = sum(distances) / len(distances)
 
         if debug:
             print(" • average distance:", avg_dist)
 
+        conform = set(conform)
+
         for v in bm.verts:
-            if v not in border_verts + conform_verts:
+            if v not in conform:
                 v.co = v.co + Vector((0, 0, -1)) * avg_dist
 
     bm.to_mesh(obj.data)
     obj.data.update()
     bm.clear()
 
-def get_target_face_ids(context, handle, target, precision, debug=False):
+def get_target_face_ids(context, handle, target, precision, bvh=None, debug=False):
     if debug:
         print("\nGetting target obj's faces to be replaced by the plug")
 
@@ -526,58 +662,167 @@ def get_target_face_ids(context, handle, target, precision, debug=False):
         subd.levels = precision
         apply_mod(subd.name)
 
-    bm = bmesh.new()
-    bm.from_mesh(handle.data)
-    bm.normal_update()
-    bm.verts.ensure_lookup_table()
+    if not bvh:
+        bvh = create_target_bvh(context.evaluated_depsgraph_get(), target)
 
-    mx = handle.matrix_world
-    targetmx = target.matrix_world
+    mx = target.matrix_world.inverted_safe() @ handle.matrix_world
 
-    face_ids = []
-    for v in bm.verts:
-        vert_world_co = mx @ v.co  # vertex location in world space
-        vert_target_local_co = targetmx.inverted_safe() @ vert_world_co   # vertex location in the targets local space
+    coords = np.empty(len(handle.data.vertices) * 3, dtype=np.float32)
+    handle.data.vertices.foreach_get('co', coords)
 
-        hit, co, nrm, face_idx = target.closest_point_on_mesh(vert_target_local_co)
+    face_ids = {}
+    for idx, co in enumerate(transform_coords(coords.reshape(-1, 3), mx).tolist()):
+        _, nrm, face_idx, _ = bvh.find_nearest(co)
 
-        if hit:
+        if face_idx is not None:
             if debug:
-                print(" • idx:", v.index, "normal:", nrm, "target face index:", face_idx)
+                print(" • idx:", idx, "normal:", nrm, "target face index:", face_idx)
+
+            face_ids[face_idx] = True
 
-            if face_idx not in face_ids:
-                face_ids.append(face_idx)
     if debug:
-        print(" • sampled %d verts" % (len(bm.verts)))
+        print(" • sampled %d verts" % (len(coords) // 3))
 
-    bm.clear()
+    bpy.data.objects.remove(handle, do_unlink=True)
+
+    return list(face_ids)
+
+def get_target_faces_bmesh(depsgraph, bm, handle, target, precision, bvh=None, debug=False):
+    if debug:
+        print("\nGetting target bmesh's faces to be replaced by the plug")
+
+    hbm = get_subdivided_bmesh(depsgraph, handle, precision)
+
+    if not bvh:
+        bvh = create_bmesh_bvh(bm)
+    mx = target.matrix_world.inverted_safe() @ handle.matrix_world
+
+    face_ids = {}
+    for idx, co in enumerate(transform_coords([v.co for v in hbm.verts], mx).tolist()):
+        _, nrm, face_idx, _ = bvh.find_nearest(co)
+
+        if face_idx is not None:
+            if debug:
+                print(" • idx:", idx, "normal:", nrm, "target face index:", face_idx)
+
+            face_ids[face_idx] = True
+
+    if debug:
+        print(" • sampled %d verts" % (len(hbm.verts)))
+
+    hbm.free()
 
     bpy.data.objects.remove(handle, do_unlink=True)
 
-    return face_ids
+    return [bm.faces[idx] for idx in face_ids]
 
-def merge_plug_into_target(self, target, face_ids, debug=False):
-    boundary_vgroup = target.vertex_groups.new(name="boundary")
-    set_vgroup(self, boundary_vgroup, 'boundary')
+def create_target_bvh(depsgraph, target):
+    depsgraph.update()
 
-    conform_vgroup = get_vgroup(self, target, 'conform')
-    border_vgroup = get_vgroup(self, target, 'border')
-    container_vgroup = get_vgroup(self, target, 'contain')
+    return BVHTree.FromObject(target, depsgraph)
+
+def create_bmesh_bvh(bm):
+    bm.faces.index_update()
+    bm.faces.ensure_lookup_table()
 
+    return BVHTree.FromBMesh(bm)
+
+def shrinkwrap_to_target(obj, target, bvh):
+    mesh = obj.data
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+
+    points = transform_coords(coords.reshape(-1, 3), target.matrix_world.inverted_safe() @ obj.matrix_world).tolist()
+
+    nearest = [bvh.find_nearest(co)[0] for co in points]
+    locations = np.array([loc if loc else co for loc, co in zip(nearest, points)])
+
+    coords = transform_coords(locations, obj.matrix_world.inverted_safe() @ target.matrix_world, dtype=np.float32)
+
+    mesh.vertices.foreach_set('co', coords.reshape(-1))
+    mesh.update()
+
+def join_plug_bmesh(bm, target, plug):
+    for el in bm.verts[:] + bm.faces[:]:
+        el.tag = True
+
+    vgroups = {}
+    for vg in plug.vertex_groups:
+        target_vg = target.vertex_groups.get(vg.name)
+        vgroups[vg.index] = target_vg.index if target_vg else target.vertex_groups.new(name=vg.name).index
+
+    materials = {}
+    for idx, mat in enumerate(plug.data.materials):
+        if mat not in target.data.materials[:]:
+            target.data.materials.append(mat)
+
+        materials[idx] = target.data.materials[:].index(mat)
+
+    bm.from_mesh(plug.data)
+
+    groups = bm.verts.layers.deform.verify()
+
+    verts = [v for v in bm.verts if not v.tag]
+    faces = [f for f in bm.faces if not f.tag]
+
+    bmesh.ops.transform(bm, matrix=target.matrix_world.inverted_safe() @ plug.matrix_world, verts=verts)
+
+    for v in verts:
+        weights = list(v[groups].items())
+        v[groups].clear()
+
+        for idx, weight in weights:
+            v[groups][vgroups[idx]] = weight
+
+    for f in faces:
+        f.material_index = materials.get(f.material_index, 0)
+
+    for el in bm.verts[:] + bm.faces[:]:
+        el.tag = False
+
+    bm.normal_update()
+
+    mesh = plug.data
+    bpy.data.objects.remove(plug, do_unlink=True)
+
+    if not mesh.users:
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+
+def merge_plug_into_target(self, target, face_ids, debug=False):
     bm = bmesh.new()
     bm.from_mesh(target.data)
     bm.normal_update()
     bm.verts.ensure_lookup_table()
 
-    groups = bm.verts.layers.deform.verify()
+    face_ids = set(face_ids)
     faces = [f for f in bm.faces if f.index in face_ids]
 
+    merge_plug_bmesh(self, bm, target, faces, debug=debug)
+
+    bm.to_mesh(target.data)
+    bm.clear()
+
+    bpy.ops.object.mode_set(mode='EDIT')
+
+def merge_plug_bmesh(self, bm, target, faces, debug=False):
+    boundary_vgroup = get_vgroup(self, target, 'boundary')
+
+    if not boundary_vgroup:
+        boundary_vgroup = target.vertex_groups.new(name="boundary")
+        set_vgroup(self, boundary_vgroup, 'boundary')
+
+    conform_vgroup = get_vgroup(self, target, 'conform')
+    border_vgroup = get_vgroup(self, target, 'border')
+    container_vgroup = get_vgroup(self, target, 'contain')
+
+    groups = bm.verts.layers.deform.verify()
+
     if container_vgroup:
+        faceset = set(faces)
+
         for f in bm.faces:
-            if f in faces:
-                f.select = True
-            else:
-                f.select = False
+            f.select = f in faceset
 
         for v in bm.verts:
             if container_vgroup.index in v[groups]:
@@ -587,35 +832,35 @@ def merge_plug_into_target(self, target, face_ids, debug=False):
 
         faces = [f for f in bm.faces if f.select]
 
-    boundary_edges = []
-    for f in faces:
-        for e in f.edges:
-            if not all([f in faces for f in e.link_faces]):
-                boundary_edges.append(e)
+    boundary_edges = get_boundary_edges(faces)
 
     border_verts = [v for v in bm.verts if border_vgroup.index in v[groups]]
+    border_set = set(border_verts)
 
     border_edges = []
+    seen = set()
+
     for v in border_verts:
         for e in v.link_edges:
-            if all([v in border_verts for v in e.verts]):
-                if e not in border_edges:
-                    border_edges.append(e)
-                    e.select = True
+            if e not in seen and all(v in border_set for v in e.verts):
+                seen.add(e)
+                border_edges.append(e)
+                e.select = True
 
     bmesh.ops.delete(bm, geom=faces, context='FACES')
 
     if container_vgroup:
-        bridge_edges = [e for e in list(set(boundary_edges + border_edges)) if e.is_valid]
+        bridge_edges = [e for e in set(boundary_edges + border_edges) if e.is_valid]
     else:
         bridge_edges = [e for e in boundary_edges + border_edges if e.is_valid]
 
     geo = bmesh.ops.bridge_loops(bm, edges=bridge_edges)
 
+    for f in geo["faces"]:
+        for v in f.verts:
+            v[groups][boundary_vgroup.index] = 1
+
     for f in bm.faces:
-        if f in geo["faces"]:
-            for v in f.verts:
-                v[groups][boundary_vgroup.index] = 1
         f.select = False
 
     bm.select_flush(False)
@@ -623,11 +868,6 @@ def merge_plug_into_target(self, target, face_ids, debug=False):
     if container_vgroup:
         remove_container_boundary(bm, groups, target, container_vgroup, conform_vgroup, border_vgroup, boundary_vgroup, debug=debug)
 
-    bm.to_mesh(target.data)
-    bm.clear()
-
-    bpy.ops.object.mode_set(mode='EDIT')
-
 def remove_container_boundary(bm, groups, target, container_vgroup, conform_vgroup, border_vgroup, boundary_vgroup, debug=False):
     border_verts = []
     conform_verts = []
@@ -647,13 +887,16 @@ def remove_container_boundary(bm, groups, target, container_vgroup, conform_vgro
         if boundary_vgroup.index in v[groups]:
             boundary_verts.append(v)
 
+    border_set = set(border_verts)
+    container_set = set(container_verts)
+
     dissolve_verts = []
     for v in boundary_verts:
-        if v not in border_verts and v not in container_verts:
+        if v not in border_set and v not in container_set:
             dissolve_verts.append(v)
 
     for v in container_verts:
-        edges = [(e.calc_length(), e.other_vert(v)) for e in v.link_edges if e.other_vert(v) in border_verts]
+        edges = [(e.calc_length(), e.other_vert(v)) for e in v.link_edges if e.other_vert(v) in border_set]
 
         if edges:
             shortest = sorted(edges, key=lambda e: e[0])[0]
@@ -666,12 +909,15 @@ def remove_container_boundary(bm, groups, target, container_vgroup, conform_vgro
     bmesh.ops.dissolve_verts(bm, verts=dissolve_verts)
 
     border_verts = [v for v in boundary_verts if v.is_valid]
+    border_set = set(border_verts)
+    conform_set = set(conform_verts)
 
     for v in border_verts:
         v[groups][border_vgroup.index] = 1
         v[groups][conform_vgroup.index] = 1
 
     slipping_edges = []
+    slipping_set = set()
 
     for v in border_verts:
         offset_edge = None
@@ -679,9 +925,9 @@ def remove_container_boundary(bm, groups, target, container_vgroup, conform_vgro
         border_edges = []
 
         for e in v.link_edges:
-            if e.other_vert(v) in border_verts:
+            if e.other_vert(v) in border_set:
                 border_edges.append(e)
-            elif e.other_vert(v) in conform_verts:
+            elif e.other_vert(v) in conform_set:
                 offset_edge = e
 
         if offset_edge and len(border_edges) > 2:
@@ -695,14 +941,14 @@ def remove_container_boundary(bm, groups, target, container_vgroup, conform_vgro
                 border_edges.remove(border_edge)
 
             for e in border_edges:
-                if e not in slipping_edges:
+                if e not in slipping_set:
+                    slipping_set.add(e)
                     slipping_edges.append(e)
 
     bmesh.ops.dissolve_edges(bm, edges=slipping_edges)
 
 def cleanup(self, target, deformer, dissolve_angle, nrmsrc, filletoredge, debug=False):
     conform_vgroup = get_vgroup(self, target, 'conform')
-    border_vgroup = get_vgroup(self, target, 'border')
     boundary_vgroup = get_vgroup(self, target, 'boundary')
     container_vgroup = get_vgroup(self, target, 'contain')
     plug_vgroup = get_vgroup(self, target, 'plug')
@@ -735,15 +981,73 @@ def cleanup(self, target, deformer, dissolve_angle, nrmsrc, filletoredge, debug=
         if filletoredge == "EDGE":
             normal_clear_across_sharps(target)
 
-        conform_vgroup = get_vgroup(self, target, 'conform')
-        border_vgroup = get_vgroup(self, target, 'border')
-        boundary_vgroup = get_vgroup(self, target, 'boundary')
-        container_vgroup = get_vgroup(self, target, 'contain')
-        plug_vgroup = get_vgroup(self, target, 'plug')
-
     else:
         bpy.ops.object.mode_set(mode='OBJECT')
 
+    remove_plug_helpers(self, target, deformer, nrmsrc, filletoredge)
+
+def cleanup_bmesh(self, bm, target, dissolve_angle, debug=False):
+    conform_vgroup = get_vgroup(self, target, 'conform')
+    boundary_vgroup = get_vgroup(self, target, 'boundary')
+    container_vgroup = get_vgroup(self, target, 'contain')
+    plug_vgroup = get_vgroup(self, target, 'plug')
+
+    groups = bm.verts.layers.deform.verify()
+
+    verts = set()
+
+    if not container_vgroup:
+        boundary = {v for v in bm.verts if boundary_vgroup.index in v[groups]}
+        faces = {f for v in boundary for f in v.link_faces if all(v in boundary for v in f.verts)}
+
+        dissolve_verts = [v for v in boundary if all(f in faces for f in v.link_faces)]
+        dissolve_edges = list({e for f in faces for e in f.edges if all(f in faces for f in e.link_faces)})
+
+        region = bmesh.ops.dissolve_limit(bm, angle_limit=radians(dissolve_angle), verts=dissolve_verts, edges=dissolve_edges, delimit={'NORMAL'})['region']
+        region = bmesh.ops.join_triangles(bm, faces=[f for f in region if f.is_valid], angle_face_threshold=radians(40), angle_shape_threshold=radians(40))['faces']
+
+        verts.update(v for f in region if f.is_valid for v in f.verts)
+
+    verts.update(v for v in bm.verts if conform_vgroup.index in v[groups])
+
+    if container_vgroup:
+        verts.update([e.other_vert(v) for v in verts for e in v.link_edges])
+        verts = {v for v in verts if plug_vgroup.index not in v[groups]}
+
+    normal_vgroup = target.vertex_groups.new(name="normal_transfer")
+    set_vgroup(self, normal_vgroup, 'normal')
+
+    if debug:
+        print("INFO: Created new vertex group: %s" % (normal_vgroup.name))
+
+    for el in bm.verts[:] + bm.edges[:] + bm.faces[:]:
+        el.select = False
+
+    for v in verts:
+        v[groups][normal_vgroup.index] = 1
+        v.select = True
+
+    bm.select_flush(True)
+
+def finish_cleanup_bmesh(self, target, deformer, nrmsrc, filletoredge):
+    if self.normal_transfer:
+        normal_vgroup = get_vgroup(self, target, 'normal')
+
+        data_transfer = add_normal_transfer_mod(target, nrmsrc, normal_vgroup.name, normal_vgroup)
+        apply_mod(data_transfer.name)
+
+        if filletoredge == "EDGE":
+            normal_clear_across_sharps(target)
+
+    remove_plug_helpers(self, target, deformer, nrmsrc, filletoredge)
+
+def remove_plug_helpers(self, target, deformer, nrmsrc, filletoredge):
+    conform_vgroup = get_vgroup(self, target, 'conform')
+    border_vgroup = get_vgroup(self, target, 'border')
+    boundary_vgroup = get_vgroup(self, target, 'boundary')
+    container_vgroup = get_vgroup(self, target, 'contain')
+    plug_vgroup = get_vgroup(self, target, 'plug')
+
     if self.normal_transfer or filletoredge == 'EDGE':
         target.data.use_auto_smooth = True
 
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import EnumProperty, StringProperty
 from bpy.utils import register_class, unregister_class, previews
 import os
+import json
 import addon_utils
 from . system import get_new_directory_index
 from .. registration import keys as keysdict
@@ -255,6 +256,8 @@ def remove_context_menus():
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.remove(context_menu)
 
 plugs = {}
+plug_manifests = {}
+plug_items = {}
 
 def register_plugs(library="ALL", default=None, reloading=False):
     assetspath = get_prefs().assetspath
@@ -294,10 +297,12 @@ def register_plugs(library="ALL", default=None, reloading=False):
 
     for folder in pluglibs:
         plugs[folder] = previews.new()
-        load_library_preview_icons(plugs[folder], os.path.join(assetspath, folder, "icons"))
-        items = get_library_preview_items(plugs[folder])
+        plug_manifests[folder] = get_library_manifest(os.path.join(assetspath, folder), rescan=reloading)
 
-        setattr(bpy.types.WindowManager, "pluglib_" + folder, EnumProperty(items=items, update=insert_or_remove_plug(folder), default=default))
+        names = get_library_plug_names(folder)
+        defaultidx = names.index(default) if default in names else 0
+
+        setattr(bpy.types.WindowManager, "pluglib_" + folder, EnumProperty(items=get_library_items(folder), update=insert_or_remove_plug(folder), default=defaultidx))
         if reloading:
             if folder in savedlibs:
                 print(" • reloaded plug library: %s" % (folder))
@@ -319,6 +324,8 @@ def unregister_plugs(library="ALL"):
         previews.remove(plugs[libname])
 
         del plugs[libname]
+        del plug_manifests[libname]
+        plug_items.pop(libname, None)
 
         print(" • unloaded plug library: %s" % (libname))
 
@@ -341,19 +348,72 @@ def set_new_plug_index(self, context):
 
     context.window_manager.newplugidx = get_new_directory_index(plugpath)
 
-def load_library_preview_icons(preview_collection, dirpath):
-    for f in sorted(os.listdir(dirpath)):
-        if f.endswith(".png"):
-            plugname = f[:-4]
-            filepath = os.path.join(dirpath, f)
-            preview_collection.load(plugname, filepath, 'IMAGE')
+def get_library_manifest(librarypath, rescan=False):
+    iconspath = os.path.join(librarypath, "icons")
+    manifestpath = os.path.join(librarypath, ".manifest.json")
+
+    mtime = os.path.getmtime(iconspath) if os.path.exists(iconspath) else 0
+
+    if not rescan and os.path.exists(manifestpath):
+        try:
+            with open(manifestpath) as f:
+                manifest = json.load(f)
+
+            if manifest.get('mtime') == mtime:
+                return manifest
+
+        except (OSError, ValueError):
+            pass
+
+    manifest = {'mtime': mtime, 'plugs': []}
+
+    if mtime:
+        for f in sorted(os.listdir(iconspath)):
+            if f.endswith(".png"):
+                manifest['plugs'].append({'name': f[:-4], 'icon': os.path.join("icons", f), 'mtime': os.path.getmtime(os.path.join(iconspath, f))})
+
+    try:
+        with open(manifestpath, 'w') as f:
+            json.dump(manifest, f, indent=1)
+
+    except OSError:
+        print(" ! WARNING: plug library manifest '%s' could not be written" % manifestpath)
+
+    return manifest
+
+def get_library_plug_names(library):
+    return sorted([plug['name'] for plug in plug_manifests[library]['plugs']], reverse=get_prefs().reverseplugsorting)
+
+def get_library_plug_count(library):
+    return len(plug_manifests[library]['plugs']) if library in plug_manifests else 0
+
+def load_library_preview_icons(library):
+    preview_collection = plugs[library]
+    librarypath = os.path.join(get_prefs().assetspath, library)
+
+    for plug in plug_manifests[library]['plugs']:
+        if plug['name'] not in preview_collection:
+            preview_collection.load(plug['name'], os.path.join(librarypath, plug['icon']), 'IMAGE')
+
+def get_library_preview_items(library):
+    load_library_preview_icons(library)
+
+    preview_collection = plugs[library]
 
-def get_library_preview_items(preview_collection):
     tuplelist = []
-    for name, preview in sorted(preview_collection.items(), reverse=get_prefs().reverseplugsorting):
-        tuplelist.append((name, name, "", preview.icon_id, preview.icon_id))
+    for idx, name in enumerate(get_library_plug_names(library)):
+        tuplelist.append((name, name, "", preview_collection[name].icon_id, idx))
     return tuplelist
 
+def get_library_items(library):
+    def items(self, context):
+        if library not in plug_items:
+            plug_items[library] = get_library_preview_items(library)
+
+        return plug_items[library]
+
+    return items
+
 def reload_plug_libraries(library="ALL", default=None):
     lib = bpy.context.scene.userpluglibs
 
@@ -10,32 +10,33 @@ def get_selection_islands(bm, debug=False):
     if debug:
         print("selected:", [f.index for f in selected])
 
+    remaining = set(selected)
+
     face_islands = []
 
-    while selected:
-        island = [selected[0]]
-        foundmore = [selected[0]]
+    for face in selected:
+        if face not in remaining:
+            continue
 
-        if debug:
-            print("island:", [f.index for f in island])
-            print("foundmore:", [f.index for f in foundmore])
+        remaining.remove(face)
 
-        while foundmore:
-            for e in foundmore[0].edges:
-                bf = [f for f in e.link_faces if f.select and f not in island]
-                if bf:
-                    island.append(bf[0])
-                    foundmore.append(bf[0])
+        island = [face]
+        idx = 0
 
-            if debug:
-                print("popping", foundmore[0].index)
+        while idx < len(island):
+            for e in island[idx].edges:
+                for f in e.link_faces:
+                    if f in remaining:
+                        remaining.remove(f)
+                        island.append(f)
+                        break
 
-            foundmore.pop(0)
+            idx += 1
 
-        face_islands.append(island)
+        if debug:
+            print("island:", [f.index for f in island])
 
-        for f in island:
-            selected.remove(f)
+        face_islands.append(island)
 
     if debug:
         print()
@@ -57,10 +58,15 @@ def get_selection_islands(bm, debug=False):
 
     return islands
 
+def get_boundary_edges(faces):
+    faceset = set(faces)
+
+    return [e for f in faces for e in f.edges if not all(lf in faceset for lf in e.link_faces)]
+
 def get_vert_sequence(bm, mg, verts, debug=False):
     seq = []
     if len(verts) > 3:
-        ends = [bm.verts[idx] for idx in mg if bm.verts[idx].select and sum([vselect for _, vselect, eselect in mg[bm.verts[idx].index] if eselect]) == 1]
+        ends = [bm.verts[idx] for idx in mg.get_selected_degree_verts(1)]
 
         if not ends:  # cyclic selection
             popup_message("Selection is cyclic, aborting", title="Illegal Selection")
@@ -70,12 +76,15 @@ def get_vert_sequence(bm, mg, verts, debug=False):
             seq.append(end1)
             ends.remove(end1)
 
+            seen = {end1.index}
+
             while ends:
-                nextvs = [bm.verts[idx] for idx, vselect, eselect in mg[seq[-1].index] if vselect and eselect and bm.verts[idx] not in seq]
+                nextvs = [bm.verts[idx] for idx in mg.get_selected_neighbors(seq[-1].index) if idx not in seen]
                 if nextvs:
                     nextv = nextvs[0]
 
                     seq.append(nextv)
+                    seen.add(nextv.index)
                     if nextv in ends:
                         ends.remove(nextv)
                 else:
@@ -163,7 +172,7 @@ def get_2_rails_from_chamfer(bm, mg, verts, faces, reverse=False, debug=False):
         if debug:
             print("Determining direction via vert hops")
 
-    corners = [bm.verts[idx] for idx in mg if bm.verts[idx].select and sum([vselect for _, vselect, eselect in mg[idx] if eselect]) == 2]
+    corners = [bm.verts[idx] for idx in mg.get_selected_degree_verts(2)]
 
     if len(corners) == 0:
         cyclic = True
@@ -175,8 +184,8 @@ def get_2_rails_from_chamfer(bm, mg, verts, faces, reverse=False, debug=False):
             print("Selection is cyclic")
             print("cyclic deselect of face:", f.index)
 
-        mg = build_mesh_graph(bm)
-        corners = [bm.verts[idx] for idx in mg if bm.verts[idx].select and sum([vselect for _, vselect, eselect in mg[idx] if eselect]) == 2]
+        mg = build_mesh_graph(bm, selected=True)
+        corners = [bm.verts[idx] for idx in mg.get_selected_degree_verts(2)]
 
         if not corners:
             popup_message("Selection is not a chamfer, aborting", title="Illegal Selection")
@@ -190,7 +199,8 @@ def get_2_rails_from_chamfer(bm, mg, verts, faces, reverse=False, debug=False):
     c1 = corners[0]
     corners.remove(c1)
 
-    c2_candidates = [c for c in corners if c.index in [idx for idx, vselect, eselect in mg[c1.index] if eselect]]
+    linked = {idx for idx, _, eselect in mg[c1.index] if eselect}
+    c2_candidates = [c for c in corners if c.index in linked]
 
     if not c2_candidates:
         popup_message("Selection is not a chamfer, aborting", title="Illegal Selection")
@@ -348,7 +358,7 @@ def get_sweeps_from_fillet(bm, mg, verts, faces, debug=False):
         if debug:
             print("Determining rail direction via vert hops")
 
-    corners = [bm.verts[idx] for idx in mg if bm.verts[idx].select and sum([vselect for _, vselect, eselect in mg[idx] if eselect]) == 2]
+    corners = [bm.verts[idx] for idx in mg.get_selected_degree_verts(2)]
 
     if len(corners) == 0:  # < 0 ?
         popup_message("Cyclic selections are not supported, aborting", title="Illegal Selection")
@@ -357,7 +367,8 @@ def get_sweeps_from_fillet(bm, mg, verts, faces, debug=False):
     c1 = corners[0]
     corners.remove(c1)
 
-    c2 = [c for c in corners if c.index in [idx for idx, _, eselect in mg[c1.index] if eselect]]
+    linked = {idx for idx, _, eselect in mg[c1.index] if eselect}
+    c2 = [c for c in corners if c.index in linked]
 
     if not c2:
         popup_message("Selection is not a poly strip, aborting", title="Illegal Selection")
@@ -577,7 +588,7 @@ def get_3_sides_from_tri_corner(bm, mg, verts, edges, faces, turn, debug=False):
         popup_message("Selection has less than 3 verts selected, aborting", title="Illegal Selection")
         return
 
-    corners = [bm.verts[idx] for idx in mg if bm.verts[idx].select and sum([vselect for _, vselect, eselect in mg[idx] if eselect]) == 2]
+    corners = [bm.verts[idx] for idx in mg.get_selected_degree_verts(2)]
 
     if len(corners) != 3:
         popup_message("Selection does not have 3 corners, it's not a triangular corner, aborting", title="Illegal Selection")
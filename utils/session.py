@@ -0,0 +1,157 @@
+class FuseSession:
+    def log(self, *args, **kwargs):
+        if self.debug:
+            print(*args, **kwargs)
+
+    debug = False
+
+    bm = None
+    key = None
+
+    faces = None
+    rails = None
+    sweeps = None
+    cyclic = False
+
+    handles = None
+
+    def __init__(self, initbm, debug=False):
+        self.debug = debug
+        self.log("\nInitialize Fuse Session")
+
+        self.initbm = initbm
+
+        self.bm = None
+        self.key = None
+
+        self.faces = None
+        self.rails = None
+        self.sweeps = None
+        self.cyclic = False
+
+        self.handles = {}
+
+    def is_cached(self, key):
+        return self.bm is not None and self.key == key
+
+    def get_base(self):
+        bm = self.initbm.copy()
+        bm.normal_update()
+
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        return bm
+
+    def store(self, bm, key, faces=None, rails=None, sweeps=None, cyclic=False):
+        self.free()
+
+        self.log(" Storing session for", key)
+
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+
+        self.bm = bm
+        self.key = key
+
+        self.faces = [f.index for f in faces] if faces else []
+        self.rails = [[v.index for v in rail] for rail in rails] if rails else None
+        self.cyclic = cyclic
+
+        if sweeps:
+            self.sweeps = []
+
+            for sweep in sweeps:
+                s = dict(sweep)
+
+                if "verts" in sweep:
+                    s["verts"] = tuple(v.index for v in sweep["verts"])
+
+                if "edges" in sweep:
+                    s["edges"] = [e.index for e in sweep["edges"]]
+
+                if "loop_candidates" in sweep:
+                    s["loop_candidates"] = [[e.index for e in side] for side in sweep["loop_candidates"]]
+
+                if "loops" in sweep:
+                    s["loops"] = list(sweep["loops"])
+
+                if "handles" in sweep:
+                    s["handles"] = [co.copy() for co in sweep["handles"]]
+
+                self.sweeps.append(s)
+
+        else:
+            self.sweeps = None
+
+    def restore(self):
+        self.log(" Restoring session for", self.key)
+
+        bm = self.bm.copy()
+        bm.normal_update()
+
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+
+        faces = [bm.faces[idx] for idx in self.faces]
+        rails = [[bm.verts[idx] for idx in rail] for rail in self.rails] if self.rails else None
+
+        if self.sweeps:
+            sweeps = []
+
+            for s in self.sweeps:
+                sweep = dict(s)
+
+                if "verts" in s:
+                    sweep["verts"] = tuple(bm.verts[idx] for idx in s["verts"])
+
+                if "edges" in s:
+                    sweep["edges"] = [bm.edges[idx] for idx in s["edges"]]
+
+                if "loop_candidates" in s:
+                    sweep["loop_candidates"] = [[bm.edges[idx] for idx in side] for side in s["loop_candidates"]]
+
+                if "loops" in s:
+                    sweep["loops"] = list(s["loops"])
+
+                if "handles" in s:
+                    sweep["handles"] = [co.copy() for co in s["handles"]]
+
+                sweeps.append(sweep)
+
+        else:
+            sweeps = None
+
+        return bm, faces, rails, sweeps
+
+    def get_handles(self, sweeps, key):
+        if key in self.handles:
+            self.log(" Using cached handles for", key)
+
+            for sweep, handles in zip(sweeps, self.handles[key]):
+                sweep["handles"] = [co.copy() for co in handles]
+
+            return True
+
+        return False
+
+    def store_handles(self, sweeps, key):
+        self.handles[key] = [[co.copy() for co in sweep["handles"]] for sweep in sweeps]
+
+    def free(self):
+        if self.bm:
+            self.log(" Freeing session bmesh")
+            self.bm.free()
+
+        self.bm = None
+        self.key = None
+
+        self.handles.clear()
+
+    def finish(self):
+        self.log("\nFinish Fuse Session")
+
+        self.free()
@@ -1,6 +1,13 @@
 import bpy
 import bmesh
+import numpy as np
+from mathutils import Vector
+from collections import OrderedDict
 from . raycast import cast_scene_ray_from_mouse
+from . registration import get_prefs
+
+snap_cache = OrderedDict()
+snap_sessions = []
 
 class Snap:
     def log(self, *args, **kwargs):
@@ -63,20 +70,7 @@ class Snap:
             name = self.hitobj.name
 
             if name not in self.cache.objects:
-
-                self.cache.objects[name] = self.hitobj
-
-                mesh = bpy.data.meshes.new_from_object(self.hitobj.evaluated_get(self.depsgraph), depsgraph=self.depsgraph)
-                self.cache.meshes[name] = mesh
-
-                bm = bmesh.new()
-                bm.from_mesh(mesh)
-                bm.verts.ensure_lookup_table()
-                bm.faces.ensure_lookup_table()
-                self.cache.bmeshes[name] = bm
-
-                self.cache.loop_triangles[name] = bm.calc_loop_triangles()
-                self.cache.tri_coords[name] = {}
+                self.cache.add_object(self.hitobj, self.depsgraph)
 
             if not self.hitface or (self.hitface and self.hitface.index != self.hitindex):
                 self.log("Hitface changed to", self.hitindex)
@@ -86,10 +80,7 @@ class Snap:
             if self.hitindex not in self.cache.tri_coords[name]:
                 self.log("Adding tri coords for face index", self.hitindex)
 
-                loop_triangles = self.cache.loop_triangles[name]
-
-                tri_coords = [self.hitmx @ l.vert.co for tri in loop_triangles if tri[0].face == self.hitface for l in tri]
-                self.cache.tri_coords[name][self.hitindex] = tri_coords
+                self.cache.tri_coords[name][self.hitindex] = self.cache.get_tri_coords(name, self.hitindex, self.hitmx)
 
     def _init_edit_mode(self, context):
         if context.mode == 'EDIT_MESH':
@@ -163,31 +154,136 @@ class SnapCache:
 
     debug = False
 
-    objects = {}
-    meshes = {}
-
-    bmeshes = {}
-
-    loop_triangles = {}
-    tri_coords = {}
-
     def __init__(self, debug=False):
         self.debug = debug
         self.log(" Initialize SnappingCache")
 
+        self.objects = {}
+        self.entries = {}
+
+        self.bmeshes = {}
+
+        self.coords = {}
+        self.tri_verts = {}
+        self.tri_ranges = {}
+        self.tri_coords = {}
+
+        snap_sessions.append(self)
+
+    def add_object(self, obj, depsgraph):
+        name = obj.name
+        entry = snap_cache.get(name)
+
+        if entry and entry['pointer'] == obj.as_pointer():
+            self.log(f" Re-using {name}'s cached snapping mesh")
+            snap_cache.move_to_end(name)
+
+        else:
+            invalidate_snap_cache(name)
+
+            entry = create_snap_entry(obj, depsgraph)
+            snap_cache[name] = entry
+
+            self.log(f" Cached {name}'s snapping mesh with {len(entry['tri_ranges'])} faces and {len(entry['tri_verts'])} triangles")
+
+        self.objects[name] = obj
+        self.entries[name] = entry
+
+        self.bmeshes[name] = entry['bmesh']
+
+        self.coords[name] = entry['coords']
+        self.tri_verts[name] = entry['tri_verts']
+        self.tri_ranges[name] = entry['tri_ranges']
+        self.tri_coords[name] = {}
+
+    def get_tri_coords(self, name, index, mx):
+        start, end = self.tri_ranges[name][index]
+        coords = self.coords[name][self.tri_verts[name][start:end].ravel()]
+
+        return [mx @ Vector(co) for co in coords]
+
     def clear(self):
-        for name, mesh in self.meshes.items():
-            self.log(f" Removing {name}'s temporary snapping mesh {mesh.name} with {len(mesh.polygons)} faces and {len(mesh.vertices)} verts")
-            bpy.data.meshes.remove(mesh, do_unlink=True)
+        if self in snap_sessions:
+            snap_sessions.remove(self)
 
-        for name, bm in self.bmeshes.items():
-            self.log(f" Freeing {name}'s temporary snapping bmesh")
-            bm.free()
+        for name, entry in self.entries.items():
+            if snap_cache.get(name) is not entry and not is_snap_entry_used(entry):
+                self.log(f" Freeing {name}'s outdated snapping bmesh")
+                entry['bmesh'].free()
 
         self.objects.clear()
-        self.meshes.clear()
+        self.entries.clear()
 
         self.bmeshes.clear()
 
-        self.loop_triangles.clear()
+        self.coords.clear()
+        self.tri_verts.clear()
+        self.tri_ranges.clear()
         self.tri_coords.clear()
+
+        trim_snap_cache(get_prefs().snap_cache_size * 1024 ** 2, debug=self.debug)
+
+def create_snap_entry(obj, depsgraph):
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), depsgraph=depsgraph)
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+
+    mesh.calc_loop_triangles()
+
+    tri_count = len(mesh.loop_triangles)
+
+    tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('vertices', tri_verts)
+
+    poly_indices = np.empty(tri_count, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('polygon_index', poly_indices)
+
+    # loop triangles are generated face by face already, the stable sort just makes sure of it
+    order = np.argsort(poly_indices, kind='stable')
+    tri_verts = tri_verts.reshape(-1, 3)[order]
+
+    counts = np.bincount(poly_indices, minlength=len(mesh.polygons))
+    ends = np.cumsum(counts)
+    tri_ranges = np.stack((ends - counts, ends), axis=1)
+
+    # rough estimate of the bmesh's footprint, BMesh elements and their custom data take about 100 bytes each
+    elements = len(mesh.vertices) + len(mesh.edges) + len(mesh.polygons) + len(mesh.loops)
+    size = elements * 100 + coords.nbytes + tri_verts.nbytes + tri_ranges.nbytes
+
+    bpy.data.meshes.remove(mesh, do_unlink=True)
+
+    return {'pointer': obj.as_pointer(), 'bmesh': bm, 'coords': coords.reshape(-1, 3), 'tri_verts': tri_verts, 'tri_ranges': tri_ranges, 'size': size}
+
+def is_snap_entry_used(entry):
+    return any(entry is e for cache in snap_sessions for e in cache.entries.values())
+
+def invalidate_snap_cache(name=None):
+    names = [name] if name else list(snap_cache)
+
+    for name in names:
+        entry = snap_cache.pop(name, None)
+
+        if entry and not is_snap_entry_used(entry):
+            entry['bmesh'].free()
+
+def trim_snap_cache(size, debug=False):
+    total = sum(entry['size'] for entry in snap_cache.values())
+
+    for name in list(snap_cache):
+        if total <= size:
+            break
+
+        entry = snap_cache[name]
+
+        if not is_snap_entry_used(entry):
+            if debug:
+                print(f" Evicting {name}'s cached snapping mesh, {entry['size'] / 1024 ** 2:.1f} MB")
+
+            total -= entry['size']
+            snap_cache.pop(name)['bmesh'].free()
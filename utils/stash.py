@@ -1,15 +1,23 @@
 import bpy
+import os
 import re
+import shutil
 from uuid import uuid4
+from hashlib import blake2b
+import numpy as np
 from mathutils import Matrix
 from . math import flatten_matrix
 from . object import update_local_view, unparent, parent, flatten
 from . registration import get_addon
+from . draw import clear_stash_batches
 from .. import bl_info
 
 machin3tools = None
 decalmachine = None
 
+stash_index = {}
+stash_index_signature = None
+
 def get_version_as_tuple(versionstring):
     return tuple(int(v) for v in versionstring.split('.')[:2])
 
@@ -19,6 +27,35 @@ def get_stashobj_basename(name):
     basename = mo.group(1)
     return basename
 
+def get_stash_index(obj):
+    global stash_index_signature
+
+    signature = (len(bpy.data.objects), len(bpy.data.meshes))
+
+    if signature != stash_index_signature:
+        stash_index.clear()
+        stash_index_signature = signature
+
+    key = (obj.as_pointer(), obj.name_full)
+    index = stash_index.get(key)
+
+    if index is None:
+        stashes = obj.MM.stashes
+        active = stashes[obj.MM.active_stash_idx] if 0 <= obj.MM.active_stash_idx < len(stashes) else None
+
+        index = stash_index[key] = {'count': len(stashes),
+                                    'invalid': len([stash for stash in stashes if not stash.obj]),
+                                    'active': active.uuid if active and active.obj else None}
+
+    return index
+
+def invalidate_stash_index(obj=None):
+    if obj:
+        stash_index.pop((obj.as_pointer(), obj.name_full), None)
+
+    else:
+        stash_index.clear()
+
 def create_stash(active, source, self_stash=False, flatten_stack=False, force_default_name=False, debug=False):
     stashindex = len(active.MM.stashes)
     stashname = source.MM.stashname if source.MM.stashname and not force_default_name else f"stash_{stashindex}"
@@ -56,6 +93,8 @@ def create_stash(active, source, self_stash=False, flatten_stack=False, force_de
 
     active.MM.active_stash_idx = stashindex
 
+    invalidate_stash_index(active)
+
     deltamx = active.matrix_world.inverted_safe() @ source.matrix_world
     stashobj.MM.stashdeltamx = flatten_matrix(deltamx)
 
@@ -65,14 +104,354 @@ def create_stash(active, source, self_stash=False, flatten_stack=False, force_de
 
     s.obj.data.transform(deltamx)
 
+    share_stash_mesh(stashobj, debug=debug)
+
     if debug:
         print("new stash:", stashname)
 
     return s
 
+attribute_components = {'FLOAT': 1, 'INT': 1, 'BOOLEAN': 1, 'INT8': 1, 'FLOAT2': 2, 'INT32_2D': 2, 'FLOAT_VECTOR': 3, 'FLOAT_COLOR': 4, 'BYTE_COLOR': 4, 'QUATERNION': 4, 'FLOAT4X4': 16}
+
+def get_attribute_access(data_type):
+    prop = 'vector' if data_type in ['FLOAT2', 'FLOAT_VECTOR'] else 'color' if data_type in ['FLOAT_COLOR', 'BYTE_COLOR'] else 'value'
+    dtype = bool if data_type == 'BOOLEAN' else np.int32 if data_type in ['INT', 'INT8', 'INT32_2D'] else np.float32
+
+    return prop, dtype
+
+def get_mesh_attributes(mesh):
+    uv_names = [uvs.name for uvs in mesh.uv_layers]
+
+    # dot prefixed attributes are internal, like topology, selection and hide states, positions and uvs are stored separately
+    return [attr for attr in mesh.attributes if not attr.name.startswith('.') and attr.name != 'position' and attr.name not in uv_names]
+
+def get_mesh_properties(mesh):
+    properties = [('vertices', bpy.types.MeshVertex, 'bevel_weight', np.float32),
+                  ('edges', bpy.types.MeshEdge, 'bevel_weight', np.float32),
+                  ('edges', bpy.types.MeshEdge, 'crease', np.float32),
+                  ('edges', bpy.types.MeshEdge, 'use_seam', bool)]
+
+    # bevel weights and creases are generic attributes in 4.0 and later
+    return [(collection, attr, dtype) for collection, rnatype, attr, dtype in properties if attr in rnatype.bl_rna.properties]
+
+def is_mesh_archivable(mesh):
+    if mesh.shape_keys:
+        return False
+
+    return all(attr.data_type in attribute_components for attr in get_mesh_attributes(mesh))
+
+def get_mesh_arrays(mesh, vertex_groups=False):
+    def get(collection, attr, count, dtype):
+        data = np.empty(count, dtype=dtype)
+        collection.foreach_get(attr, data)
+        return data
+
+    domain_sizes = {'POINT': len(mesh.vertices), 'EDGE': len(mesh.edges), 'FACE': len(mesh.polygons), 'CORNER': len(mesh.loops)}
+
+    arrays = {'co': get(mesh.vertices, 'co', len(mesh.vertices) * 3, np.float32),
+              'edges': get(mesh.edges, 'vertices', len(mesh.edges) * 2, np.int32),
+              'sharp': get(mesh.edges, 'use_edge_sharp', len(mesh.edges), bool),
+              'loops': get(mesh.loops, 'vertex_index', len(mesh.loops), np.int32),
+              'loop_start': get(mesh.polygons, 'loop_start', len(mesh.polygons), np.int32),
+              'loop_total': get(mesh.polygons, 'loop_total', len(mesh.polygons), np.int32),
+              'smooth': get(mesh.polygons, 'use_smooth', len(mesh.polygons), bool),
+              'material_index': get(mesh.polygons, 'material_index', len(mesh.polygons), np.int32),
+              'uv_names': np.array([uvs.name for uvs in mesh.uv_layers], dtype=str)}
+
+    for idx, uvs in enumerate(mesh.uv_layers):
+        arrays[f'uv_{idx}'] = get(uvs.data, 'uv', len(mesh.loops) * 2, np.float32)
+
+    for collection, attr, dtype in get_mesh_properties(mesh):
+        arrays[f'{collection}_{attr}'] = get(getattr(mesh, collection), attr, len(getattr(mesh, collection)), dtype)
+
+    if getattr(mesh, 'vertex_creases', None):
+        arrays['vertex_crease'] = get(mesh.vertex_creases[0].data, 'value', len(mesh.vertices), np.float32)
+
+    face_maps = getattr(mesh, 'face_maps', [])
+
+    if face_maps:
+        arrays['face_map'] = get(face_maps[0].data, 'value', len(mesh.polygons), np.int32)
+
+    attributes = get_mesh_attributes(mesh)
+
+    arrays['attribute_names'] = np.array([attr.name for attr in attributes], dtype=str)
+    arrays['attribute_domains'] = np.array([attr.domain for attr in attributes], dtype=str)
+    arrays['attribute_types'] = np.array([attr.data_type for attr in attributes], dtype=str)
+
+    for idx, attr in enumerate(attributes):
+        if attr.data_type in attribute_components:
+            prop, dtype = get_attribute_access(attr.data_type)
+            arrays[f'attribute_{idx}'] = get(attr.data, prop, domain_sizes[attr.domain] * attribute_components[attr.data_type], dtype)
+
+        else:
+            arrays[f'attribute_{idx}'] = np.array([str(d.value) for d in attr.data], dtype=str)
+
+    # deform weights can't be read in bulk, and only mean something with vertex groups on the object
+    if vertex_groups:
+        weights = [(v.index, g.group, g.weight) for v in mesh.vertices for g in v.groups]
+
+        arrays['weight_verts'] = np.array([w[0] for w in weights], dtype=np.int32)
+        arrays['weight_groups'] = np.array([w[1] for w in weights], dtype=np.int32)
+        arrays['weight_values'] = np.array([w[2] for w in weights], dtype=np.float32)
+
+    if mesh.shape_keys:
+        arrays['shape_names'] = np.array([key.name for key in mesh.shape_keys.key_blocks], dtype=str)
+
+        for idx, key in enumerate(mesh.shape_keys.key_blocks):
+            arrays[f'shape_{idx}'] = get(key.data, 'co', len(mesh.vertices) * 3, np.float32)
+
+    if mesh.has_custom_normals:
+        mesh.calc_normals_split()
+        arrays['normals'] = get(mesh.loops, 'normal', len(mesh.loops) * 3, np.float32)
+
+    return arrays
+
+def get_mesh_hash(mesh, vertex_groups=False):
+    h = blake2b(digest_size=16)
+
+    for name, data in get_mesh_arrays(mesh, vertex_groups=vertex_groups).items():
+        if name != 'loop_start':
+            h.update(name.encode())
+            h.update(data.tobytes())
+
+    h.update(str([mat.name if mat else '' for mat in mesh.materials]).encode())
+
+    return h.hexdigest()
+
+def share_stash_mesh(stashobj, debug=False):
+    stashhash = get_mesh_hash(stashobj.data, vertex_groups=bool(stashobj.vertex_groups))
+
+    for obj in bpy.data.objects:
+        if obj != stashobj and obj.MM.isstashobj and obj.MM.stashhash == stashhash and not obj.MM.stasharchive and obj.type == 'MESH' and obj.data != stashobj.data:
+            mesh = stashobj.data
+            stashobj.data = obj.data
+
+            bpy.data.meshes.remove(mesh, do_unlink=True)
+
+            if debug:
+                print(f"INFO: {stashobj.name} shares stash mesh {obj.data.name}, now used by {obj.data.users} stashes")
+
+            break
+
+    stashobj.MM.stashhash = stashhash
+
+def make_stash_mesh_unique(stashobj):
+    rehydrate_stash(stashobj)
+    clear_stash_batches(stashobj.MM.stashuuid)
+
+    if stashobj.data.users > 1:
+        stashobj.data = stashobj.data.copy()
+
+    stashobj.MM.stashhash = ''
+
+def remove_stash_obj(stashobj):
+    clear_stash_batches(stashobj.MM.stashuuid)
+
+    if stashobj.data.users > 1:
+        bpy.data.objects.remove(stashobj, do_unlink=True)
+
+    else:
+        bpy.data.meshes.remove(stashobj.data, do_unlink=True)
+
+def get_stash_mesh_stats():
+    def get_size(mesh):
+        return len(mesh.vertices) * 12 + len(mesh.edges) * 8 + len(mesh.loops) * 8 + len(mesh.polygons) * 12
+
+    stashobjs = [obj for obj in bpy.data.objects if obj.MM.isstashobj and obj.type == 'MESH']
+    meshes = {obj.data for obj in stashobjs}
+
+    unshared = sum(get_size(obj.data) for obj in stashobjs)
+    shared = sum(get_size(mesh) for mesh in meshes)
+
+    return len(stashobjs), len(meshes), unshared - shared
+
+def get_stash_archive_folder(filepath=None):
+    filepath = filepath or bpy.data.filepath
+
+    if filepath:
+        return f"{os.path.splitext(bpy.path.abspath(filepath))[0]}_stashes"
+
+def archive_stash(stashobj, filepath=None, debug=False):
+    if stashobj.type != 'MESH' or stashobj.MM.stasharchive:
+        return False
+
+    folder = get_stash_archive_folder(filepath)
+
+    if not folder:
+        return False
+
+    mesh = stashobj.data
+
+    # keep stashes resident, whose mesh data the archive can't represent
+    if not is_mesh_archivable(mesh):
+        if debug:
+            print(f"INFO: {stashobj.name} can't be archived, keeping it in the blend file")
+
+        return False
+
+    vertex_groups = bool(stashobj.vertex_groups)
+
+    if not stashobj.MM.stashhash:
+        stashobj.MM.stashhash = get_mesh_hash(mesh, vertex_groups=vertex_groups)
+
+    filename = f"{stashobj.MM.stashuuid}_{stashobj.MM.stashhash[:8]}.npz"
+
+    os.makedirs(folder, exist_ok=True)
+    np.savez_compressed(os.path.join(folder, filename), **get_mesh_arrays(mesh, vertex_groups=vertex_groups))
+
+    proxy = bpy.data.meshes.new(mesh.name)
+
+    for mat in mesh.materials:
+        proxy.materials.append(mat)
+
+    proxy.use_auto_smooth = mesh.use_auto_smooth
+    proxy.auto_smooth_angle = mesh.auto_smooth_angle
+
+    stashobj.data = proxy
+    stashobj.MM.stasharchive = filename
+
+    if not mesh.users:
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+
+    if debug:
+        print(f"INFO: archived {stashobj.name} to {filename}")
+
+    return True
+
+def get_stash_archive_path(stashobj):
+    folder = get_stash_archive_folder()
+    path = os.path.join(folder, stashobj.MM.stasharchive) if folder else None
+
+    if not path or not os.path.exists(path):
+        print(f"WARNING: stash archive {stashobj.MM.stasharchive} of {stashobj.name} could not be found")
+        return
+
+    return path
+
+def load_mesh_geometry(mesh, data):
+    mesh.vertices.add(len(data['co']) // 3)
+    mesh.vertices.foreach_set('co', data['co'])
+
+    mesh.edges.add(len(data['sharp']))
+    mesh.edges.foreach_set('vertices', data['edges'])
+    mesh.edges.foreach_set('use_edge_sharp', data['sharp'])
+
+    mesh.loops.add(len(data['loops']))
+    mesh.loops.foreach_set('vertex_index', data['loops'])
+
+    mesh.polygons.add(len(data['loop_start']))
+    mesh.polygons.foreach_set('loop_start', data['loop_start'])
+    mesh.polygons.foreach_set('loop_total', data['loop_total'])
+    mesh.polygons.foreach_set('use_smooth', data['smooth'])
+    mesh.polygons.foreach_set('material_index', data['material_index'])
+
+def get_archived_stash_mesh(stashobj):
+    path = get_stash_archive_path(stashobj)
+
+    if path:
+        mesh = bpy.data.meshes.new(f"{stashobj.data.name}_archived")
+
+        with np.load(path) as data:
+            load_mesh_geometry(mesh, data)
+
+        mesh.update()
+
+        return mesh
+
+def rehydrate_stash(stashobj, debug=False):
+    if not stashobj or not stashobj.MM.stasharchive:
+        return True
+
+    path = get_stash_archive_path(stashobj)
+
+    if not path:
+        return False
+
+    mesh = stashobj.data
+
+    if mesh.users > 1:
+        mesh = stashobj.data = mesh.copy()
+
+    with np.load(path) as data:
+        load_mesh_geometry(mesh, data)
+
+        for idx, name in enumerate(data['uv_names']):
+            uvs = mesh.uv_layers.new(name=str(name))
+            uvs.data.foreach_set('uv', data[f'uv_{idx}'])
+
+        for collection, attr, _ in get_mesh_properties(mesh):
+            if f'{collection}_{attr}' in data:
+                getattr(mesh, collection).foreach_set(attr, data[f'{collection}_{attr}'])
+
+        if 'vertex_crease' in data and hasattr(mesh, 'vertex_creases_ensure'):
+            mesh.vertex_creases_ensure().data.foreach_set('value', data['vertex_crease'])
+
+        if 'face_map' in data and hasattr(mesh, 'face_maps'):
+            mesh.face_maps.new().data.foreach_set('value', data['face_map'])
+
+        if 'attribute_names' in data:
+            for idx, (name, domain, data_type) in enumerate(zip(data['attribute_names'], data['attribute_domains'], data['attribute_types'])):
+                name, domain, data_type = str(name), str(domain), str(data_type)
+
+                attr = mesh.attributes.get(name) or mesh.attributes.new(name, data_type, domain)
+                attr.data.foreach_set(get_attribute_access(data_type)[0], data[f'attribute_{idx}'])
+
+        if 'weight_verts' in data:
+            weights = {}
+
+            for vidx, gidx, weight in zip(data['weight_verts'].tolist(), data['weight_groups'].tolist(), data['weight_values'].tolist()):
+                weights.setdefault((gidx, weight), []).append(vidx)
+
+            for (gidx, weight), vidxs in weights.items():
+                if gidx < len(stashobj.vertex_groups):
+                    stashobj.vertex_groups[gidx].add(vidxs, weight, 'REPLACE')
+
+        mesh.update()
+
+        if 'normals' in data:
+            mesh.normals_split_custom_set(data['normals'].reshape(-1, 3))
+
+    if debug:
+        print(f"INFO: rehydrated {stashobj.name} from {stashobj.MM.stasharchive}")
+
+    stashobj.MM.stasharchive = ''
+
+    return True
+
+def archive_stashes(filepath=None, debug=False):
+    oldfolder = get_stash_archive_folder()
+    newfolder = get_stash_archive_folder(filepath)
+
+    # when saving a copy or to a new path, keep stashes resident, archives next to a file other than bpy.data.filepath would not be found again
+    archive = oldfolder == newfolder
+
+    for obj in bpy.data.objects:
+        if obj.MM.isstashobj and obj.type == 'MESH':
+            if obj.MM.stasharchive:
+                if oldfolder and newfolder and oldfolder != newfolder:
+                    oldpath = os.path.join(oldfolder, obj.MM.stasharchive)
+
+                    if os.path.exists(oldpath):
+                        os.makedirs(newfolder, exist_ok=True)
+                        shutil.copy(oldpath, newfolder)
+
+            elif archive:
+                archive_stash(obj, filepath=filepath, debug=debug)
+
+def rehydrate_stashes(debug=False):
+    for obj in bpy.data.objects:
+        if obj.MM.isstashobj and obj.MM.stasharchive:
+            rehydrate_stash(obj, debug=debug)
+
 def retrieve_stash(active, stashobj, retrieve_original=False):
+    rehydrate_stash(stashobj)
+
     if retrieve_original:
         retrieved = stashobj
+
+        if retrieved.data.users > 1:
+            retrieved.data = stashobj.data.copy()
+
     else:
         retrieved = stashobj.copy()
         retrieved.data = stashobj.data.copy()
@@ -127,7 +506,6 @@ def transfer_stashes(source, target, restash=False):
             s.name = stash.obj.MM.stashname if stash.obj.MM.stashname else f"stash_{s.index}"
 
             s.obj = stash.obj.copy()
-            s.obj.data = stash.obj.data.copy()
 
             s.uuid = stash.uuid
             s.version = stash.version
@@ -143,10 +521,15 @@ def transfer_stashes(source, target, restash=False):
     if not active_stash:
         target.MM.active_stash_idx = len(target.MM.stashes) - 1
 
+    invalidate_stash_index(target)
+
     return [target.MM.stashes[idx] for idx in transferred]
 
 def clear_stashes(obj, stashes=[]):
     delete = [stash for stash in stashes]
+
+    for stash in delete:
+        clear_stash_batches(stash.uuid)
     keep = [{'name': stash.name, 'uuid': stash.uuid, 'version': stash.version, 'obj': stash.obj, 'flipped': stash.flipped} for stash in obj.MM.stashes if stash.obj and stash not in delete]
 
     obj.MM.stashes.clear()
@@ -174,6 +557,8 @@ def clear_stashes(obj, stashes=[]):
 
     obj.MM.active_stash_idx = min(obj.MM.active_stash_idx, len(obj.MM.stashes) - 1)
 
+    invalidate_stash_index(obj)
+
 def swap_stash(context, active, stashidx, debug=False):
 
     if active.MM.stashes and stashidx < len(active.MM.stashes):
@@ -190,6 +575,9 @@ def swap_stash(context, active, stashidx, debug=False):
         if mode == 'EDIT_MESH':
             active.update_from_editmode()
 
+        for stash in active.MM.stashes:
+            clear_stash_batches(stash.uuid)
+
         mods = [mod for obj in context.scene.objects for mod in obj.modifiers if (mod.type == 'MIRROR' and mod.mirror_object == active) or (mod.type == 'BOOLEAN' and mod.object == active)]
 
         new_active = None
@@ -287,6 +675,9 @@ def swap_stash(context, active, stashidx, debug=False):
 
         new_active.MM.active_stash_idx = new_idx
 
+        invalidate_stash_index(active)
+        invalidate_stash_index(new_active)
+
         if self_stash:
             if debug:
                 print("\nmaking new active take old active's place in MIRROR and BOOLEAN mods")
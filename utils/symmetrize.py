@@ -1,6 +1,8 @@
 import bpy
 import bmesh
-from . property import negate_string
+from mathutils import Vector
+from mathutils.kdtree import KDTree
+import numpy as np
 from . normal import normal_clear, normal_transfer_from_obj
 from . bmesh import loop_index_update
 from .. items import axis_mapping_dict
@@ -8,79 +10,41 @@ from .. items import axis_mapping_dict
 def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, remove=False, remove_redundant_center=True, mirror_custom_normals=False, custom_normal_method='INDEX', fix_center=False, fix_center_method='CLEAR', clear_sharps=False, debug=False):
     def sort_verts_into_sides(debug=False):
         symdir, axis = direction.split('_')
+        axis_idx = "XYZ".index(axis)
 
-        original = []
-        mirror = []
-        center = []
-
-        verts = [v for v in bm.verts if v.select] if partial else bm.verts
-
-        for v in verts:
-
-            if axis == "X":
-                if -threshold < v.co[0] < threshold:
-                    v.co[0] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[0] == 0:
-                        center.append(v.index)
-                    elif v.co[0] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[0] == 0:
-                        center.append(v.index)
-                    elif v.co[0] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            if axis == "Y":
-                if -threshold < v.co[1] < threshold:
-                    v.co[1] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[1] == 0:
-                        center.append(v.index)
-                    elif v.co[1] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[1] == 0:
-                        center.append(v.index)
-                    elif v.co[1] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            if axis == "Z":
-                if -threshold < v.co[2] < threshold:
-                    v.co[2] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[2] == 0:
-                        center.append(v.index)
-                    elif v.co[2] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[2] == 0:
-                        center.append(v.index)
-                    elif v.co[2] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            v.select = False
+        mesh = obj.data
+
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+        mesh.vertices.foreach_get('co', coords)
+        coords = coords.reshape(-1, 3)
+
+        if partial:
+            selection = np.empty(len(mesh.vertices), dtype=bool)
+            mesh.vertices.foreach_get('select', selection)
+            indices = np.flatnonzero(selection)
+        else:
+            indices = np.arange(len(mesh.vertices))
+
+        values = coords[indices, axis_idx]
+
+        centered = np.abs(values) < threshold
+        values[centered] = 0
+
+        for idx in indices[centered & (coords[indices, axis_idx] != 0)].tolist():
+            bm.verts[idx].co[axis_idx] = 0
+
+            if debug:
+                print("centered vertex %d" % (idx))
+
+        if symdir == "NEGATIVE":
+            values = -values
+
+        original = indices[values > 0].tolist()
+        mirror = indices[values < 0].tolist()
+        center = indices[values == 0].tolist()
+
+        for idx in indices.tolist():
+            bm.verts[idx].select = False
         bm.select_flush(False)
 
         if len(original) != len(mirror):
@@ -105,76 +69,30 @@ def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, rem
         return mirror_verts
 
     def get_mirror_verts_via_location(original, mirror, center, axis, debug=False):
-        precision = 10
-
         if debug:
             print("original:", original)
             print("mirror:", mirror)
 
-        if axis == "X":
-            yz = {}
-        elif axis == "Y":
-            xz = {}
-        elif axis == "Z":
-            xy = {}
+        mirror_vector = Vector((-1, 1, 1)) if axis == "X" else Vector((1, -1, 1)) if axis == "Y" else Vector((1, 1, -1))
 
-        for v in bm.verts:
-            x = "%.*f" % (precision, v.co[0])
-            y = "%.*f" % (precision, v.co[1])
-            z = "%.*f" % (precision, v.co[2])
-
-            if debug:
-                print(v.index, "•", x, y, z)
-
-            if axis == "X":
-                if (y, z) not in yz:
-                    yz[(y, z)] = {}
-
-                yz[(y, z)][x] = v.index
-            elif axis == "Y":
-                if (x, z) not in xz:
-                    xz[(x, z)] = {}
-
-                xz[(x, z)][y] = v.index
-            elif axis == "Z":
-                if (x, y) not in xy:
-                    xy[(x, y)] = {}
+        kd = KDTree(len(bm.verts))
 
-                xy[(x, y)][z] = v.index
+        for v in bm.verts:
+            kd.insert(v.co, v.index)
 
-        if debug:
-            print()
-            if axis == "X":
-                print("yz keys")
-                for vert in yz:
-                    print(vert)
-                    print(" •", yz[vert])
-            elif axis == "Y":
-                print("xz keys")
-                for vert in xz:
-                    print(vert)
-                    print(" •", xz[vert])
-            elif axis == "Z":
-                print("xy keys")
-                for vert in xy:
-                    print(vert)
-                    print(" •", xy[vert])
+        kd.balance()
 
+        tolerance = max(threshold, 1e-10)
         mirror_verts = {}
 
         for idx in original:
-            vo = bm.verts[idx]
-
-            x = "%.*f" % (precision, vo.co[0])
-            y = "%.*f" % (precision, vo.co[1])
-            z = "%.*f" % (precision, vo.co[2])
-
-            if axis == "X":
-                mirror_verts[idx] = yz[(y, z)][negate_string(x)]
-            elif axis == "Y":
-                mirror_verts[idx] = xz[(x, z)][negate_string(y)]
-            elif axis == "Z":
-                mirror_verts[idx] = xy[(x, y)][negate_string(z)]
+            co, midx, dist = kd.find(bm.verts[idx].co * mirror_vector)
+
+            if co is not None and dist <= tolerance:
+                mirror_verts[idx] = midx
+
+            elif debug:
+                print(" ! no mirror vert found for", idx)
 
         for vc in center:
             mirror_verts[vc] = vc
@@ -18,12 +18,15 @@ def open_folder(path):
         os.system('xdg-open "%s" %s &' % (path, "> /dev/null 2> /dev/null"))  # > sends stdout,  2> sends stderr
 
 def get_new_directory_index(path):
-    pngs = [f for f in sorted(os.listdir(os.path.join(path, 'icons'))) if os.path.isfile(os.path.join(path, 'icons', f)) and f.endswith('.png')]
+    pngs = [f for f in os.listdir(os.path.join(path, 'icons')) if os.path.isfile(os.path.join(path, 'icons', f)) and f.endswith('.png')]
+    blends = [f for f in os.listdir(os.path.join(path, 'blends')) if os.path.isfile(os.path.join(path, 'blends', f)) and f.endswith('.blend')] if os.path.exists(os.path.join(path, 'blends')) else []
+
+    names = sorted(pngs + blends)
 
     index = "001"
 
-    while pngs:
-        last = pngs.pop(-1)
+    while names:
+        last = names.pop(-1)
         try:
             index = str(int(last[:3]) + 1).zfill(3)
             break
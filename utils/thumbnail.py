@@ -0,0 +1,84 @@
+import bpy
+import os
+import subprocess
+from collections import deque
+from . registration import get_path, reload_plug_libraries, get_library_plug_names
+from . import registration
+
+jobs = deque()
+running = []
+
+def get_thumbnail_worker_count():
+    return max(1, os.cpu_count() or 1)
+
+# queue all jobs of a bulk render with start=False, and start them together afterwards, so the render threads are split between all of them
+def queue_thumbnail_render(library, plugname, blendpath, iconpath, indicators=('HUD', 'FILLETorEDGE', 'HOOKorARRAY', 'DEFORMER'), start=True):
+    jobs.append({'library': library, 'plugname': plugname, 'blendpath': blendpath, 'iconpath': iconpath, 'indicators': list(indicators)})
+
+    if start:
+        start_thumbnail_renders()
+
+def start_thumbnail_renders():
+    workers = get_thumbnail_worker_count()
+
+    templatepath = os.path.join(get_path(), "resources", "Templates.blend")
+    scriptpath = os.path.join(get_path(), "resources", "thumbnail.py")
+
+    threads = max(1, workers // max(1, min(workers, len(jobs) + len(running))))
+
+    while jobs and len(running) < workers:
+        job = jobs.popleft()
+
+        cmd = [bpy.app.binary_path, '--factory-startup', '-noaudio', '-b', templatepath, '-t', str(threads),
+               '--python-exit-code', '1', '--python', scriptpath, '--', job['blendpath'], job['iconpath']] + job['indicators']
+
+        job['process'] = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        running.append(job)
+
+    if running and not bpy.app.timers.is_registered(poll_thumbnail_renders):
+        bpy.app.timers.register(poll_thumbnail_renders, first_interval=0.5)
+
+def poll_thumbnail_renders():
+    for job in running[:]:
+        if job['process'].poll() is not None:
+            running.remove(job)
+
+            if job['process'].returncode == 0 and os.path.exists(job['iconpath']):
+                print(" • Saved plug icon to '%s'" % (job['iconpath']))
+                update_library_preview(job['library'], job['plugname'])
+
+            else:
+                print(" ! WARNING: rendering plug icon '%s' failed, keeping the previous or placeholder icon" % (job['iconpath']))
+
+    start_thumbnail_renders()
+
+    if running or jobs:
+        return 0.5
+
+def update_library_preview(library, plugname):
+    if library not in registration.plugs:
+        return
+
+    if plugname in get_library_plug_names(library):
+        preview_collection = registration.plugs[library]
+
+        if plugname in preview_collection:
+            preview_collection[plugname].reload()
+
+    else:
+        reload_plug_libraries(library=library, default=plugname)
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+def cancel_thumbnail_renders():
+    jobs.clear()
+
+    for job in running:
+        job['process'].terminate()
+
+    running.clear()
+
+    if bpy.app.timers.is_registered(poll_thumbnail_renders):
+        bpy.app.timers.unregister(poll_thumbnail_renders)
@@ -1,10 +1,11 @@
 import bpy
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 import bmesh
+import numpy as np
 from math import degrees
 from mathutils import Vector
 from mathutils.geometry import intersect_line_line, intersect_line_plane, intersect_point_line, interpolate_bezier, normal
-from . math import get_distance_between_verts, get_center_between_points, average_locations, resample_coords, create_rotation_matrix_from_vector, get_loc_matrix
+from . math import get_distance_between_verts, get_center_between_points, average_locations, resample_coords, create_rotation_matrix_from_vector, get_loc_matrix, interpolate_bezier_batch
 from . draw import draw_point, draw_points, draw_line, draw_vector, draw_vectors
 from . ui import popup_message
 from .. colors import black, white, red
@@ -124,6 +125,28 @@ def change_width(bm, sweeps, width, taper=False, debug=False):
     return True
 
 def create_splines(bm, sweeps, segments, debug=False):
+    points = np.array([co for sweep in sweeps for co in (sweep["verts"][0].co, *sweep["handles"], sweep["verts"][1].co)], dtype=np.float64)
+    bezier_coords = interpolate_bezier_batch(points.reshape(-1, 4, 3), segments + 2)[:, 1:-1]
+
+    bezier_verts = create_verts(bm, bezier_coords.reshape(-1, 3))
+
+    spline_sweeps = []
+    for idx, sweep in enumerate(sweeps):
+        spline_verts = [sweep["verts"][0], *bezier_verts[idx * segments:(idx + 1) * segments], sweep["verts"][1]]
+
+        if debug:
+            bm.verts.index_update()
+            print("sweep:", idx)
+            print(" • spline verts:", [v.index for v in spline_verts])
+            print()
+            for vert in spline_verts:
+                vert.select = True
+
+        spline_sweeps.append(spline_verts)
+
+    return spline_sweeps
+
+def create_splines_per_sweep(bm, sweeps, segments, debug=False):
     spline_sweeps = []
     for idx, sweep in enumerate(sweeps):
         v1 = sweep["verts"][0]
@@ -144,44 +167,33 @@ def create_splines(bm, sweeps, segments, debug=False):
 
         spline_verts.append(v2)
 
-        if debug:
-            bm.verts.index_update()
-            print("sweep:", idx)
-            print(" • spline verts:", [v.index for v in spline_verts])
-            print()
-            for vert in spline_verts:
-                vert.select = True
-
         spline_sweeps.append(spline_verts)
 
     return spline_sweeps
 
-def fuse_surface(bm, spline_sweeps, smooth, capholes=True, capdissolveangle=10, cyclic=False, select=True, debug=False):
-    faces = []
+def create_verts(bm, coords):
+    new = bm.verts.new
+    return [new(co) for co in coords.tolist()]
 
-    for sweepidx, sweep in enumerate(spline_sweeps):
-        for railidx, vert in enumerate(sweep):
-            fc1 = vert  # sweep[railidx]
-            fc2 = sweep[railidx + 1]
+def create_grid_faces(bm, spline_sweeps, smooth=False):
+    new = bm.faces.new
 
-            fc3 = spline_sweeps[sweepidx + 1][railidx + 1]
-            fc4 = spline_sweeps[sweepidx + 1][railidx]
+    faces = [new((sweep[railidx], sweep[railidx + 1], next_sweep[railidx + 1], next_sweep[railidx])) for sweep, next_sweep in zip(spline_sweeps, spline_sweeps[1:]) for railidx in range(len(sweep) - 1)]
 
-            face_corners = [fc1, fc2, fc3, fc4]
-            face = bm.faces.new(face_corners)
-            if smooth:
-                face.smooth = True
-            faces.append(face)
+    if smooth:
+        for face in faces:
+            face.smooth = True
 
-            if debug:
-                bm.faces.index_update()
-                print("face:", face.index, "verts:", [fc.index for fc in face_corners])
+    return faces
 
-            if railidx + 2 == len(sweep):
-                break
+def fuse_surface(bm, spline_sweeps, smooth, capholes=True, capdissolveangle=10, cyclic=False, select=True, debug=False):
+    faces = create_grid_faces(bm, spline_sweeps, smooth=smooth)
+
+    if debug:
+        bm.faces.index_update()
 
-        if sweepidx + 2 == len(spline_sweeps):
-            break
+        for face in faces:
+            print("face:", face.index, "verts:", [v.index for v in face.verts])
 
     bmesh.ops.recalc_face_normals(bm, faces=faces)
 
@@ -199,22 +211,8 @@ def fuse_surface(bm, spline_sweeps, smooth, capholes=True, capdissolveangle=10,
             print("border2:", border2_ids)
 
         if cyclic:
-            cyclic_faces = []
-            for idx, (sweep1_vert, sweep2_vert) in enumerate(zip(border1, border2)):
-                fc1 = sweep1_vert  # border1[idx]
-                fc2 = border1[idx + 1]
-                fc3 = border2[idx + 1]
-                fc4 = sweep2_vert  # border2[idx]
-
-                face_corners = [fc1, fc2, fc3, fc4]
-                face = bm.faces.new(face_corners)
-                if smooth:
-                    face.smooth = True
-                cyclic_faces.append(face)
-
-                if idx + 2 == len(border1):
-                    bmesh.ops.recalc_face_normals(bm, faces=cyclic_faces)
-                    break
+            cyclic_faces = create_grid_faces(bm, [border1, border2], smooth=smooth)
+            bmesh.ops.recalc_face_normals(bm, faces=cyclic_faces)
 
             if select:
                 for f in faces + cyclic_faces:
@@ -5,7 +5,9 @@ from bl_ui.space_statusbar import STATUSBAR_HT_header as statusbar
 from bpy_extras.view3d_utils import region_2d_to_location_3d
 from mathutils import Vector
 from . registration import get_prefs
-from time import time
+from . developer import output_traceback
+from . bmesh import update_edit_bmesh
+from time import time, perf_counter
 
 icons = None
 
@@ -379,3 +381,55 @@ def get_timer_progress(self, debug=False):
         print("progress:", progress)
 
     return progress
+
+class ScheduledModal:
+    frame_budget = 1 / 30
+
+    main_pending = False
+    main_time = 0
+    main_duration = 0
+
+    MAIN_TIMER = None
+
+    def init_scheduler(self, context):
+        self.main_pending = False
+        self.main_time = perf_counter()
+        self.main_duration = 0
+
+        self.MAIN_TIMER = context.window_manager.event_timer_add(self.frame_budget, window=context.window)
+
+    def run_main(self, event, active):
+        if event.type != 'TIMER':
+            self.main_pending = True
+
+        # changes are coalesced until the last evaluation is at least a frame, or its own duration, in the past
+        if self.main_pending and perf_counter() - self.main_time >= max(self.frame_budget, self.main_duration):
+            self.main_pending = False
+
+            start = perf_counter()
+            ret = self.main(active, modal=True)
+
+            self.main_time = perf_counter()
+            self.main_duration = self.main_time - start
+
+            return ret
+
+        return True
+
+    def flush_main(self, active):
+        if self.main_pending:
+            self.main_pending = False
+
+            try:
+                self.main(active, modal=True)
+
+            except Exception as e:
+                self.snapshot.restore()
+                update_edit_bmesh(active.data, destructive=self.snapshot.destructive)
+
+                output_traceback(self, e)
+
+    def finish_scheduler(self):
+        if self.MAIN_TIMER:
+            bpy.context.window_manager.event_timer_remove(self.MAIN_TIMER)
+            self.MAIN_TIMER = None